@@ -8,24 +8,82 @@ def get_currency(user_id: str) -> int:
     if row is None:
         # No trainer found for this user_id; return 0 as default currency.
         return 0
-    return row[0]
+    return row[0] or 0
 
 
-def add_currency(user_id: str, amount: int) -> int:
-    from core.database import fetch_one, execute_query
-    # Retrieve the current balance for the first trainer of this user.
-    row = fetch_one(
-        "SELECT id, currency_amount FROM trainers WHERE player_user_id = ? ORDER BY id LIMIT 1",
-        (user_id,)
-    )
-    if row is None:
-        # No trainer to update; return 0 (no currency added).
-        return 0
-    trainer_id, current_balance = row[0], row[1]
-    new_balance = current_balance + amount
-    # Update that trainer's currency_amount in the database.
+# The balance lives on the user's first trainer; both statements change it in place
+# and hand back the result, so concurrent callers can never overwrite each other.
+_CREDIT_QUERY = """
+    UPDATE trainers SET currency_amount = COALESCE(currency_amount, 0) + ?
+    WHERE id = (SELECT id FROM trainers WHERE player_user_id = ? ORDER BY id LIMIT 1)
+    RETURNING id, currency_amount
+"""
+_DEBIT_QUERY = """
+    UPDATE trainers SET currency_amount = currency_amount - ?
+    WHERE id = (SELECT id FROM trainers WHERE player_user_id = ? ORDER BY id LIMIT 1)
+      AND currency_amount >= ?
+    RETURNING id, currency_amount
+"""
+
+
+# Payouts tied to a specific trainer (e.g. a mon's level overflow) go to that trainer's row.
+_TRAINER_CREDIT_QUERY = """
+    UPDATE trainers SET currency_amount = COALESCE(currency_amount, 0) + ?
+    WHERE id = ?
+    RETURNING id, currency_amount, player_user_id
+"""
+
+
+def _record_ledger(row, user_id: str, amount: int, source: str, reference):
+    from core.database import execute_query
     execute_query(
-        "UPDATE trainers SET currency_amount = ? WHERE id = ?",
-        (new_balance, trainer_id)
+        """
+        INSERT INTO currency_ledger (trainer_id, user_id, amount, balance_after, source, reference)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (row["id"], user_id, amount, row["currency_amount"], source,
+         str(reference) if reference is not None else None)
     )
-    return new_balance
+
+
+def add_currency(user_id: str, amount: int, source: str = "adjustment", reference=None) -> int:
+    """
+    Atomically adds `amount` (negative to remove) to the user's balance and records the
+    change in currency_ledger. Returns the new balance, or 0 if the user has no trainer.
+    """
+    from core.database import execute_returning, transaction
+    with transaction():
+        row = execute_returning(_CREDIT_QUERY, (amount, user_id))
+        if row is None:
+            # No trainer to update; return 0 (no currency added).
+            return 0
+        _record_ledger(row, user_id, amount, source, reference)
+    return row["currency_amount"]
+
+
+def credit_trainer(trainer_id: int, amount: int, source: str = "adjustment", reference=None) -> int:
+    """
+    Like add_currency, but credits the given trainer rather than the user's first one.
+    Returns the trainer's new balance, or 0 if the trainer does not exist.
+    """
+    from core.database import execute_returning, transaction
+    with transaction():
+        row = execute_returning(_TRAINER_CREDIT_QUERY, (amount, trainer_id))
+        if row is None:
+            return 0
+        _record_ledger(row, row["player_user_id"], amount, source, reference)
+    return row["currency_amount"]
+
+
+def debit_currency(user_id: str, amount: int, source: str = "purchase", reference=None):
+    """
+    Removes `amount` from the user's balance only if they can afford it.
+    Returns the new balance, or None when funds are insufficient (nothing is changed).
+    """
+    from core.database import execute_returning, transaction
+    with transaction():
+        row = execute_returning(_DEBIT_QUERY, (amount, user_id, amount))
+        if row is None:
+            return None
+        _record_ledger(row, user_id, -amount, source, reference)
+    return row["currency_amount"]
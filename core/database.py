@@ -1,13 +1,27 @@
 import sqlite3
 import asyncio
+import contextlib
+import contextvars
+import functools
 import json
 import logging
 import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime
+from pathlib import Path
 
 import redis
 import discord  # Used for interactions and type hints
 
+from core.query_profiler import profiler
+from core.sheet_sync import sheet_sync
+from core.identity_cache import trainer_ids, mon_ids
+from core.records import Trainer, Mon
+
 # ----------------------------
 # Setup Logging Configuration
 # ----------------------------
@@ -17,29 +31,462 @@ logging.basicConfig(level=logging.INFO,
 # ----------------------------
 # SQLite Connection Pool
 # ----------------------------
+class PoolTimeout(Exception):
+    """Raised when no pooled connection frees up within the checkout timeout."""
+
+
+class _Checkout:
+    """
+    A single connection checkout. Usable as `with pool.connection() as conn:`
+    or, from async code, `async with pool.connection() as conn:` (the wait for
+    a free connection then happens off the event loop).
+    """
+
+    def __init__(self, pool, timeout, readonly):
+        self._pool = pool
+        self._timeout = timeout
+        self._readonly = readonly
+        self._conn = None
+        self.wait = 0.0  # seconds spent waiting for the connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        start = time.perf_counter()
+        self._conn = self._pool.get_connection(self._timeout, self._readonly)
+        self.wait = time.perf_counter() - start
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self._pool.return_connection(self._conn)
+        self._conn = None
+
+    async def __aenter__(self) -> sqlite3.Connection:
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        self._conn = await loop.run_in_executor(db_executor, self._pool.get_connection, self._timeout, self._readonly)
+        self.wait = time.perf_counter() - start
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.__exit__(exc_type, exc, tb)
+
+
+# Applied to every pooled connection. WAL lets readers proceed while the writer
+# commits; busy_timeout makes a locked database wait instead of failing outright.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-16000",      # ~16 MB page cache per connection
+    "PRAGMA mmap_size=268435456",    # 256 MB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY",
+)
+
+
 class SQLitePool:
-    def __init__(self, database, pool_size=5):
-        self._pool = queue.Queue(maxsize=pool_size)
+    """
+    Connection pool with a single writer connection and a set of read-only
+    reader connections over the same WAL-mode database. Readers never block
+    behind the writer; writes are serialized through the one writer.
+    """
+
+    def __init__(self, database, pool_size=5, timeout=10.0):
         self.database = database
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            role: {"checkouts": 0, "timeouts": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for role in ("reader", "writer")
+        }
+        # The writer is opened first: it creates the file and switches it to WAL,
+        # which read-only connections cannot do themselves.
+        self._writer_conn = self._connect(readonly=False)
+        self._writer = queue.Queue(maxsize=1)
+        self._writer.put(self._writer_conn)
+        self._readers = queue.Queue(maxsize=pool_size)
         for _ in range(pool_size):
+            self._readers.put(self._connect(readonly=True))
+
+    def _connect(self, readonly: bool) -> sqlite3.Connection:
+        if readonly:
+            uri = Path(self.database).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
             conn = sqlite3.connect(self.database, check_same_thread=False)
-            self._pool.put(conn)
+            conn.execute("PRAGMA journal_mode=WAL")
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conn.row_factory = sqlite3.Row
+        return conn
 
-    def get_connection(self):
-        return self._pool.get()
+    def get_connection(self, timeout=None, readonly: bool = False) -> sqlite3.Connection:
+        """
+        Checks out the writer connection, or a reader when `readonly` is set,
+        waiting at most `timeout` seconds (defaults to the pool's timeout).
+        Raises PoolTimeout if none frees up in time.
+        Prefer `connection()`, which always hands the connection back.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        role = "reader" if readonly else "writer"
+        source = self._readers if readonly else self._writer
+        start = time.perf_counter()
+        try:
+            conn = source.get(timeout=timeout)
+        except queue.Empty:
+            with self._stats_lock:
+                self._stats[role]["timeouts"] += 1
+            raise PoolTimeout(f"No {role} connection available after {timeout:.1f}s")
+        waited = time.perf_counter() - start
+        with self._stats_lock:
+            stats = self._stats[role]
+            stats["checkouts"] += 1
+            stats["total_wait"] += waited
+            stats["max_wait"] = max(stats["max_wait"], waited)
+        return conn
 
     def return_connection(self, conn):
-        self._pool.put(conn)
+        if conn is self._writer_conn:
+            self._writer.put(conn)
+        else:
+            self._readers.put(conn)
+
+    def connection(self, timeout=None, readonly: bool = False) -> "_Checkout":
+        return _Checkout(self, timeout, readonly)
+
+    def stats(self) -> dict:
+        """Returns checkout counters and wait times (in milliseconds) per role."""
+        available = {"reader": self._readers.qsize(), "writer": self._writer.qsize()}
+        size = {"reader": self.pool_size, "writer": 1}
+        with self._stats_lock:
+            result = {}
+            for role, stats in self._stats.items():
+                checkouts = stats["checkouts"]
+                result[role] = {
+                    "size": size[role],
+                    "available": available[role],
+                    "checkouts": checkouts,
+                    "timeouts": stats["timeouts"],
+                    "avg_wait_ms": (stats["total_wait"] / checkouts * 1000) if checkouts else 0.0,
+                    "max_wait_ms": stats["max_wait"] * 1000,
+                }
+            return result
 
     def close_all(self):
-        while not self._pool.empty():
-            conn = self._pool.get()
-            conn.close()
+        for source in (self._readers, self._writer):
+            while not source.empty():
+                source.get().close()
+
+POOL_SIZE = 5
+
+pool = SQLitePool("dawn_and_dusk.db", pool_size=POOL_SIZE)
+
+# ----------------------------
+# Database Executor
+# ----------------------------
+# Async handlers hand their statements (and async connection checkouts) to this
+# executor instead of running them on the event loop. It has one worker per pooled
+# connection (readers plus the writer), so reads never queue for a worker while a
+# reader connection is free. Writes still serialize on the single writer: every
+# worker can end up blocked waiting for it at once, until the pool timeout.
+db_executor = ThreadPoolExecutor(max_workers=POOL_SIZE + 1, thread_name_prefix="db")
+
+# Statements issued inside an async transaction run here instead. The transaction
+# already holds the writer, so it must never queue behind db_executor workers that
+# are themselves blocked waiting for the writer.
+tx_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-tx")
+
+
+async def run_db(func, *args, **kwargs):
+    """
+    Runs a blocking database callable on the DB executor and awaits its result.
+    Use this from async code for helpers that issue several statements.
+    The caller's context (including any open transaction) is carried over.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    executor = tx_executor if _current_tx.get() is not None else db_executor
+    return await loop.run_in_executor(executor, context.run, functools.partial(func, *args, **kwargs))
+
+
+# ----------------------------
+# Transactions
+# ----------------------------
+_current_tx = contextvars.ContextVar("current_tx", default=None)
+
+
+class Transaction:
+    """
+    An open unit of work on the writer connection. The generic helpers
+    (execute_query, fetch_one, fetch_all) and everything built on them enlist
+    in the ambient transaction automatically, so callers rarely need `tx` itself.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self._on_commit = []
+        self._savepoint_count = 0
+        self._rollback_only = False
+
+    def execute(self, query, params=()):
+        cur = self.conn.cursor()
+        start = time.perf_counter()
+        try:
+            cur.execute(query, params)
+        except Exception:
+            logging.exception("Error executing query in transaction: %s", query)
+            raise
+        profiler.record(query, time.perf_counter() - start, 0.0, cur.rowcount, self.conn, params)
+        _invalidate_request_reads(query)
+        return cur
+
+    def executemany(self, query, seq_of_params):
+        seq_of_params = list(seq_of_params)
+        cur = self.conn.cursor()
+        start = time.perf_counter()
+        try:
+            cur.executemany(query, seq_of_params)
+        except Exception:
+            logging.exception("Error executing batch in transaction: %s", query)
+            raise
+        profiler.record(query, time.perf_counter() - start, 0.0, cur.rowcount, self.conn,
+                        seq_of_params[0] if seq_of_params else ())
+        _invalidate_request_reads(query)
+        return cur
+
+    def fetch_one(self, query, params=()):
+        return self.execute(query, params).fetchone()
+
+    def fetch_all(self, query, params=()):
+        return self.execute(query, params).fetchall()
+
+    def on_commit(self, func, *args, **kwargs):
+        """Defers func until the transaction commits; dropped on rollback."""
+        self._on_commit.append(functools.partial(func, *args, **kwargs))
+
+    def abort(self):
+        """Marks the transaction to roll back when its block exits, without raising."""
+        self._rollback_only = True
+
+    @contextlib.contextmanager
+    def savepoint(self):
+        """
+        Nested savepoint: an exception inside the block undoes only the block's
+        statements and is re-raised; the outer transaction stays open.
+        """
+        self._savepoint_count += 1
+        name = f"sp_{self._savepoint_count}"
+        self.conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield self
+        except BaseException:
+            self.conn.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            self.conn.execute(f"RELEASE SAVEPOINT {name}")
+            raise
+        else:
+            self.conn.execute(f"RELEASE SAVEPOINT {name}")
+
+    def _begin(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    def _finish(self, failed: bool):
+        if failed or self._rollback_only:
+            self.conn.rollback()
+            return []
+        self.conn.commit()
+        return self._on_commit
+
+    @staticmethod
+    def _run_callbacks(callbacks):
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logging.exception("Error in post-commit callback")
+
+
+class _TransactionScope:
+    """
+    Returned by `transaction()`. Opening a scope while another transaction is
+    active in the same context joins that transaction instead of nesting.
+    """
+
+    def __init__(self, timeout=None):
+        self._timeout = timeout
+        self._tx = None
+        self._token = None
+        self._owner = False
+
+    def __enter__(self) -> Transaction:
+        current = _current_tx.get()
+        if current is not None:
+            return current
+        self._enter(self._begin(self._timeout))
+        return self._tx
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._owner:
+            self._finish(self._detach(), exc_type is not None)
+
+    async def __aenter__(self) -> Transaction:
+        current = _current_tx.get()
+        if current is not None:
+            return current
+        # The writer checkout and BEGIN IMMEDIATE can block, so they run off the loop;
+        # only the context switch happens here, in the caller's context.
+        loop = asyncio.get_running_loop()
+        self._enter(await loop.run_in_executor(db_executor, self._begin, self._timeout))
+        return self._tx
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._owner:
+            tx = self._detach()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(tx_executor, self._finish, tx, exc_type is not None)
+
+    @staticmethod
+    def _begin(timeout) -> Transaction:
+        conn = pool.get_connection(timeout)
+        tx = Transaction(conn)
+        try:
+            tx._begin()
+        except Exception:
+            pool.return_connection(conn)
+            raise
+        return tx
+
+    def _enter(self, tx: Transaction):
+        self._tx = tx
+        self._owner = True
+        self._token = _current_tx.set(tx)
+
+    def _detach(self) -> Transaction:
+        _current_tx.reset(self._token)
+        # Reads cached during the transaction may have seen rolled-back rows.
+        _invalidate_request_reads(None)
+        return self._tx
+
+    @staticmethod
+    def _finish(tx: Transaction, failed: bool):
+        try:
+            callbacks = tx._finish(failed)
+        finally:
+            pool.return_connection(tx.conn)
+        tx._run_callbacks(callbacks)
+
+
+def transaction(timeout=None) -> _TransactionScope:
+    """
+    Groups several writes into one commit:
+
+        with transaction() as tx:
+            update_mon_row(mon_id, {"level": 100})
+            add_currency(user_id, 250)
+
+    From async code, put the block in a plain function and hand it to run_db, so
+    nothing else is awaited while the transaction holds the writer: any other
+    write on the event loop would block until the pool times out. (`async with
+    transaction()` exists, but only DB statements may be awaited inside it.)
+    Commits on normal exit and rolls back if the block raises (or after tx.abort()).
+    """
+    return _TransactionScope(timeout)
+
+
+def _after_commit(func, *args, **kwargs):
+    """Runs func now, or once the ambient transaction commits."""
+    tx = _current_tx.get()
+    if tx is None:
+        func(*args, **kwargs)
+    else:
+        tx.on_commit(func, *args, **kwargs)
+
+
+# ----------------------------
+# Request Scope
+# ----------------------------
+# A per-interaction memo of read results. While a scope is open, identical
+# fetch_one / fetch_all calls (same SQL, same parameters) are served from
+# memory; any write drops the cached reads of the tables it touches. The
+# memo lives in a ContextVar, so it follows the handler into run_db and is
+# gone when the handler returns.
+_request_reads = contextvars.ContextVar("request_reads", default=None)
+
+_READ_PREFIXES = ("SELECT", "WITH", "EXPLAIN", "PRAGMA")
+_TABLE_PATTERN = re.compile(r"\b(?:FROM|JOIN|INTO|UPDATE)\s+[\"'`\[]?(\w+)", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _tables_in(query: str) -> frozenset:
+    return frozenset(name.lower() for name in _TABLE_PATTERN.findall(query))
+
+
+def _invalidate_request_reads(query) -> None:
+    """Drops memoized reads that a write may have changed (all of them when query is None)."""
+    reads = _request_reads.get()
+    if not reads:
+        return
+    if query is not None and query.lstrip()[:7].upper().startswith(_READ_PREFIXES):
+        return
+    tables = _tables_in(query) if query is not None else None
+    if not tables:
+        reads.clear()
+        return
+    for key, (read_tables, _) in list(reads.items()):
+        if read_tables & tables:
+            reads.pop(key, None)
+
+
+def _memoized_read(kind: str, fetch, query, params):
+    reads = _request_reads.get()
+    if reads is None:
+        return fetch(query, params)
+    try:
+        key = (kind, query, tuple(params))
+        hash(key)
+    except TypeError:
+        return fetch(query, params)
+    hit = reads.get(key)
+    if hit is not None:
+        return list(hit[1]) if kind == "all" else hit[1]
+    result = fetch(query, params)
+    reads[key] = (_tables_in(query), list(result) if kind == "all" else result)
+    return result
+
 
-db = SQLitePool("dawn_and_dusk.db")
-cursor = db.get_connection().cursor()
+class _RequestScope:
+    def __enter__(self):
+        self._token = _request_reads.set({}) if _request_reads.get() is None else None
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._token is not None:
+            _request_reads.reset(self._token)
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.__exit__(exc_type, exc, tb)
+
+
+def request_scope() -> _RequestScope:
+    """
+    Opens a read memo for the current interaction:
+
+        async with request_scope():
+            ...
+
+    Nested scopes share the outermost one.
+    """
+    return _RequestScope()
+
+
+def request_scoped(func):
+    """Decorator form of request_scope() for async interaction handlers."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        async with request_scope():
+            return await func(*args, **kwargs)
+    return wrapper
 
-pool = SQLitePool("dawn_and_dusk.db", pool_size=5)
 
 def notify_sheet_update(entity, entity_id, update_type, payload):
     try:
@@ -60,16 +507,10 @@ def notify_sheet_update(entity, entity_id, update_type, payload):
             "payload": payload
         }
 
-        # Directly process the update in a background thread.
-        import threading
-        from Google_Sheets.google_sheets_authentication import process_update_request, mark_update_processed
-
-        def process_and_mark():
-            process_update_request(update)
-            mark_update_processed(update_id)
-
-        threading.Thread(target=process_and_mark).start()
-        logging.info("Directly processed sheet update: " + json.dumps(update))
+        # Hand the update to the sheet sync workers. Inside a transaction the
+        # outbox row only exists once it commits, so queueing waits until then.
+        _after_commit(sheet_sync.enqueue, update)
+        logging.info("Queued sheet update: " + json.dumps(update))
     except Exception as e:
         logging.error(f"Error notifying sheet update: {e}")
 
@@ -302,7 +743,10 @@ def create_tables():
         )
         conn.commit()
         logging.info("Tables created successfully.")
-    except Exception as e:
+        from core.migrations import run_migrations
+        version = run_migrations(conn)
+        logging.info(f"Database schema at version {version}.")
+    except Exception:
         logging.exception("Error creating tables")
         conn.rollback()
         raise
@@ -313,47 +757,190 @@ def create_tables():
 # ----------------------------
 # Generic Database Helpers
 # ----------------------------
-def execute_query(query, params=()):
-    conn = pool.get_connection()
-    try:
+def _execute(query, params=()):
+    tx = _current_tx.get()
+    if tx is not None:
+        return tx.execute(query, params)
+    _invalidate_request_reads(query)
+    checkout = pool.connection()
+    with checkout as conn:
         cur = conn.cursor()
-        cur.execute(query, params)
-        conn.commit()
+        start = time.perf_counter()
+        try:
+            cur.execute(query, params)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            logging.exception("Error executing query: %s", query)
+            raise
+        profiler.record(query, time.perf_counter() - start, checkout.wait, cur.rowcount, conn, params)
         return cur
-    except Exception as e:
-        conn.rollback()
-        logging.exception("Error executing query: %s", query)
-        raise
-    finally:
-        pool.return_connection(conn)
 
 
-def fetch_one(query, params=()):
-    conn = pool.get_connection()
-    try:
-        conn.row_factory = sqlite3.Row  # Enable name-based access if needed
+def _execute_returning(query, params=()):
+    tx = _current_tx.get()
+    if tx is not None:
+        rows = tx.execute(query, params).fetchall()
+        return rows[0] if rows else None
+    _invalidate_request_reads(query)
+    checkout = pool.connection()
+    with checkout as conn:
         cur = conn.cursor()
-        cur.execute(query, params)
-        return cur.fetchone()
-    except Exception as e:
-        logging.exception("Error fetching one: %s", query)
-        raise
-    finally:
-        pool.return_connection(conn)
+        start = time.perf_counter()
+        try:
+            cur.execute(query, params)
+            # RETURNING rows must be drained before the statement can commit.
+            rows = cur.fetchall()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            logging.exception("Error executing query: %s", query)
+            raise
+        profiler.record(query, time.perf_counter() - start, checkout.wait, len(rows), conn, params)
+        return rows[0] if rows else None
+
+
+def _fetch_one(query, params=()):
+    tx = _current_tx.get()
+    if tx is not None:
+        return tx.fetch_one(query, params)
+    checkout = pool.connection(readonly=True)
+    with checkout as conn:
+        cur = conn.cursor()
+        start = time.perf_counter()
+        try:
+            cur.execute(query, params)
+            row = cur.fetchone()
+        except Exception:
+            logging.exception("Error fetching one: %s", query)
+            raise
+        profiler.record(query, time.perf_counter() - start, checkout.wait, int(row is not None), conn, params)
+        return row
+
+
+def _fetch_all(query, params=()):
+    tx = _current_tx.get()
+    if tx is not None:
+        return tx.fetch_all(query, params)
+    checkout = pool.connection(readonly=True)
+    with checkout as conn:
+        cur = conn.cursor()
+        start = time.perf_counter()
+        try:
+            cur.execute(query, params)
+            rows = cur.fetchall()
+        except Exception:
+            logging.exception("Error fetching all: %s", query)
+            raise
+        profiler.record(query, time.perf_counter() - start, checkout.wait, len(rows), conn, params)
+        return rows
+
+
+def execute_query(query, params=()):
+    return _execute(query, params)
+
+
+def execute_returning(query, params=()):
+    """Runs a write with a RETURNING clause and returns its first row (or None)."""
+    return _execute_returning(query, params)
+
+
+def fetch_one(query, params=()):
+    return _memoized_read("one", _fetch_one, query, params)
 
 
 def fetch_all(query, params=()):
-    conn = pool.get_connection()
-    try:
-        conn.row_factory = sqlite3.Row
+    return _memoized_read("all", _fetch_all, query, params)
+
+
+ITER_BATCH_SIZE = 500
+
+
+def _iter_batches(query, params=(), batch_size=ITER_BATCH_SIZE):
+    """
+    Yields lists of up to batch_size rows via fetchmany. The connection (a reader,
+    or the ambient transaction's) stays checked out only while the generator runs;
+    closing it early hands the connection back.
+    """
+    tx = _current_tx.get()
+    if tx is not None:
+        cur = tx.execute(query, params)
+        while True:
+            batch = cur.fetchmany(batch_size)
+            if not batch:
+                return
+            yield batch
+    checkout = pool.connection(readonly=True)
+    with checkout as conn:
         cur = conn.cursor()
-        cur.execute(query, params)
-        return cur.fetchall()
-    except Exception as e:
-        logging.exception("Error fetching all: %s", query)
-        raise
+        start = time.perf_counter()
+        try:
+            cur.execute(query, params)
+        except Exception:
+            logging.exception("Error iterating rows: %s", query)
+            raise
+        # Time spent in the consumer between batches is not the query's.
+        elapsed = time.perf_counter() - start
+        total = 0
+        try:
+            while True:
+                start = time.perf_counter()
+                batch = cur.fetchmany(batch_size)
+                elapsed += time.perf_counter() - start
+                if not batch:
+                    break
+                total += len(batch)
+                yield batch
+        finally:
+            cur.close()
+            profiler.record(query, elapsed, checkout.wait, total, conn, params)
+
+
+def iter_rows(query, params=(), batch_size=ITER_BATCH_SIZE):
+    """
+    Streams the rows of a query instead of materializing them like fetch_all,
+    so walking a whole table runs in constant memory:
+
+        for row in iter_rows("SELECT id FROM trainers"):
+            ...
+    """
+    for batch in _iter_batches(query, params, batch_size):
+        yield from batch
+
+
+# ----------------------------
+# Async Database Helpers
+# ----------------------------
+# Awaitable counterparts of the helpers above for use inside view callbacks and
+# modal submits. Results are the same cursor / sqlite3.Row objects.
+async def async_execute_query(query, params=()):
+    return await run_db(_execute, query, params)
+
+
+async def async_fetch_one(query, params=()):
+    return await run_db(fetch_one, query, params)
+
+
+async def async_fetch_all(query, params=()):
+    return await run_db(fetch_all, query, params)
+
+
+async def aiter_rows(query, params=(), batch_size=ITER_BATCH_SIZE):
+    """
+    Async counterpart of iter_rows: `async for row in aiter_rows(...)`.
+    Each batch is fetched on the DB executor. When leaving the loop early, wrap
+    it in contextlib.aclosing so the connection is returned right away.
+    """
+    batches = _iter_batches(query, params, batch_size)
+    try:
+        while True:
+            batch = await run_db(next, batches, None)
+            if batch is None:
+                return
+            for row in batch:
+                yield row
     finally:
-        pool.return_connection(conn)
+        await run_db(batches.close)
 
 
 # ----------------------------
@@ -364,24 +951,63 @@ def fetch_all(query, params=()):
 # ----------------------------
 # Trainer Update Functions
 # ----------------------------
+def _invalidate_identity(cache, ident) -> None:
+    # Drop now, and again once the write commits, in case another thread
+    # re-cached the old mapping from committed data in between.
+    cache.invalidate_id(ident)
+    _after_commit(cache.invalidate_id, ident)
+
+
+def invalidate_trainer_identity(trainer_id: int) -> None:
+    """Forgets the cached name of a trainer that is being renamed or deleted."""
+    _invalidate_identity(trainer_ids, trainer_id)
+
+
+def get_trainer_id(trainer_name: str):
+    """
+    Resolves a trainer's character_name (case-insensitive) to its id, or None.
+    A cache hit issues no query: every path that renames or deletes a trainer
+    drops its entry (update_trainer_field, core.trainer, the admin delete).
+    """
+    key = trainer_name.lower()
+    trainer_id = trainer_ids.get(key)
+    if trainer_id is not None:
+        return trainer_id
+    row = fetch_one("SELECT id FROM trainers WHERE LOWER(character_name) = ?", (key,))
+    if row is None:
+        return None
+    trainer_ids.put(key, row["id"])
+    return row["id"]
+
+
 def fetch_trainer_by_name(trainer_name: str) -> dict:
     """
     Fetch a trainer's record by character_name (case-insensitive).
-    Returns a dictionary with keys: id, user_id, character_name, level, inventory, and img_link.
+    Returns a dictionary with keys: id, user_id, character_name, level, and img_link.
+    Inventory lives in trainer_inventory; see get_inventory.
+    A cached id turns the name lookup into a primary-key read of the row; the
+    name on that row is compared for free, in case a raw write skipped invalidation.
     """
-    query = """
-        SELECT id, player_user_id, character_name, level, inventory, img_link
-        FROM trainers
-        WHERE LOWER(character_name) = ?
-    """
-    row = fetch_one(query, (trainer_name.lower(),))
+    key = trainer_name.lower()
+    columns = "SELECT id, player_user_id, character_name, level, img_link FROM trainers"
+    row = None
+    trainer_id = trainer_ids.get(key)
+    if trainer_id is not None:
+        row = fetch_one(columns + " WHERE id = ?", (trainer_id,))
+        if row is None or (row["character_name"] or "").lower() != key:
+            # Renamed or deleted behind the cache's back.
+            trainer_ids.invalidate_id(trainer_id)
+            row = None
+    if row is None:
+        row = fetch_one(columns + " WHERE LOWER(character_name) = ?", (key,))
+        if row:
+            trainer_ids.put(key, row["id"])
     if row:
         return {
             "id": row["id"],
             "user_id": row["player_user_id"],
             "character_name": row["character_name"],
             "level": row["level"],
-            "inventory": row["inventory"] if row["inventory"] is not None else "{}",
             "img_link": row["img_link"]
         }
     return None
@@ -393,6 +1019,8 @@ def update_trainer_field(trainer_id: int, field: str, new_value):
     """
     query = f"UPDATE trainers SET {field} = ? WHERE id = ?"
     execute_query(query, (new_value, trainer_id))
+    if field == "character_name":
+        _invalidate_identity(trainer_ids, trainer_id)
     notify_sheet_update("trainer", trainer_id, f"trainer_{field}_update", {field: new_value})
 
 
@@ -419,15 +1047,22 @@ def fetch_mon_by_name(trainer_name: str, name: str) -> dict:
     """
     Fetch a mon's record given the trainer's character_name and the mon's name (case-insensitive).
     """
-    trainer = fetch_trainer_by_name(trainer_name)
-    if trainer is None:
+    trainer_id = get_trainer_id(trainer_name)
+    if trainer_id is None:
         return None
-    query = """
-        SELECT mon_id, name, level, player_user_id, img_link
-        FROM mons
-        WHERE trainer_id = ? AND LOWER(name) = ?
-    """
-    row = fetch_one(query, (trainer["id"], name.lower()))
+    key = (trainer_id, name.lower())
+    columns = "SELECT mon_id, trainer_id, name, level, player_user_id, img_link FROM mons"
+    row = None
+    mon_id = mon_ids.get(key)
+    if mon_id is not None:
+        row = fetch_one(columns + " WHERE mon_id = ?", (mon_id,))
+        if row is None or row["trainer_id"] != trainer_id or (row["name"] or "").lower() != key[1]:
+            mon_ids.invalidate_id(mon_id)
+            row = None
+    if row is None:
+        row = fetch_one(columns + " WHERE trainer_id = ? AND LOWER(name) = ?", key)
+        if row:
+            mon_ids.put(key, row["mon_id"])
     if row:
         return {
             "id": row["mon_id"],
@@ -439,20 +1074,93 @@ def fetch_mon_by_name(trainer_name: str, name: str) -> dict:
     return None
 
 
+# ----------------------------
+# Mon Origins
+# ----------------------------
+SPECIES_COLUMNS = ("species1", "species2", "species3")
+
+
+def mon_origin(species):
+    """
+    The mons.origin value for the given species names, resolved in memory from
+    the species catalog: "digimon" and/or "yokai", else "pokemon". None while a
+    species table failed to load; the column is then left NULL for
+    backfill_mon_origins to fill after a successful reload.
+    """
+    from core.species_catalog import catalog
+    return catalog.mon_origin(species)
+
+
+def _with_origin(mon_id: int, fields: dict) -> dict:
+    """
+    Adds the recomputed origin to an update that changes any species column.
+    Species columns the update leaves alone are read from the row.
+    """
+    if "origin" in fields or not any(column in fields for column in SPECIES_COLUMNS):
+        return fields
+    species = {column: fields[column] for column in SPECIES_COLUMNS if column in fields}
+    missing = [column for column in SPECIES_COLUMNS if column not in species]
+    if missing:
+        row = fetch_one(f"SELECT {', '.join(missing)} FROM mons WHERE mon_id = ?", (mon_id,))
+        if row:
+            species.update(zip(missing, row))
+    return {**fields, "origin": mon_origin(species.get(column) for column in SPECIES_COLUMNS)}
+
+
+def backfill_mon_origins(batch_size: int = ITER_BATCH_SIZE, recompute: bool = False) -> int:
+    """
+    Fills mons.origin where it is NULL: rows stored before the column existed or
+    while the species catalog was incomplete. With recompute=True every row is
+    checked and corrected, as after a species data reload.
+    Does nothing while the catalog is incomplete. Returns the number of rows updated.
+    """
+    from core.species_catalog import catalog
+    if not catalog.complete:
+        logging.warning("Species catalog is incomplete; mon origins will be filled after a reload.")
+        return 0
+    query = "SELECT mon_id, species1, species2, species3, origin FROM mons"
+    if not recompute:
+        query += " WHERE origin IS NULL"
+    updated = 0
+    pending = []
+    for mon_id, species1, species2, species3, stored in iter_rows(query, batch_size=batch_size):
+        origin = mon_origin((species1, species2, species3))
+        if origin == stored:
+            continue
+        pending.append((origin, mon_id))
+        if len(pending) >= batch_size:
+            updated += _write_mon_origins(pending)
+            pending = []
+    if pending:
+        updated += _write_mon_origins(pending)
+    if updated:
+        logging.info(f"Updated the stored origin of {updated} mons.")
+    return updated
+
+
+def _write_mon_origins(pending: list) -> int:
+    with transaction() as tx:
+        tx.executemany("UPDATE mons SET origin = ? WHERE mon_id = ?", pending)
+    return len(pending)
+
+
 def update_mon_row(mon_id: int, updated_fields: dict):
     """
     Updates specified fields for a mon record and notifies the sheet updater.
+    Changing a species also refreshes the mon's stored origin.
     """
     if not updated_fields:
         return
     fields = []
     values = []
-    for key, value in updated_fields.items():
+    for key, value in _with_origin(mon_id, updated_fields).items():
         fields.append(f"{key} = ?")
         values.append(value)
     values.append(mon_id)
     query = "UPDATE mons SET " + ", ".join(fields) + " WHERE mon_id = ?"
     execute_query(query, tuple(values))
+    if "name" in updated_fields or "trainer_id" in updated_fields:
+        _invalidate_identity(mon_ids, mon_id)
     notify_sheet_update("mon", mon_id, "mon_update", updated_fields)
 
 
@@ -483,6 +1191,17 @@ def update_mon_species_and_type(mon_id: int, new_species_list: list, new_types_l
     return update_mon_row(mon_id, update_fields)
 
 
+_MON_INSERT_QUERY = """
+    INSERT INTO mons (
+        trainer_id, player_user_id, name, level,
+        species1, species2, species3,
+        type1, type2, type3, type4, type5,
+        attribute, img_link, origin
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def add_mon(trainer_id: int, player: str, name: str, level: int,
             species1: str, species2: str, species3: str,
             type1: str, type2: str, type3: str, type4: str, type5: str,
@@ -491,37 +1210,88 @@ def add_mon(trainer_id: int, player: str, name: str, level: int,
     Inserts a new mon into the database.
     Returns the newly created mon's ID.
     """
-    conn = pool.get_connection()
+    params = (trainer_id, player, name, level,
+              species1, species2, species3,
+              type1, type2, type3, type4, type5,
+              attribute, img_link, mon_origin((species1, species2, species3)))
     try:
-        query = """
-        INSERT INTO mons (
-            trainer_id, player_user_id, name, level, 
-            species1, species2, species3,
-            type1, type2, type3, type4, type5,
-            attribute, img_link
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        cur = conn.cursor()
-        cur.execute(query, (trainer_id, player, name, level,
-                            species1, species2, species3,
-                            type1, type2, type3, type4, type5,
-                            attribute, img_link))
-        conn.commit()
-        mon_id = cur.lastrowid
-        notify_sheet_update("mon", mon_id, "mon_added", {
-            "trainer_id": trainer_id,
-            "player": player,
-            "name": name,
-            "level": level
-        })
-        return mon_id
-    except Exception as e:
-        conn.rollback()
+        cur = _execute(_MON_INSERT_QUERY, params)
+    except Exception:
         logging.exception("Error adding mon")
         raise
-    finally:
-        pool.return_connection(conn)
+    mon_id = cur.lastrowid
+    notify_sheet_update("mon", mon_id, "mon_added", {
+        "trainer_id": trainer_id,
+        "player": player,
+        "name": name,
+        "level": level
+    })
+    return mon_id
+
+
+def _mon_insert_params(trainer_id: int, player: str, row: dict) -> tuple:
+    """
+    Validates one mon row for add_mons_bulk and returns its _MON_INSERT_QUERY parameters.
+    Accepts "name" or "mon_name", and either a "types" list or type1..type5.
+    """
+    name = (row.get("name") or row.get("mon_name") or "").strip()
+    if not name:
+        raise ValueError("Mon name is required.")
+    if not row.get("species1"):
+        raise ValueError("At least one species (species1) is required.")
+    types = list(row.get("types") or [row.get(f"type{i}") for i in range(1, 6)])
+    types = [t or "" for t in types[:5]] + [""] * (5 - min(len(types), 5))
+    if not types[0]:
+        raise ValueError("At least one type (type1) is required.")
+    try:
+        level = int(row.get("level") or 1)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid level {row.get('level')!r}.")
+    species = (row["species1"], row.get("species2") or "", row.get("species3") or "")
+    return (trainer_id, player, name, level,
+            *species,
+            *types,
+            row.get("attribute") or "", row.get("img_link") or "", row.get("origin") or mon_origin(species))
+
+
+def add_mons_bulk(trainer_id: int, player: str, rows: list) -> list:
+    """
+    Inserts many mons for one trainer in a single transaction.
+    Every row is validated first; if any is invalid a ValueError listing them is
+    raised and nothing is written. The trainer's mon_amount is bumped once by the
+    total and one sheet update covers the whole batch.
+    Returns the new mon IDs in row order.
+    """
+    params, errors = [], []
+    for i, row in enumerate(rows, start=1):
+        try:
+            params.append(_mon_insert_params(trainer_id, player, row))
+        except ValueError as e:
+            errors.append(f"Row {i}: {e}")
+    if errors:
+        raise ValueError("\n".join(errors))
+    if not params:
+        return []
+
+    with transaction() as tx:
+        tx.executemany(_MON_INSERT_QUERY, params)
+        # The batch holds the write lock, so its AUTOINCREMENT IDs are consecutive.
+        last_id = tx.conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        mon_ids_added = list(range(last_id - len(params) + 1, last_id + 1))
+        tx.execute("UPDATE trainers SET mon_amount = COALESCE(mon_amount, 0) + ? WHERE id = ?",
+                   (len(params), trainer_id))
+        notify_sheet_update("trainer", trainer_id, "mons_added", {
+            "increment": len(params),
+            "mons": [
+                {"mon_id": mon_id, "name": p[2], "level": p[3]}
+                for mon_id, p in zip(mon_ids_added, params)
+            ]
+        })
+    return mon_ids_added
+
+
+async def async_add_mons_bulk(trainer_id: int, player: str, rows: list) -> list:
+    return await run_db(add_mons_bulk, trainer_id, player, rows)
 
 
 def remove_mon(mon_id: int) -> bool:
@@ -530,6 +1300,7 @@ def remove_mon(mon_id: int) -> bool:
     """
     try:
         execute_query("DELETE FROM mons WHERE mon_id = ?", (mon_id,))
+        _invalidate_identity(mon_ids, mon_id)
         notify_sheet_update("mon", mon_id, "mon_removed", {"mon_id": mon_id})
         return True
     except Exception as e:
@@ -540,6 +1311,7 @@ def remove_mon(mon_id: int) -> bool:
 def update_mon_data(mon_id: int, **kwargs) -> bool:
     """
     Updates the specified fields for a mon record.
+    Changing a species also refreshes the mon's stored origin.
     Returns True if successful, False otherwise.
     """
     try:
@@ -547,12 +1319,14 @@ def update_mon_data(mon_id: int, **kwargs) -> bool:
             return True
         fields = []
         values = []
-        for key, value in kwargs.items():
+        for key, value in _with_origin(mon_id, kwargs).items():
             fields.append(f"{key} = ?")
             values.append(value)
         values.append(mon_id)
         query = "UPDATE mons SET " + ", ".join(fields) + " WHERE mon_id = ?"
         execute_query(query, tuple(values))
+        if "name" in kwargs or "trainer_id" in kwargs:
+            _invalidate_identity(mon_ids, mon_id)
         notify_sheet_update("mon", mon_id, "mon_data_update", kwargs)
         return True
     except Exception as e:
@@ -560,11 +1334,8 @@ def update_mon_data(mon_id: int, **kwargs) -> bool:
         return False
 
 
-async def update_mon_img_link(trainer_name: str, name: str, new_img_link: str) -> bool:
-    """
-    Updates the img_link column for a mon (identified by trainer's character_name and mon name).
-    Returns True if the update is successful.
-    """
+def _update_mon_img_link(trainer_name: str, name: str, new_img_link: str) -> bool:
+    """Blocking body of update_mon_img_link; runs on the DB executor."""
     try:
         mon_record = fetch_mon_by_name(trainer_name, name)
         if mon_record is None:
@@ -578,6 +1349,14 @@ async def update_mon_img_link(trainer_name: str, name: str, new_img_link: str) -
         return False
 
 
+async def update_mon_img_link(trainer_name: str, name: str, new_img_link: str) -> bool:
+    """
+    Updates the img_link column for a mon (identified by trainer's character_name and mon name).
+    Returns True if the update is successful.
+    """
+    return await run_db(_update_mon_img_link, trainer_name, name, new_img_link)
+
+
 # ----------------------------
 # Currency Helpers
 # ----------------------------
@@ -599,57 +1378,103 @@ def remove_currency_from_player(user_id: str, amount: int) -> int:
 
 
 # ----------------------------
-# Log Sheet Helpers
+# Inventory Helpers
 # ----------------------------
-async def update_character_sheet_item(trainer_name: str, item_name: str, quantity: int) -> bool:
+def adjust_inventory(trainer_id: int, item_name: str, quantity: int):
     """
-    Updates a trainer's inventory by adding (or removing) the specified item and quantity.
-    Returns True if successful, False otherwise.
+    Atomically adds (or, with a negative quantity, removes) items from a trainer's inventory.
+    A removal only succeeds if the trainer holds enough of the item; rows that reach zero are deleted.
+    Returns the new quantity, or None if there was not enough to remove.
     """
+    item_key = str(item_name)
+    if quantity >= 0:
+        row = execute_returning(
+            """
+            INSERT INTO trainer_inventory (trainer_id, item, quantity) VALUES (?, ?, ?)
+            ON CONFLICT (trainer_id, item) DO UPDATE SET quantity = quantity + excluded.quantity
+            RETURNING quantity
+            """,
+            (trainer_id, item_key, quantity)
+        )
+    else:
+        row = execute_returning(
+            """
+            UPDATE trainer_inventory SET quantity = quantity + ?
+            WHERE trainer_id = ? AND item = ? AND quantity >= ?
+            RETURNING quantity
+            """,
+            (quantity, trainer_id, item_key, -quantity)
+        )
+        if row is None:
+            return None
+        if row[0] == 0:
+            execute_query("DELETE FROM trainer_inventory WHERE trainer_id = ? AND item = ? AND quantity = 0",
+                          (trainer_id, item_key))
+    return row[0]
+
+
+def get_inventory_item(trainer_id: int, item_name: str) -> int:
+    """Returns how many of an item the trainer holds (0 if none)."""
+    row = fetch_one("SELECT quantity FROM trainer_inventory WHERE trainer_id = ? AND item = ?",
+                    (trainer_id, str(item_name)))
+    return row["quantity"] if row else 0
+
+
+def get_inventory(trainer_id: int, prefix: str = None) -> dict:
+    """
+    Returns the trainer's inventory as {item: quantity}. With a prefix, only items whose
+    name starts with it are returned; the range scan stays on the primary key.
+    """
+    if prefix:
+        rows = fetch_all(
+            "SELECT item, quantity FROM trainer_inventory WHERE trainer_id = ? AND item >= ? AND item < ? ORDER BY item",
+            (trainer_id, prefix, prefix + "\U0010ffff")
+        )
+    else:
+        rows = fetch_all("SELECT item, quantity FROM trainer_inventory WHERE trainer_id = ? ORDER BY item",
+                         (trainer_id,))
+    return {row["item"]: row["quantity"] for row in rows}
+
+
+# ----------------------------
+# Log Sheet Helpers
+# ----------------------------
+def _update_character_sheet_item(trainer_name: str, item_name: str, quantity: int) -> bool:
+    """Blocking body of update_character_sheet_item; runs on the DB executor."""
     try:
         trainer = fetch_trainer_by_name(trainer_name)
         if trainer is None:
             logging.error(f"Trainer '{trainer_name}' not found for inventory update.")
             return False
-        inv_str = trainer["inventory"] if trainer["inventory"] is not None else "{}"
-        try:
-            inventory = {} if inv_str == "" else json.loads(inv_str)
-        except Exception as e:
-            logging.error(f"Error parsing inventory JSON for '{trainer_name}': {e}")
-            inventory = {}
-        item_key = str(item_name)
-        if quantity < 0:
-            if item_key not in inventory:
-                return False
-            inventory[item_key] += quantity
-            if inventory[item_key] <= 0:
-                inventory.pop(item_key, None)
-        else:
-            inventory[item_key] = inventory.get(item_key, 0) + quantity
-        new_inv_json = json.dumps(inventory)
-        execute_query("UPDATE trainers SET inventory = ? WHERE id = ?", (new_inv_json, trainer["id"]))
-        notify_sheet_update("trainer", trainer["id"], "inventory_update", {"inventory": new_inv_json})
+        new_quantity = adjust_inventory(trainer["id"], item_name, quantity)
+        if new_quantity is None:
+            return False
+        notify_sheet_update("trainer", trainer["id"], "inventory_update", {str(item_name): new_quantity})
         return True
     except Exception as e:
         logging.error(f"Inventory update failed for trainer '{trainer_name}': {e}")
         return False
 
 
+async def update_character_sheet_item(trainer_name: str, item_name: str, quantity: int) -> bool:
+    """
+    Updates a trainer's inventory by adding (or removing) the specified item and quantity.
+    Returns True if successful, False otherwise.
+    """
+    return await run_db(_update_character_sheet_item, trainer_name, item_name, quantity)
+
+
 # Alias for modules that reference "add_item"
 add_item = update_character_sheet_item
 
 
-async def update_character_level(trainer_name: str, target_name: str, level_amount: int) -> bool:
-    """
-    Adjusts levels for a trainer or one of their mons.
-    If target_name matches the trainer (i.e. character_name), the trainer's level is increased.
-    Otherwise, it updates the mon's level.
-    """
+def _update_character_level(trainer_name: str, target_name: str, level_amount: int) -> bool:
+    """Blocking body of update_character_level; runs on the DB executor."""
     try:
-        trainer = fetch_trainer_by_name(trainer_name)
-        if trainer is None:
-            return False
         if target_name.lower() == trainer_name.lower():
+            trainer = fetch_trainer_by_name(trainer_name)
+            if trainer is None:
+                return False
             new_level = max(trainer["level"] + level_amount, 0)
             update_trainer_level(trainer["id"], new_level)
             return True
@@ -665,12 +1490,17 @@ async def update_character_level(trainer_name: str, target_name: str, level_amou
         return False
 
 
-async def append_mon(trainer_name: str, mon_data: list) -> str:
+async def update_character_level(trainer_name: str, target_name: str, level_amount: int) -> bool:
     """
-    Handles post-insertion steps for a new mon.
-    Increments the trainer's mon count.
-    Returns an empty string on success or an error message on failure.
+    Adjusts levels for a trainer or one of their mons.
+    If target_name matches the trainer (i.e. character_name), the trainer's level is increased.
+    Otherwise, it updates the mon's level.
     """
+    return await run_db(_update_character_level, trainer_name, target_name, level_amount)
+
+
+def _append_mon(trainer_name: str, mon_data: list) -> str:
+    """Blocking body of append_mon; runs on the DB executor."""
     try:
         trainer = fetch_trainer_by_name(trainer_name)
         if trainer is None:
@@ -683,6 +1513,15 @@ async def append_mon(trainer_name: str, mon_data: list) -> str:
         return f"Error updating trainer's mon count: {e}"
 
 
+async def append_mon(trainer_name: str, mon_data: list) -> str:
+    """
+    Handles post-insertion steps for a new mon.
+    Increments the trainer's mon count.
+    Returns an empty string on success or an error message on failure.
+    """
+    return await run_db(_append_mon, trainer_name, mon_data)
+
+
 # ----------------------------
 # Habits
 # ----------------------------
@@ -816,42 +1655,115 @@ def increment_garden_harvest(user_id: str, count: int = 1) -> None:
 # ----------------------------
 # Additional Mon/Trainer Fetch Functions
 # ----------------------------
-def get_mons_for_trainer(trainer_id: int) -> list:
+def fetch_trainers(where: str = "", params=(), columns: tuple = None) -> list:
+    """
+    Returns Trainer records for the rows matching `where` (an SQL condition, without
+    the WHERE keyword), ordered by id. `columns` limits which Trainer fields are read.
+    """
+    select_list, build = Trainer.projection(columns)
+    query = f"SELECT {select_list} FROM trainers" + (f" WHERE {where}" if where else "") + " ORDER BY id"
+    return [build(row) for row in fetch_all(query, params)]
+
+
+def fetch_mons(where: str = "", params=(), columns: tuple = None) -> list:
+    """
+    Returns Mon records for the rows matching `where`, ordered by mon_id.
+    `columns` limits which Mon fields are read.
+    """
+    select_list, build = Mon.projection(columns)
+    query = f"SELECT {select_list} FROM mons" + (f" WHERE {where}" if where else "") + " ORDER BY mon_id"
+    return [build(row) for row in fetch_all(query, params)]
+
+
+def get_mons_for_trainer(trainer_id: int, columns: tuple = ("id", "name", "level", "img_link")) -> list:
     """
     Retrieves all mons for a given trainer from the database.
-    Returns a list of dictionaries containing basic mon info.
+    Returns Mon records with basic mon info.
     """
-    query = "SELECT mon_id, name, level, img_link FROM mons WHERE trainer_id = ?"
-    rows = fetch_all(query, (trainer_id,))
-    mons = []
-    for row in rows:
-        mons.append({
-            "id": row["mon_id"],
-            "name": row["name"],
-            "level": row["level"],
-            "img_link": row["img_link"]
-        })
-    return mons
+    return fetch_mons("trainer_id = ?", (trainer_id,), columns)
 
 
-def fetch_all_trainers() -> list:
+def iter_trainers(where: str = "", params=(), columns: tuple = None, batch_size=ITER_BATCH_SIZE):
+    """Streaming fetch_trainers: yields Trainer records ordered by id."""
+    select_list, build = Trainer.projection(columns)
+    query = f"SELECT {select_list} FROM trainers" + (f" WHERE {where}" if where else "") + " ORDER BY id"
+    for row in iter_rows(query, params, batch_size):
+        yield build(row)
+
+
+def fetch_all_trainers(columns: tuple = ("id", "user_id", "character_name", "level", "img_link")):
     """
-    Retrieves all trainer records from the database.
-    Returns a list of dictionaries with basic trainer info.
+    Walks every trainer in the database.
+    Yields Trainer records with basic trainer info, streamed rather than loaded at once.
     """
-    query = "SELECT id, player_user_id, character_name, level, inventory, img_link FROM trainers"
-    rows = fetch_all(query)
-    trainers = []
-    for row in rows:
-        trainers.append({
-            "id": row["id"],
-            "user_id": row["player_user_id"],
-            "character_name": row["character_name"],
-            "level": row["level"],
-            "inventory": row["inventory"],
-            "img_link": row["img_link"]
-        })
-    return trainers
+    return iter_trainers(columns=columns)
+
+
+# ----------------------------
+# Keyset Pagination
+# ----------------------------
+@dataclass(frozen=True)
+class Page:
+    """One page of a keyset listing plus the cursors to step away from it."""
+    rows: list
+    first_key: object
+    last_key: object
+    has_prev: bool
+    has_next: bool
+
+
+def fetch_page(source: str, select_list: str, key: str, where: str = "", params=(),
+               after=None, before=None, limit: int = 10, build=None) -> Page:
+    """
+    Seek pagination over `source` (a table or join) ordered by `key`, which should
+    be an indexed unique column (normally the primary key) and must be the first
+    column of `select_list`.
+
+    Pass `after=page.last_key` for the next page or `before=page.first_key` for the
+    previous one; with neither, the first page is returned. Each page is a range scan
+    starting at the cursor, so deep pages cost the same as the first.
+    `build`, if given, maps each row (e.g. a Record projection builder).
+    """
+    conditions = [f"({where})"] if where else []
+    seek_params = []
+    backwards = before is not None
+    if backwards:
+        conditions.append(f"{key} < ?")
+        seek_params.append(before)
+    elif after is not None:
+        conditions.append(f"{key} > ?")
+        seek_params.append(after)
+    query = f"SELECT {select_list} FROM {source}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += f" ORDER BY {key} {'DESC' if backwards else 'ASC'} LIMIT ?"
+    rows = fetch_all(query, tuple(params) + tuple(seek_params) + (limit + 1,))
+
+    more = len(rows) > limit
+    rows = list(rows[:limit])
+    if backwards:
+        if not rows:
+            # Everything before the cursor is gone; start over from the top.
+            return fetch_page(source, select_list, key, where, params, limit=limit, build=build)
+        rows.reverse()
+        has_prev, has_next = more, True
+    else:
+        has_prev, has_next = after is not None, more
+    first_key = rows[0][0] if rows else None
+    last_key = rows[-1][0] if rows else None
+    if build is not None:
+        rows = [build(row) for row in rows]
+    return Page(rows, first_key, last_key, has_prev, has_next)
+
+
+def fetch_trainer_page(where: str = "", params=(), columns: tuple = None,
+                       after=None, before=None, limit: int = 10) -> Page:
+    """Keyset page of Trainer records ordered by id."""
+    if columns:
+        # The cursor is read from the first column.
+        columns = ("id",) + tuple(c for c in columns if c != "id")
+    select_list, build = Trainer.projection(columns)
+    return fetch_page("trainers", select_list, "id", where, params, after, before, limit, build)
 
 
 # ----------------------------
@@ -899,39 +1811,20 @@ def increment_garden_harvest(user_id: str, count: int = 1) -> None:
 create_adventure_session_table()
 
 
-def save_session(session) -> None:
+def save_session(channel_id: int, state: dict) -> None:
     """
-    Saves the current adventure session to the database.
-    Expects session to have attributes: channel.id, area_data, hard_mode, progress, encounters_triggered, max_encounters, and players.
+    Saves an adventure session's state (see AdventureSession.snapshot) to the database.
     """
-    session_data = {
-        "area_data": session.area_data,
-        "hard_mode": session.hard_mode,
-        "progress": session.progress,
-        "encounters_triggered": session.encounters_triggered,
-        "max_encounters": session.max_encounters,
-        "players": list(session.players)
-    }
-    data = json.dumps(session_data)
     query = "INSERT OR REPLACE INTO adventure_sessions (channel_id, data) VALUES (?, ?)"
-    execute_query(query, (session.channel.id, data))
+    execute_query(query, (channel_id, json.dumps(state)))
 
 
-def update_session(session) -> None:
+def update_session(channel_id: int, state: dict) -> None:
     """
     Updates an existing adventure session in the database.
     """
-    session_data = {
-        "area_data": session.area_data,
-        "hard_mode": session.hard_mode,
-        "progress": session.progress,
-        "encounters_triggered": session.encounters_triggered,
-        "max_encounters": session.max_encounters,
-        "players": list(session.players)
-    }
-    data = json.dumps(session_data)
     query = "UPDATE adventure_sessions SET data = ? WHERE channel_id = ?"
-    execute_query(query, (data, session.channel.id))
+    execute_query(query, (json.dumps(state), channel_id))
 
 
 def delete_session(channel_id: int) -> None:
@@ -942,23 +1835,55 @@ def delete_session(channel_id: int) -> None:
     execute_query(query, (channel_id,))
 
 
-def get_all_mons_for_user(user_id: str) -> list:
+# ----------------------------
+# Game Corner Sessions
+# ----------------------------
+def start_gamecorner_session(user_id: str, channel_id: int, duration_minutes: int) -> dict:
+    """
+    Records a running pomodoro session. Times are wall-clock epoch seconds so the
+    deadline still means something after a restart. Returns the stored session.
+    """
+    started_at = time.time()
+    deadline = started_at + duration_minutes * 60
+    cur = execute_query(
+        """
+        INSERT INTO gamecorner_sessions (user_id, channel_id, duration_minutes, started_at, deadline)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        (user_id, channel_id, duration_minutes, started_at, deadline)
+    )
+    return {"id": cur.lastrowid, "user_id": user_id, "channel_id": channel_id,
+            "duration_minutes": duration_minutes, "started_at": started_at, "deadline": deadline}
+
+
+def complete_gamecorner_session(session_id: int) -> bool:
+    """
+    Marks a running session completed. Returns False if it was already completed,
+    so a session that fires twice (e.g. across a restart) only prompts once.
+    """
+    row = execute_returning(
+        "UPDATE gamecorner_sessions SET status = 'completed' WHERE id = ? AND status = 'running' RETURNING id",
+        (session_id,)
+    )
+    return row is not None
+
+
+def fetch_running_gamecorner_sessions() -> list:
+    rows = fetch_all(
+        """
+        SELECT id, user_id, channel_id, duration_minutes, started_at, deadline
+        FROM gamecorner_sessions WHERE status = 'running' ORDER BY deadline
+        """
+    )
+    return [dict(row) for row in rows]
+
+
+def get_all_mons_for_user(user_id: str, columns: tuple = None) -> list:
     """
     Retrieves all mon records for a given user from the database.
-    Returns a list of dictionaries with basic mon information.
+    Returns Mon records (every field unless `columns` narrows them).
     """
-    query = "SELECT mon_id, name, level, img_link, trainer_id FROM mons WHERE player_user_id = ?"
-    rows = fetch_all(query, (user_id,))
-    mons = []
-    for row in rows:
-        mons.append({
-            "id": row["mon_id"],
-            "name": row["name"],
-            "level": row["level"],
-            "img_link": row["img_link"],
-            "trainer_id": row["trainer_id"]
-        })
-    return mons
+    return fetch_mons("player_user_id = ?", (user_id,), columns)
 
 
 def get_trainers_from_database(user_id: str) -> list:
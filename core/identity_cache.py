@@ -0,0 +1,82 @@
+"""
+Identity caches.
+Bounded LRU maps from the names players type to the row IDs they resolve to:
+trainer character_name -> trainer id, and (trainer id, mon name) -> mon id.
+Names are stored lower-cased, matching the case-insensitive lookups in core.database.
+Only IDs are cached; callers still read the row itself, so cached data never goes stale.
+"""
+import threading
+from collections import OrderedDict
+
+
+class IdentityCache:
+    """
+    Thread-safe LRU cache of key -> id with a reverse index, so every key that
+    resolves to an id can be dropped at once when that row is renamed or deleted.
+    """
+
+    def __init__(self, name: str, maxsize: int = 2048):
+        self.name = name
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+        self._keys_by_id = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            ident = self._data.get(key)
+            if ident is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return ident
+
+    def put(self, key, ident) -> None:
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._forget(key, old)
+            self._data[key] = ident
+            self._keys_by_id.setdefault(ident, set()).add(key)
+            while len(self._data) > self.maxsize:
+                evicted_key, evicted_id = self._data.popitem(last=False)
+                self._forget(evicted_key, evicted_id)
+                self.evictions += 1
+
+    def invalidate_id(self, ident) -> None:
+        """Drops every key that resolves to `ident`."""
+        with self._lock:
+            for key in self._keys_by_id.pop(ident, ()):
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._keys_by_id.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _forget(self, key, ident) -> None:
+        keys = self._keys_by_id.get(ident)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_id[ident]
+
+
+trainer_ids = IdentityCache("trainer")
+mon_ids = IdentityCache("mon")
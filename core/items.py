@@ -4,8 +4,9 @@ import random
 
 import discord
 
-from core.database import cursor, fetch_one, execute_query, add_item, fetch_trainer_by_name
-from core.currency import get_currency, add_currency
+from core.database import fetch_one, fetch_all, execute_query, fetch_trainer_by_name
+from core.database import get_inventory, get_inventory_item, adjust_inventory, notify_sheet_update, run_db, transaction
+from core.currency import add_currency, debit_currency
 
 
 def rarity_value(rarity_str: str) -> int:
@@ -13,47 +14,62 @@ def rarity_value(rarity_str: str) -> int:
     mapping = {"common": 1, "uncommon": 3, "rare": 5}
     return mapping.get(rarity_str.lower(), 1)
 
+# Chance of each rarity tier per item roll, renormalized over the tiers that have items.
+ITEM_RARITY_WEIGHTS = {"common": 0.50, "uncommon": 0.35, "rare": 0.15}
+GAME_CORNER_ITEMS = ("Snack Combo", "Energy Drink", "Lucky Charm", "Mystic Cookie", "Power Bar")
+
+
+def pick_items(rows, amount: int = 1, filter_keyword: str = None, rng=None) -> list:
+    """
+    Picks item names from (name, effect, rarity, category) rows using weighted rarity:
+    a tier is drawn by ITEM_RARITY_WEIGHTS, then an item uniformly within it.
+    filter_keyword is a comma-separated list matched against the category.
+    rng is any object with the random module's interface (defaults to the module).
+    """
+    rng = rng or random
+    if filter_keyword:
+        filters = [f.strip().lower() for f in filter_keyword.split(",")]
+        rows = [row for row in rows if any(f in (row[3] or "").lower() for f in filters)]
+    if not rows:
+        return []
+    # Group items by rarity for weighted selection
+    tier_names = {rarity_value(name): name for name in ITEM_RARITY_WEIGHTS}
+    tiers = {}
+    for row in rows:
+        tiers.setdefault(tier_names[rarity_value(row[2] or "")], []).append(row)
+    groups = [tiers[name] for name in ITEM_RARITY_WEIGHTS if name in tiers]
+    group_weights = [weight for name, weight in ITEM_RARITY_WEIGHTS.items() if name in tiers]
+    return [rng.choice(group)[0] for group in rng.choices(groups, weights=group_weights, k=amount)]
+
+
 async def roll_items(amount: int = 1, filter_keyword: str = None, game_corner: bool = False) -> list:
     """
-    Rolls a set of items from the items table using weighted rarity.
+    Rolls a set of items from the items table using weighted rarity (see pick_items).
     If game_corner is True, returns items from a fixed list.
     """
     if game_corner:
-        GAME_CORNER_ITEMS = [
-            "Snack Combo", "Energy Drink", "Lucky Charm", "Mystic Cookie", "Power Bar"
-        ]
         return random.choices(GAME_CORNER_ITEMS, k=amount)
-    else:
-        cursor.execute("SELECT name, effect, rarity, category FROM items")
-        rows = cursor.fetchall()
-        if not rows:
-            return []
-        if filter_keyword:
-            filters = [f.strip().lower() for f in filter_keyword.split(",")]
-            rows = [row for row in rows if any(f in (row[3] or "").lower() for f in filters)]
-            if not rows:
-                return []
-        # Group items by rarity for weighted selection
-        common_items = [row for row in rows if rarity_value(row[2]) == 1]
-        uncommon_items = [row for row in rows if rarity_value(row[2]) == 3]
-        rare_items = [row for row in rows if rarity_value(row[2]) == 5]
-        weights = [0.50, 0.35, 0.15]  # base probabilities for common, uncommon, rare
-        groups = []
-        group_weights = []
-        if common_items:
-            groups.append(common_items); group_weights.append(weights[0])
-        if uncommon_items:
-            groups.append(uncommon_items); group_weights.append(weights[1])
-        if rare_items:
-            groups.append(rare_items); group_weights.append(weights[2])
-        total_weight = sum(group_weights)
-        norm_weights = [w / total_weight for w in group_weights]
-        rolled = []
-        for _ in range(amount):
-            group = random.choices(groups, weights=norm_weights, k=1)[0]
-            chosen = random.choice(group)
-            rolled.append(chosen[0])
-        return rolled
+    return pick_items(fetch_all("SELECT name, effect, rarity, category FROM items"), amount, filter_keyword)
+
+def _debit_purchase(shop: str, user_id: str, today: str, items: list, item: dict, quantity: int, total_price: int):
+    """
+    Debits the price, records the purchase count and credits the user's first trainer
+    (the one holding their balance) in one commit; runs on the DB executor.
+    Returns an error message, or None on success (nothing is changed on failure).
+    """
+    with transaction():
+        trainer = fetch_one("SELECT id FROM trainers WHERE player_user_id = ? ORDER BY id LIMIT 1",
+                            (user_id,))
+        if trainer is None:
+            return "No trainer found to receive the item."
+        if debit_currency(user_id, total_price, "shop_purchase", f"{shop}:{item['name']}") is None:
+            return "Insufficient funds."
+        item["purchased"] += quantity
+        new_items_json = json.dumps(items)
+        execute_query("UPDATE shop_rolls SET items=? WHERE shop=? AND user_id=? AND date=?", (new_items_json, shop, user_id, today))
+        new_quantity = adjust_inventory(trainer["id"], item["name"], quantity)
+        notify_sheet_update("trainer", trainer["id"], "inventory_update", {item["name"]: new_quantity})
+    return None
 
 async def purchase_item(shop: str, user_id: str, item_name: str, quantity: int) -> (bool, str):
     """
@@ -72,26 +88,11 @@ async def purchase_item(shop: str, user_id: str, item_name: str, quantity: int)
             if item["purchased"] + quantity > item["max_purchase"]:
                 available = item["max_purchase"] - item["purchased"]
                 return False, f"Purchase exceeds the limit. Only {available} left for today."
-            # Check funds
-            funds = get_currency(user_id)
             total_price = item["price"] * quantity if "price" in item else 0
-            if funds < total_price:
-                return False, "Insufficient funds."
-            # Deduct currency and update purchase count
-            add_currency(user_id, -total_price)
-            item["purchased"] += quantity
-            new_items_json = json.dumps(items)
-            execute_query("UPDATE shop_rolls SET items=? WHERE shop=? AND user_id=? AND date=?", (new_items_json, shop, user_id, today))
-            # Update trainer's inventory with the purchased item
-            trainer_row = fetch_one("SELECT name FROM trainers WHERE player_user_id = ? ORDER BY id LIMIT 1", (user_id,))
-            trainer_name = trainer_row[0] if trainer_row else None
-            success = False
-            if trainer_name:
-                success = await add_item(trainer_name, item_name, quantity)
-            if success:
-                return True, f"Purchased {quantity} × {item_name}."
-            else:
-                return False, "Purchase recorded, but failed to update inventory."
+            error = await run_db(_debit_purchase, shop, user_id, today, items, item, quantity, total_price)
+            if error:
+                return False, error
+            return True, f"Purchased {quantity} × {item_name}."
     return False, f"Item '{item_name}' not found in today's {shop} stock."
 
 
@@ -116,39 +117,27 @@ async def process_reward(interaction: discord.Interaction, feedback: str, durati
     else:
         multiplier = 0.0
     coins_awarded = int(duration_minutes * 100 * multiplier)
-    add_currency(str(interaction.user.id), coins_awarded)
+    add_currency(str(interaction.user.id), coins_awarded, "work_session")
     await interaction.followup.send(f"You earned {coins_awarded} coins for your work session!", ephemeral=True)
 
-def get_temporary_inventory_columns(trainer: dict) -> list:
+def get_temporary_inventory_columns(trainer: dict, prefix: str = "temp_") -> list:
     """
-    Returns a list of keys from the trainer's inventory JSON that are considered temporary.
-    For this example, we assume that any key starting with "temp_" is temporary.
+    Returns the names of the trainer's inventory items that are considered temporary,
+    i.e. whose name starts with `prefix` ("temp_" by default).
     If none are found, returns an empty list.
     """
-    inv_str = trainer.get("inventory", "{}")
-    try:
-        inventory = json.loads(inv_str) if inv_str else {}
-    except Exception as e:
-        inventory = {}
-    return [key for key in inventory.keys() if key.startswith("temp_")]
+    return list(get_inventory(trainer["id"], prefix=prefix))
 
 def get_inventory_quantity(trainer_name: str, item_name: str) -> int:
     """
     Returns the quantity of a given item in the trainer's inventory.
-    The inventory is stored as a JSON string in the trainer record.
     If the item is not found, returns 0.
     """
     trainer = fetch_trainer_by_name(trainer_name)
     if not trainer:
         logging.error(f"Trainer {trainer_name} not found while getting inventory quantity.")
         return 0
-    inv_str = trainer.get("inventory", "{}")
-    try:
-        inventory = json.loads(inv_str) if inv_str else {}
-    except Exception as e:
-        logging.error(f"Error parsing inventory for {trainer_name}: {e}")
-        inventory = {}
-    return inventory.get(item_name, 0)
+    return get_inventory_item(trainer["id"], item_name)
 
 def check_inventory(user_id: str, trainer_name: str, item_name: str, required: int) -> (bool, str):
     """
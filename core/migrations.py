@@ -0,0 +1,218 @@
+"""
+Schema migrations.
+Each migration runs once, in version order, and is recorded in the schema_version table.
+A migration step is either a tuple of SQL statements or a callable taking the connection.
+"""
+import json
+import logging
+import sqlite3
+
+
+def _explode_inventories(conn: sqlite3.Connection) -> None:
+    """
+    Creates trainer_inventory and copies every trainer's JSON inventory into it,
+    one row per item. Items grouped under a category key ({"BALLS": {...}}) are
+    flattened; non-numeric values are skipped. trainers.inventory is left as-is.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS trainer_inventory (
+            trainer_id INTEGER NOT NULL,
+            item TEXT NOT NULL,
+            quantity INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (trainer_id, item)
+        ) WITHOUT ROWID
+        """
+    )
+    rows = conn.execute("SELECT id, inventory FROM trainers WHERE inventory IS NOT NULL AND inventory != ''").fetchall()
+    for trainer_id, inv_str in rows:
+        try:
+            inventory = json.loads(inv_str)
+        except ValueError as e:
+            logging.warning(f"Skipping unparsable inventory for trainer {trainer_id}: {e}")
+            continue
+        if not isinstance(inventory, dict):
+            continue
+        items = []
+        for key, value in inventory.items():
+            if isinstance(value, dict):
+                items.extend(value.items())
+            else:
+                items.append((key, value))
+        conn.executemany(
+            """
+            INSERT INTO trainer_inventory (trainer_id, item, quantity) VALUES (?, ?, ?)
+            ON CONFLICT (trainer_id, item) DO UPDATE SET quantity = quantity + excluded.quantity
+            """,
+            [(trainer_id, str(item), int(qty)) for item, qty in items
+             if isinstance(qty, (int, float)) and not isinstance(qty, bool) and qty > 0]
+        )
+
+
+MIGRATIONS = [
+    (
+        1,
+        "Create boss tables",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS boss (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT,
+                max_health INTEGER,
+                current_health INTEGER,
+                image_link TEXT,
+                flavor_text TEXT,
+                is_active INTEGER DEFAULT 0
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS boss_damage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                boss_id INTEGER,
+                user_id TEXT,
+                damage INTEGER
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS boss_rewards (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                boss_id INTEGER,
+                user_id TEXT,
+                levels INTEGER,
+                coins INTEGER,
+                claimed INTEGER DEFAULT 0
+            )
+            """,
+        ),
+    ),
+    (
+        2,
+        "Index mon and trainer lookups",
+        (
+            "CREATE INDEX IF NOT EXISTS idx_mons_trainer_name ON mons (trainer_id, LOWER(name))",
+            "CREATE INDEX IF NOT EXISTS idx_mons_name ON mons (LOWER(name))",
+            "CREATE INDEX IF NOT EXISTS idx_mons_player_user_id ON mons (player_user_id)",
+            "CREATE INDEX IF NOT EXISTS idx_trainers_character_name ON trainers (LOWER(character_name))",
+            "CREATE INDEX IF NOT EXISTS idx_trainers_player_user_id ON trainers (player_user_id)",
+        ),
+    ),
+    (
+        3,
+        "Index habit and task lookups",
+        (
+            "CREATE INDEX IF NOT EXISTS idx_habits_user_id ON habits (user_id)",
+            "CREATE INDEX IF NOT EXISTS idx_tasks_user_id ON tasks (user_id)",
+        ),
+    ),
+    (
+        4,
+        "Index boss damage and rewards",
+        (
+            "CREATE INDEX IF NOT EXISTS idx_boss_damage_boss_id ON boss_damage (boss_id)",
+            "CREATE INDEX IF NOT EXISTS idx_boss_rewards_user_claimed ON boss_rewards (user_id, claimed)",
+        ),
+    ),
+    (
+        5,
+        "Track sheet update retries",
+        (
+            "ALTER TABLE sheet_update_requests ADD COLUMN next_attempt_at REAL",
+            "CREATE INDEX IF NOT EXISTS idx_sheet_updates_status_next ON sheet_update_requests (status, next_attempt_at)",
+        ),
+    ),
+    (6, "Move trainer inventories into trainer_inventory", _explode_inventories),
+    (
+        7,
+        "Create currency ledger",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS currency_ledger (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                trainer_id INTEGER NOT NULL,
+                user_id TEXT,
+                amount INTEGER NOT NULL,
+                balance_after INTEGER NOT NULL,
+                source TEXT NOT NULL,
+                reference TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_currency_ledger_user ON currency_ledger (user_id, id)",
+        ),
+    ),
+    (
+        8,
+        "Create game corner sessions",
+        (
+            """
+            CREATE TABLE IF NOT EXISTS gamecorner_sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                channel_id INTEGER,
+                duration_minutes INTEGER NOT NULL,
+                started_at REAL NOT NULL,
+                deadline REAL NOT NULL,
+                status TEXT NOT NULL DEFAULT 'running'
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_gamecorner_sessions_status ON gamecorner_sessions (status, deadline)",
+        ),
+    ),
+    (
+        9,
+        "Store each mon's species origin",
+        (
+            # Filled on insert and species changes; rows from before this migration
+            # are backfilled at startup by backfill_mon_origins().
+            "ALTER TABLE mons ADD COLUMN origin TEXT",
+        ),
+    ),
+    # shop_rolls and generic_shop_rolls need no extra index: their
+    # PRIMARY KEY (shop, user_id, date) already covers the daily-roll lookups.
+]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def run_migrations(conn: sqlite3.Connection) -> int:
+    """
+    Applies every migration newer than the recorded schema version.
+    Each migration commits on its own, so a failure leaves earlier ones applied.
+    Returns the resulting schema version.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    conn.commit()
+    current = get_schema_version(conn)
+    for version, description, step in MIGRATIONS:
+        if version <= current:
+            continue
+        try:
+            conn.execute("BEGIN")
+            if callable(step):
+                step(conn)
+            else:
+                for statement in step:
+                    conn.execute(statement)
+            conn.execute(
+                "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                (version, description)
+            )
+            conn.commit()
+            logging.info(f"Applied migration {version}: {description}")
+        except Exception:
+            conn.rollback()
+            logging.exception(f"Migration {version} ({description}) failed")
+            raise
+        current = version
+    return current
@@ -3,9 +3,10 @@ import asyncio
 import discord
 from typing import Tuple, Any
 import logging
-from core.database import cursor, db, update_mon_row, add_mon
-from core.currency import add_currency
-from core.database import append_mon, update_character_level, update_character_sheet_item
+from core.database import execute_query, fetch_one, fetch_mons, update_mon_row, add_mon, mon_origin
+from core.database import run_db, transaction
+from core.currency import credit_trainer
+from core.database import append_mon, update_character_level, _update_character_level, update_character_sheet_item
 from data.lists import no_evolution, mythical_list, legendary_list
 
 def should_ignore_column(index: int) -> bool:
@@ -31,11 +32,10 @@ def get_mon(player_id: str, name: str) -> dict:
     Retrieves a mon record from the database by name and player (Discord user ID).
     Returns a dict with mon details or None if not found.
     """
-    cursor.execute(
+    row = fetch_one(
         "SELECT id, species1, species2, species3, type1, type2, type3, type4, type5, attribute FROM mons WHERE name = ? AND player = ?",
         (name, player_id)
     )
-    row = cursor.fetchone()
     if row:
         mon = {
             "id": row[0],
@@ -87,8 +87,7 @@ class RegisterMonModal(discord.ui.Modal, title="Register Mon"):
         final_name = self.mon_data["display_name"] if custom_name_input.lower() == "default" else custom_name_input
 
         # Find trainer record
-        cursor.execute("SELECT id, player_user_id FROM trainers WHERE name = ?", (trainer,))
-        trainer_row = cursor.fetchone()
+        trainer_row = fetch_one("SELECT id, player_user_id FROM trainers WHERE name = ?", (trainer,))
         if not trainer_row:
             await interaction.followup.send(f"Trainer '{trainer}' not found.", ephemeral=True)
             return
@@ -104,7 +103,7 @@ class RegisterMonModal(discord.ui.Modal, title="Register Mon"):
 
         # Insert mon record into the database
         try:
-            cursor.execute(
+            execute_query(
                 """
                 INSERT INTO mons (trainer_id, player, name, level, species1, species2, species3,
                                    type1, type2, type3, type4, type5, attribute, img_link)
@@ -117,7 +116,6 @@ class RegisterMonModal(discord.ui.Modal, title="Register Mon"):
                     self.mon_data.get("attribute", ""), self.mon_data.get("img_link", "")
                 )
             )
-            db.commit()
         except Exception as e:
             logging.error(f"Error inserting mon into database: {e}")
             await interaction.followup.send("Failed to register mon in the database.", ephemeral=True)
@@ -132,20 +130,27 @@ class RegisterMonModal(discord.ui.Modal, title="Register Mon"):
             # Deduct one Pokéball from inventory
             await update_character_sheet_item(trainer, "Pokeball", -1)
 
+def _cap_mon_level(trainer_name: str, name: str, effective_levels: int, trainer_id: int, extra_coins: int) -> bool:
+    """Raises a mon to level 100 and pays the overflow coins in one commit; runs on the DB executor."""
+    with transaction():
+        success = _update_character_level(trainer_name, name, effective_levels)
+        if success:
+            # Mon reached level 100; convert remaining levels to currency
+            credit_trainer(trainer_id, extra_coins, "level_overflow", name)
+    return success
+
 async def assign_levels_to_mon(interaction: discord.Interaction, name: str, levels: int):
     """
     Assigns a number of levels to a mon (or removes levels if negative).
     If the mon's level exceeds 100, extra levels are converted to currency for the trainer.
     """
     user_id = str(interaction.user.id)
-    cursor.execute("SELECT trainer_id, level FROM mons WHERE name = ? AND player = ?", (name, user_id))
-    res = cursor.fetchone()
+    res = fetch_one("SELECT trainer_id, level FROM mons WHERE name = ? AND player = ?", (name, user_id))
     if not res:
         await interaction.response.send_message(f"Mon '{name}' not found or does not belong to you.", ephemeral=True)
         return
     trainer_id, current_level = res
-    cursor.execute("SELECT name FROM trainers WHERE id = ?", (trainer_id,))
-    t_res = cursor.fetchone()
+    t_res = fetch_one("SELECT name FROM trainers WHERE id = ?", (trainer_id,))
     if not t_res:
         await interaction.response.send_message("Trainer not found for that mon.", ephemeral=True)
         return
@@ -154,8 +159,7 @@ async def assign_levels_to_mon(interaction: discord.Interaction, name: str, leve
     if current_level >= 100:
         extra_coins = levels * 25
         # Mon is already maxed; just convert all intended levels to currency
-        cursor.execute("UPDATE trainers SET currency_amount = currency_amount + ? WHERE id = ?", (extra_coins, trainer_id))
-        db.commit()
+        credit_trainer(trainer_id, extra_coins, "level_overflow", name)
         await interaction.response.send_message(
             f"Mon '{name}' is already at level 100. Converted {levels} level(s) into {extra_coins} coins.",
             ephemeral=True
@@ -163,12 +167,9 @@ async def assign_levels_to_mon(interaction: discord.Interaction, name: str, leve
     elif current_level + levels > 100:
         effective_levels = 100 - current_level
         excess = levels - effective_levels
-        success = await update_character_level(trainer_name, name, effective_levels)
+        extra_coins = excess * 25
+        success = await run_db(_cap_mon_level, trainer_name, name, effective_levels, trainer_id, extra_coins)
         if success:
-            # Mon reached level 100; convert remaining levels to currency
-            extra_coins = excess * 25
-            cursor.execute("UPDATE trainers SET currency_amount = currency_amount + ? WHERE id = ?", (extra_coins, trainer_id))
-            db.commit()
             await interaction.response.send_message(
                 f"Mon '{name}' reached level 100. Added {effective_levels} level(s) and converted {excess} extra level(s) into {extra_coins} coins.",
                 ephemeral=True
@@ -189,11 +190,10 @@ def get_mon(trainer_id: str, name: str) -> dict:
     """
     Retrieves a mon record for the given trainer and mon name.
     """
-    cursor.execute(
+    row = fetch_one(
         "SELECT mon_id, species1, species2, species3, type1, type2, type3, type4, type5, attribute FROM mons WHERE name = ? AND player = ?",
         (name, trainer_id)
     )
-    row = cursor.fetchone()
     if row:
         mon = {
             "id": row[0],
@@ -263,8 +263,7 @@ class RegisterMonModal(discord.ui.Modal, title="Register Mon"):
         while len(types) < 5:
             types.append("")
         types = types[:5]
-        cursor.execute("SELECT id FROM trainers WHERE user_id = ? AND LOWER(name)=?", (user_id, trainer.lower()))
-        row = cursor.fetchone()
+        row = fetch_one("SELECT id FROM trainers WHERE user_id = ? AND LOWER(name)=?", (user_id, trainer.lower()))
         if not row:
             await interaction.followup.send(f"Trainer '{trainer}' not found. Please add the trainer first.", ephemeral=True)
             return
@@ -275,7 +274,6 @@ class RegisterMonModal(discord.ui.Modal, title="Register Mon"):
             types[0], types[1], types[2], types[3], types[4],
             self.mon_data.get("attribute", ""), self.mon_data.get("img_link", "")
         )
-        db.commit()
         await interaction.followup.send(f"Registered mon **{final_name}** to trainer **{trainer}** successfully.", ephemeral=True)
 
 async def register_mon(interaction, mon_data):
@@ -288,6 +286,12 @@ async def register_mon(interaction, mon_data):
     else:
         await interaction.send_modal(modal)
 
+def _level_mon_with_overflow(mon_id: int, new_level: int, trainer_id: int, extra_coins: int) -> None:
+    """Sets the capped level and pays the overflow coins in one commit; runs on the DB executor."""
+    with transaction():
+        update_mon_row(mon_id, {"level": new_level})
+        credit_trainer(trainer_id, extra_coins, "level_overflow", mon_id)
+
 async def assign_levels_to_mon(interaction, name: str, levels: int):
     """
     Assigns levels to a mon. If the new total level exceeds 100, the extra levels are
@@ -295,14 +299,12 @@ async def assign_levels_to_mon(interaction, name: str, levels: int):
     """
     user_id = str(interaction.user.id)
     # Retrieve the mon record (includes trainer_id, current level, and mon_id)
-    cursor.execute("SELECT trainer_id, level, mon_id FROM mons WHERE name = ? AND player = ?", (name, user_id))
-    res = cursor.fetchone()
+    res = fetch_one("SELECT trainer_id, level, mon_id FROM mons WHERE name = ? AND player = ?", (name, user_id))
     if not res:
         await interaction.response.send_message(f"Mon '{name}' not found or does not belong to you.", ephemeral=True)
         return
     trainer_id, current_level, mon_id = res
-    cursor.execute("SELECT name FROM trainers WHERE id = ?", (trainer_id,))
-    t_res = cursor.fetchone()
+    t_res = fetch_one("SELECT name FROM trainers WHERE id = ?", (trainer_id,))
     if not t_res:
         await interaction.response.send_message("Trainer not found for that mon.", ephemeral=True)
         return
@@ -310,7 +312,7 @@ async def assign_levels_to_mon(interaction, name: str, levels: int):
     # If the mon is already at or above level 100, all additional levels are converted to coins.
     if current_level >= 100:
         extra_coins = levels * 25
-        add_currency(trainer_id, extra_coins)
+        credit_trainer(trainer_id, extra_coins, "level_overflow", mon_id)
         await interaction.response.send_message(
             f"Mon '{name}' is at level 100. Converted {levels} level(s) into {extra_coins} coins for trainer '{trainer_name}'.",
             ephemeral=True
@@ -319,9 +321,8 @@ async def assign_levels_to_mon(interaction, name: str, levels: int):
     elif current_level + levels > 100:
         effective_levels = 100 - current_level
         excess = levels - effective_levels
-        update_mon_row(mon_id, {"level": current_level + effective_levels})
         extra_coins = excess * 25
-        add_currency(trainer_id, extra_coins)
+        await run_db(_level_mon_with_overflow, mon_id, current_level + effective_levels, trainer_id, extra_coins)
         await interaction.response.send_message(
             f"Mon '{name}' reached level 100. Added {effective_levels} level(s) and converted {excess} extra level(s) into {extra_coins} coins for trainer '{trainer_name}'.",
             ephemeral=True
@@ -337,12 +338,7 @@ def get_mons_for_trainer(trainer_id: int) -> list:
     """
     Retrieves all mons for the specified trainer.
     """
-    cursor.execute("SELECT mon_id, name, level, img_link FROM mons WHERE trainer_id = ?", (trainer_id,))
-    rows = cursor.fetchall()
-    return [{"id": row[0], "name": row[1], "level": row[2], "img_link": row[3]} for row in rows]
-
-
-from core.database import execute_query
+    return fetch_mons("trainer_id = ?", (trainer_id,), ("id", "name", "level", "img_link"))
 
 
 def add_full_mon(trainer_id: int, player: str, mon_data: dict) -> int:
@@ -377,6 +373,8 @@ def add_full_mon(trainer_id: int, player: str, mon_data: dict) -> int:
     mon_data["player_user_id"] = player
     if "trainer_name" not in mon_data:
         mon_data["trainer_name"] = ""
+    if "origin" not in mon_data:
+        mon_data["origin"] = mon_origin(mon_data.get(column) for column in ("species1", "species2", "species3"))
 
     # Build the INSERT query dynamically.
     columns = list(mon_data.keys())
@@ -0,0 +1,131 @@
+"""
+Query profiler.
+Aggregates per-statement timings from the database helpers by normalized SQL text
+and keeps a bounded log of slow statements together with their query plans.
+"""
+import functools
+import logging
+import re
+import threading
+import time
+from collections import deque
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_sql(query: str) -> str:
+    """Collapses whitespace and replaces inline literals so equivalent statements group together."""
+    text = _STRING_LITERAL.sub("?", query)
+    text = _NUMBER_LITERAL.sub("?", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _percentile(sorted_samples: list, pct: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = max(0, min(len(sorted_samples) - 1, int(round(pct / 100 * len(sorted_samples))) - 1))
+    return sorted_samples[index]
+
+
+class _StatementStats:
+    __slots__ = ("count", "total", "max", "wait_total", "rows_total", "samples")
+
+    def __init__(self, sample_size: int):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.wait_total = 0.0
+        self.rows_total = 0
+        self.samples = deque(maxlen=sample_size)
+
+
+class QueryProfiler:
+    """
+    Thread-safe statement profiler. Timings are kept in seconds internally and
+    reported in milliseconds. Percentiles are computed over the most recent
+    `sample_size` executions of each statement.
+    """
+
+    def __init__(self, slow_threshold_ms: float = 250.0, sample_size: int = 1000, slow_log_size: int = 50):
+        self.enabled = True
+        self.slow_threshold_ms = slow_threshold_ms
+        self._sample_size = sample_size
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._slow_log = deque(maxlen=slow_log_size)
+
+    def record(self, query: str, elapsed: float, wait: float = 0.0, rows: int = 0,
+               conn=None, params=()) -> None:
+        """
+        Records one execution. When it exceeds the slow threshold and a connection
+        is given, the statement's EXPLAIN QUERY PLAN is captured on that connection.
+        """
+        if not self.enabled:
+            return
+        key = normalize_sql(query)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _StatementStats(self._sample_size)
+            stats.count += 1
+            stats.total += elapsed
+            stats.max = max(stats.max, elapsed)
+            stats.wait_total += wait
+            stats.rows_total += max(rows, 0)
+            stats.samples.append(elapsed)
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms >= self.slow_threshold_ms:
+            plan = self._explain(conn, query, params) if conn is not None else []
+            with self._lock:
+                self._slow_log.append({
+                    "query": key,
+                    "elapsed_ms": elapsed_ms,
+                    "wait_ms": wait * 1000,
+                    "rows": rows,
+                    "plan": plan,
+                    "at": time.time(),
+                })
+            logging.warning(f"Slow query ({elapsed_ms:.1f} ms): {key} | plan: {'; '.join(plan)}")
+
+    @staticmethod
+    def _explain(conn, query: str, params) -> list:
+        try:
+            rows = conn.execute("EXPLAIN QUERY PLAN " + query, params).fetchall()
+            return [row[3] for row in rows]
+        except Exception as e:
+            return [f"(plan unavailable: {e})"]
+
+    def summary(self, limit: int = None, order_by: str = "total_ms") -> list:
+        """Returns per-statement aggregates, heaviest first."""
+        with self._lock:
+            items = [(key, stats, sorted(stats.samples)) for key, stats in self._stats.items()]
+        result = []
+        for key, stats, samples in items:
+            result.append({
+                "query": key,
+                "count": stats.count,
+                "total_ms": stats.total * 1000,
+                "p50_ms": _percentile(samples, 50) * 1000,
+                "p95_ms": _percentile(samples, 95) * 1000,
+                "p99_ms": _percentile(samples, 99) * 1000,
+                "max_ms": stats.max * 1000,
+                "avg_wait_ms": stats.wait_total / stats.count * 1000,
+                "avg_rows": stats.rows_total / stats.count,
+            })
+        result.sort(key=lambda entry: entry[order_by], reverse=True)
+        return result[:limit] if limit else result
+
+    def slow_queries(self) -> list:
+        with self._lock:
+            return list(reversed(self._slow_log))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._slow_log.clear()
+
+
+profiler = QueryProfiler()
@@ -0,0 +1,136 @@
+"""
+Typed row records.
+Trainer and Mon are the one in-memory shape for rows read from the trainers and
+mons tables. They are frozen and slotted, so a listing of many rows costs one
+small fixed-size object per row instead of a dict each.
+
+Queries project only the columns a screen needs (see `projection`); fields
+that were not selected read as None. For code written against the older
+per-helper dicts, records also answer record["key"] and record.get("key"),
+including the legacy key names ("mon_id", "mon_name", "name", "user_id", ...).
+"""
+import functools
+from dataclasses import dataclass, fields
+from typing import Optional
+
+
+class _Record:
+    __slots__ = ()
+    # field name -> SQL column, and legacy dict key -> field name; set per subclass.
+    _COLUMNS = {}
+    _ALIASES = {}
+
+    def __getitem__(self, key):
+        name = self._ALIASES.get(key, key)
+        if name not in self._COLUMNS:
+            raise KeyError(key)
+        return getattr(self, name)
+
+    def get(self, key, default=None):
+        """Like dict.get, but an unselected (None) field also yields the default."""
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def __contains__(self, key) -> bool:
+        return self._ALIASES.get(key, key) in self._COLUMNS
+
+    def to_dict(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def projection(cls, columns: tuple = None):
+        """
+        Returns (select_list, build) for the given field names (all fields when omitted).
+        `build` turns one result row, in select_list order, into a record.
+        The id field is always selected.
+        """
+        names = tuple(columns) if columns else tuple(cls._COLUMNS)
+        if "id" not in names:
+            names = ("id",) + names
+        unknown = [name for name in names if name not in cls._COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown {cls.__name__} field(s): {', '.join(unknown)}")
+        select_list = ", ".join(cls._COLUMNS[name] for name in names)
+
+        def build(row):
+            return cls(**dict(zip(names, row)))
+
+        return select_list, build
+
+
+@dataclass(frozen=True, slots=True)
+class Trainer(_Record):
+    id: int
+    user_id: Optional[str] = None
+    character_name: Optional[str] = None
+    level: Optional[int] = None
+    main_ref: Optional[str] = None
+    img_link: Optional[str] = None
+    currency_amount: Optional[int] = None
+    mon_amount: Optional[int] = None
+
+    _COLUMNS = {
+        "id": "id",
+        "user_id": "player_user_id",
+        "character_name": "character_name",
+        "level": "level",
+        "main_ref": "main_ref",
+        "img_link": "img_link",
+        "currency_amount": "currency_amount",
+        "mon_amount": "mon_amount",
+    }
+    _ALIASES = {"name": "character_name", "player_user_id": "user_id"}
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.character_name
+
+
+@dataclass(frozen=True, slots=True)
+class Mon(_Record):
+    id: int
+    trainer_id: Optional[int] = None
+    user_id: Optional[str] = None
+    name: Optional[str] = None
+    level: Optional[int] = None
+    species1: Optional[str] = None
+    species2: Optional[str] = None
+    species3: Optional[str] = None
+    type1: Optional[str] = None
+    type2: Optional[str] = None
+    type3: Optional[str] = None
+    type4: Optional[str] = None
+    type5: Optional[str] = None
+    attribute: Optional[str] = None
+    img_link: Optional[str] = None
+
+    _COLUMNS = {
+        "id": "mon_id",
+        "trainer_id": "trainer_id",
+        "user_id": "player_user_id",
+        "name": "name",
+        "level": "level",
+        "species1": "species1",
+        "species2": "species2",
+        "species3": "species3",
+        "type1": "type1",
+        "type2": "type2",
+        "type3": "type3",
+        "type4": "type4",
+        "type5": "type5",
+        "attribute": "attribute",
+        "img_link": "img_link",
+    }
+    _ALIASES = {"mon_id": "id", "mon_name": "name", "player_user_id": "user_id", "player": "user_id"}
+
+    @property
+    def species(self) -> list:
+        return [s for s in (self.species1, self.species2, self.species3) if s]
+
+    @property
+    def types(self) -> list:
+        return [t for t in (self.type1, self.type2, self.type3, self.type4, self.type5) if t]
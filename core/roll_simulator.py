@@ -0,0 +1,409 @@
+"""
+Roll simulator and throughput benchmark.
+Runs the rolling engines (roll_single_mon, roll_mons_batch, pick_items,
+antique_appraise_item, the nursery modifiers and breed_offspring) many times
+against a synthetic species catalog, so no database rows are read. For each
+engine it reports outcome distributions (fusion rate, type-count histogram,
+attribute and origin mix, item rarity split, litter size, modifier compliance),
+checks them against the intended odds, and measures rolls/sec.
+
+    python -m core.roll_simulator --rolls 1000000 --seed 7
+    python -m core.roll_simulator --engine roll_mons_batch --save-baseline perf.json
+    python -m core.roll_simulator --baseline perf.json
+
+Exits non-zero if a distribution check fails or an engine is slower than its
+threshold (MIN_ROLLS_PER_SEC, or the saved baseline minus REGRESSION_TOLERANCE).
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+
+from core.species_catalog import catalog
+from core.rollmons import POSSIBLE_TYPES, RANDOM_ATTRIBUTES, MAX_ROLLED_TYPES
+from core.rollmons import get_default_pool, roll_single_mon, roll_mons_batch
+from core.items import ITEM_RARITY_WEIGHTS, pick_items
+
+# Rolls are simulated in chunks so memory stays flat for million-roll runs.
+CHUNK_SIZE = 10000
+# An observed rate passes when it is within this many standard errors of the intended odds.
+TOLERANCE_SIGMAS = 4.0
+# Allowed throughput drop against a saved baseline before it counts as a regression.
+REGRESSION_TOLERANCE = 0.20
+# Floor for each engine's throughput (rolls/sec) when no baseline is given.
+MIN_ROLLS_PER_SEC = {
+    "roll_single_mon": 20000,
+    "roll_mons_batch": 50000,
+    "pick_items": 100000,
+    "antique_appraise_item": 20000,
+    "nursery": 20000,
+    "breed_offspring": 10000,
+}
+
+
+# ----------------------------
+# Synthetic Catalog
+# ----------------------------
+POKEMON_STAGES = ("Base Stage", "Second Stage", "Final Stage")
+DIGIMON_STAGES = ("Training 1", "Training 2", "Rookie", "Champion")
+DIGIMON_KINDS = ("Plant", "Wind", "Beast", "Machine")
+DIGIMON_ATTRIBUTES = ("Vaccine", "Virus", "Data", "Free")
+YOKAI_RANKS = ("E", "D", "C", "B", "A", "S")
+YOKAI_ATTRIBUTES = ("Fire", "Water", "Earth", "Wind", "Lightning", "Ice")
+
+
+def synthetic_species(pokemon: int = 900, digimon: int = 600, yokai: int = 300) -> dict:
+    """
+    Builds species records shaped like the catalog's table loaders' output. Values
+    cycle through fixed lists, so the catalog is the same on every run.
+    """
+    return {
+        "pokemon": [
+            {
+                "name": f"SimPokemon{i}",
+                "stage": POKEMON_STAGES[i % len(POKEMON_STAGES)],
+                "types": [POSSIBLE_TYPES[i % len(POSSIBLE_TYPES)], POSSIBLE_TYPES[(i * 7 + 3) % len(POSSIBLE_TYPES)]],
+                "attribute": "",
+                "origin": "pokemon",
+            }
+            for i in range(pokemon)
+        ],
+        "digimon": [
+            {
+                "name": f"SimDigimon{i}",
+                "stage": DIGIMON_STAGES[i % len(DIGIMON_STAGES)],
+                "rarity": "Common",
+                "types": [DIGIMON_KINDS[i % len(DIGIMON_KINDS)]],
+                "attribute": DIGIMON_ATTRIBUTES[(i // len(DIGIMON_STAGES)) % len(DIGIMON_ATTRIBUTES)],
+                "origin": "digimon",
+            }
+            for i in range(digimon)
+        ],
+        "yokai": [
+            {
+                "name": f"SimYokai{i}",
+                "rank": YOKAI_RANKS[i % len(YOKAI_RANKS)],
+                "tribe": "Sim",
+                "attribute": YOKAI_ATTRIBUTES[(i // len(YOKAI_RANKS)) % len(YOKAI_ATTRIBUTES)],
+                "stage": "",
+                "origin": "yokai",
+            }
+            for i in range(yokai)
+        ],
+    }
+
+
+def synthetic_babies(species: dict) -> list:
+    """(parent, baby) pairs: each Pokémon's baby is the base-stage species of its line."""
+    pokemon = [record["name"] for record in species["pokemon"]]
+    return [(pokemon[i], pokemon[i - i % len(POKEMON_STAGES)]) for i in range(len(pokemon))]
+
+
+def synthetic_items(common: int = 30, uncommon: int = 20, rare: int = 10) -> list:
+    """(name, effect, rarity, category) rows as read from the items table."""
+    rows = []
+    for rarity, count in (("Common", common), ("Uncommon", uncommon), ("Rare", rare)):
+        rows += [(f"Sim {rarity} Item {i}", "", rarity, "sim") for i in range(count)]
+    return rows
+
+
+# ----------------------------
+# Engines
+# ----------------------------
+class Engine:
+    """
+    One rolling engine under test. roll(rng, count) returns `count` results;
+    observe(result, tally) records each result's outcomes as tally[metric][outcome] += 1;
+    expected() returns {metric: {outcome: intended probability}}.
+    """
+
+    def __init__(self, name: str, roll, observe, expected):
+        self.name = name
+        self.roll = roll
+        self.observe = observe
+        self.expected = expected
+
+
+def _parts(mon: dict) -> list:
+    return [part.strip() for part in mon["name"].split(" / ")]
+
+
+def _observe_mon(mon: dict, tally: dict) -> None:
+    fusion = mon["origin"] == "fusion"
+    tally["fusion"][fusion] += 1
+    tally["type_count"][len(mon["types"])] += 1
+    tally["attribute"][mon["attribute"]] += 1
+    if not fusion:
+        tally["origin"][mon["origin"]] += 1
+
+
+def _expected_mon() -> dict:
+    pool = get_default_pool()
+    origins = Counter(mon["origin"] for mon in pool)
+    return {
+        "fusion": {True: 0.5, False: 0.5},
+        "type_count": {n: 1 / MAX_ROLLED_TYPES for n in range(1, MAX_ROLLED_TYPES + 1)},
+        "attribute": {attribute: 1 / len(RANDOM_ATTRIBUTES) for attribute in RANDOM_ATTRIBUTES},
+        "origin": {origin: count / len(pool) for origin, count in origins.items()},
+    }
+
+
+def _single_mon_engine() -> Engine:
+    def roll(rng, count):
+        pool = get_default_pool()
+        return [roll_single_mon(pool, rng=rng) for _ in range(count)]
+
+    return Engine("roll_single_mon", roll, _observe_mon, _expected_mon)
+
+
+def _batch_engine() -> Engine:
+    def roll(rng, count):
+        return roll_mons_batch(get_default_pool(), count, rng=rng)
+
+    return Engine("roll_mons_batch", roll, _observe_mon, _expected_mon)
+
+
+def _items_engine() -> Engine:
+    rows = synthetic_items()
+    rarity_of = {row[0]: row[2].lower() for row in rows}
+
+    def roll(rng, count):
+        return pick_items(rows, count, rng=rng)
+
+    def observe(item, tally):
+        tally["rarity"][rarity_of[item]] += 1
+
+    return Engine("pick_items", roll, observe, lambda: {"rarity": dict(ITEM_RARITY_WEIGHTS)})
+
+
+def _antique_engine() -> Engine:
+    # Imported here: the antiques module reads data/antiques.JSON on import.
+    from logic.market.antique_activity import ANTIQUES, antique_appraise_item
+    antiques = list(ANTIQUES.values())
+
+    def roll(rng, count):
+        results = []
+        while len(results) < count:
+            antique = rng.choice(antiques)
+            results += [(antique, mon) for mon in antique_appraise_item(antique, rng=rng)]
+        return results[:count]
+
+    def observe(result, tally):
+        antique, mon = result
+        overrides = antique.get("override_parameters", {})
+        if antique.get("force_fusion") and antique.get("allow_fusion", True):
+            tally["forced_fusion"][mon["origin"] == "fusion"] += 1
+        if overrides.get("attribute"):
+            tally["attribute_override"][mon["attribute"] in overrides["attribute"]] += 1
+        if overrides.get("type"):
+            tally["type_override"][all(t in overrides["type"] for t in mon["types"])] += 1
+        if overrides.get("species_all"):
+            tally["species_override"][all(p in overrides["species_all"] for p in _parts(mon))] += 1
+
+    expected = {metric: {True: 1.0} for metric in
+                ("forced_fusion", "attribute_override", "type_override", "species_override")}
+    return Engine("antique_appraise_item", roll, observe, lambda: expected)
+
+
+# Nursery selections to simulate, each with the rule every rolled species must follow.
+NURSERY_SCENARIOS = (
+    ({"rank_incense": "S Rank Incense"},
+     lambda record: record["origin"] == "yokai" and record["rank"] == "S"),
+    ({"poffin": "Fire Poffin", "chocolate_milk": "Chocolate Milk"},
+     lambda record: record["origin"] == "pokemon" and "Fire" in record["types"]),
+    ({"tag": "#Vaccine", "hot_chocolate": "Hot Chocolate"},
+     lambda record: record["origin"] == "digimon" and record["attribute"] == "Vaccine"),
+    ({"spell_tag": "Spell Tag", "digitofu": "Digitofu", "repair_code": "Repair Code"},
+     lambda record: record["origin"] == "pokemon"),
+)
+
+
+def _nursery_engine() -> Engine:
+    from logic.market.nursery_roll import build_nursery_roll
+    records = {record["name"]: record for origin in ("pokemon", "digimon", "yokai")
+               for record in catalog.records(origin)}
+
+    def roll(rng, count):
+        results = []
+        while len(results) < count:
+            scenario = rng.choice(NURSERY_SCENARIOS)
+            rolled, _ = build_nursery_roll(scenario[0], rng=rng)
+            results += [(scenario, mon) for mon in rolled]
+        return results[:count]
+
+    def observe(result, tally):
+        (selections, rule), mon = result
+        tally["species_rule"][all(rule(records[part]) for part in _parts(mon))] += 1
+        if "hot_chocolate" in selections:
+            tally["forced_fusion"][mon["origin"] == "fusion"] += 1
+        if "chocolate_milk" in selections:
+            tally["min_types"][len(mon["types"]) >= 2] += 1
+        if "repair_code" in selections:
+            tally["code_override"][mon["attribute"] == "Vaccine"] += 1
+
+    expected = {metric: {True: 1.0} for metric in ("species_rule", "forced_fusion", "min_types", "code_override")}
+    return Engine("nursery", roll, observe, lambda: expected)
+
+
+# Parent pairs to breed: (parent1, parent2, the species every offspring must come from).
+def _breeding_pairs() -> list:
+    pokemon = catalog.pokemon
+    digimon = catalog.digimon
+    yokai = catalog.yokai
+
+    def parent(name, *species):
+        return {"mon_name": name, "species1": species[0]["name"],
+                "species2": species[1]["name"] if len(species) > 1 else "",
+                "types": list(species[0].get("types", ())) or ["Normal"], "attribute": species[0].get("attribute")}
+
+    return [
+        (parent("Pokemon A", pokemon[4]), parent("Pokemon B", pokemon[8], pokemon[11]),
+         {catalog.baby_species(p["name"]) for p in (pokemon[4], pokemon[8], pokemon[11])}),
+        (parent("Digimon", digimon[2]), parent("Yokai", yokai[5]), None),
+    ]
+
+
+def _breeding_engine() -> Engine:
+    from logic.market.farm_breeding import FRESH_DIGIMON, breed_offspring
+    pairs = _breeding_pairs()
+    mutation_species = {record["name"] for origin in ("digimon", "yokai") for record in catalog.records(origin)}
+
+    def roll(rng, count):
+        results = []
+        for _ in range(count):
+            parent1, parent2, allowed = rng.choice(pairs)
+            if allowed is None:
+                allowed = set(FRESH_DIGIMON) | {parent2["species1"]}
+            results.append((allowed, breed_offspring(parent1, parent2, rng=rng)))
+        return results
+
+    def observe(result, tally):
+        allowed, litter = result
+        tally["litter_size"][len(litter)] += 1
+        for offspring in litter:
+            species = [offspring[f"species{i}"] for i in (1, 2, 3) if offspring[f"species{i}"]]
+            tally["species_from_parents"][all(s in allowed | mutation_species for s in species)] += 1
+            tally["has_types"][bool(offspring["types"])] += 1
+
+    expected = {
+        "litter_size": {n: 1 / 3 for n in (1, 2, 3)},
+        "species_from_parents": {True: 1.0},
+        "has_types": {True: 1.0},
+    }
+    return Engine("breed_offspring", roll, observe, lambda: expected)
+
+
+ENGINES = {
+    "roll_single_mon": _single_mon_engine,
+    "roll_mons_batch": _batch_engine,
+    "pick_items": _items_engine,
+    "antique_appraise_item": _antique_engine,
+    "nursery": _nursery_engine,
+    "breed_offspring": _breeding_engine,
+}
+
+
+# ----------------------------
+# Simulation & Checks
+# ----------------------------
+def simulate(engine: Engine, rolls: int, rng) -> dict:
+    """Rolls `rolls` results through the engine; returns the tally and timing."""
+    tally = defaultdict(Counter)
+    elapsed = 0.0
+    done = 0
+    while done < rolls:
+        count = min(CHUNK_SIZE, rolls - done)
+        start = time.perf_counter()
+        results = engine.roll(rng, count)
+        elapsed += time.perf_counter() - start
+        for result in results:
+            engine.observe(result, tally)
+        done += count
+    return {"tally": tally, "rolls": rolls, "elapsed": elapsed, "rate": rolls / elapsed if elapsed else float("inf")}
+
+
+def check_distribution(tally: dict, expected: dict) -> list:
+    """
+    Compares observed rates with the intended odds.
+    Returns (metric, outcome, observed, expected, tolerance, ok) rows. Outcomes
+    with probability 1.0 or 0.0 are exact invariants and allow no deviation.
+    """
+    rows = []
+    for metric, odds in expected.items():
+        counts = tally.get(metric, Counter())
+        trials = sum(counts.values())
+        if not trials:
+            continue
+        for outcome in sorted(set(odds) | set(counts), key=str):
+            p = odds.get(outcome, 0.0)
+            observed = counts.get(outcome, 0) / trials
+            tolerance = TOLERANCE_SIGMAS * math.sqrt(p * (1 - p) / trials)
+            rows.append((metric, outcome, observed, p, tolerance, abs(observed - p) <= tolerance + 1e-12))
+    return rows
+
+
+def check_throughput(name: str, rate: float, baseline: dict = None) -> tuple:
+    """Returns (threshold, ok) for an engine's measured rolls/sec."""
+    if baseline and name in baseline:
+        threshold = baseline[name] * (1 - REGRESSION_TOLERANCE)
+    else:
+        threshold = MIN_ROLLS_PER_SEC.get(name, 0)
+    return threshold, rate >= threshold
+
+
+def run(engine_names: list, rolls: int, seed=None, baseline: dict = None, check_perf: bool = True) -> dict:
+    """
+    Installs the synthetic catalog, simulates each engine and prints its report.
+    Returns {"ok": bool, "rates": {engine: rolls/sec}}.
+    """
+    species = synthetic_species()
+    catalog.install(species, synthetic_babies(species))
+    ok = True
+    rates = {}
+    for name in engine_names:
+        engine = ENGINES[name]()
+        rng = random.Random(f"{seed}:{name}") if seed is not None else random.Random()
+        result = simulate(engine, rolls, rng)
+        rates[name] = result["rate"]
+
+        print(f"\n== {name}: {result['rolls']:,} rolls in {result['elapsed']:.2f}s ({result['rate']:,.0f} rolls/sec)")
+        for metric, outcome, observed, expected, tolerance, passed in check_distribution(result["tally"], engine.expected()):
+            ok = ok and passed
+            print(f"  {'PASS' if passed else 'FAIL'}  {metric:<20} {str(outcome):<12} "
+                  f"observed {observed:7.2%}  expected {expected:7.2%} (±{tolerance:.2%})")
+        if check_perf:
+            threshold, passed = check_throughput(name, result["rate"], baseline)
+            ok = ok and passed
+            print(f"  {'PASS' if passed else 'FAIL'}  throughput           >= {threshold:,.0f} rolls/sec")
+    return {"ok": ok, "rates": rates}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate and benchmark the mon and item rolling engines.")
+    parser.add_argument("--rolls", type=int, default=100000, help="rolls per engine (default 100000)")
+    parser.add_argument("--seed", help="seed for reproducible runs")
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES),
+                        help="engine to run (repeatable; default all)")
+    parser.add_argument("--baseline", help="JSON file of rolls/sec per engine to check for regressions")
+    parser.add_argument("--save-baseline", help="write this run's rolls/sec per engine to a JSON file")
+    parser.add_argument("--no-perf", action="store_true", help="skip throughput thresholds")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    outcome = run(args.engine or list(ENGINES), args.rolls, seed=args.seed, baseline=baseline,
+                  check_perf=not args.no_perf)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(outcome["rates"], f, indent=2)
+    print("\nAll checks passed." if outcome["ok"] else "\nSome checks FAILED.")
+    return 0 if outcome["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,12 @@
 import random
 import discord
 
-from core.database import cursor, db
-from core.database import append_mon, update_character_level, update_character_sheet_item
+from core.currency import credit_trainer
+from core.database import execute_query, fetch_one
+from core.database import transaction
+from core.database import append_mon, update_character_level, _update_character_level, update_character_sheet_item
+from core.database import async_add_mons_bulk, fetch_trainer_by_name, run_db
+from core.species_catalog import catalog
 from data.lists import legendary_list, mythical_list, no_evolution
 # ... (data fetching functions for Pokemon, Digimon, etc. remain unchanged) ...
 
@@ -21,7 +25,7 @@ async def register_mon(ctx, trainer_name: str, mon: dict, custom_display_name: s
     """
     try:
         # Insert mon into the database
-        cursor.execute(
+        execute_query(
             """
             INSERT INTO mons (trainer_id, player, mon_name, level, 
                                species1, species2, species3,
@@ -36,7 +40,6 @@ async def register_mon(ctx, trainer_name: str, mon: dict, custom_display_name: s
                 mon.get("attribute", ""), mon.get("img_link", "")
             )
         )
-        db.commit()
     except Exception as e:
         await ctx.send(f"Error adding mon to database: {e}")
         return
@@ -50,36 +53,39 @@ async def register_mon(ctx, trainer_name: str, mon: dict, custom_display_name: s
         # Deduct one Pokéball from trainer's inventory
         await update_character_sheet_item(trainer_name, "Pokeball", -1)
 
+def _cap_mon_level(trainer_name: str, mon_name: str, effective_levels: int, trainer_id: int, extra_coins: int) -> bool:
+    """Raises a mon to level 100 and pays the overflow coins in one commit; runs on the DB executor."""
+    with transaction():
+        success = _update_character_level(trainer_name, mon_name, effective_levels)
+        if success:
+            credit_trainer(trainer_id, extra_coins, "level_overflow", mon_name)
+    return success
+
 async def assign_levels_to_mon(ctx, mon_name: str, levels: int, user_id: str):
     """
     Assigns levels to a mon when called via a text command.
     Converts any levels beyond 100 into coins for the trainer.
     """
-    cursor.execute("SELECT trainer_id, level FROM mons WHERE mon_name = ? AND player = ?", (mon_name, user_id))
-    res = cursor.fetchone()
+    res = fetch_one("SELECT trainer_id, level FROM mons WHERE mon_name = ? AND player = ?", (mon_name, user_id))
     if not res:
         await ctx.send(f"Mon '{mon_name}' not found or does not belong to you.")
         return
     trainer_id, current_level = res
-    cursor.execute("SELECT name FROM trainers WHERE id = ?", (trainer_id,))
-    t_res = cursor.fetchone()
+    t_res = fetch_one("SELECT name FROM trainers WHERE id = ?", (trainer_id,))
     if not t_res:
         await ctx.send("Trainer not found for that mon.")
         return
     trainer_name = t_res[0]
     if current_level >= 100:
         extra_coins = levels * 25
-        cursor.execute("UPDATE trainers SET currency_amount = currency_amount + ? WHERE id = ?", (extra_coins, trainer_id))
-        db.commit()
+        credit_trainer(trainer_id, extra_coins, "level_overflow", mon_name)
         await ctx.send(f"Mon '{mon_name}' is at level 100. Converted {levels} level(s) into {extra_coins} coins.")
     elif current_level + levels > 100:
         effective_levels = 100 - current_level
         excess = levels - effective_levels
-        success = await update_character_level(trainer_name, mon_name, effective_levels)
+        extra_coins = excess * 25
+        success = await run_db(_cap_mon_level, trainer_name, mon_name, effective_levels, trainer_id, extra_coins)
         if success:
-            extra_coins = excess * 25
-            cursor.execute("UPDATE trainers SET currency_amount = currency_amount + ? WHERE id = ?", (extra_coins, trainer_id))
-            db.commit()
             await ctx.send(
                 f"Mon '{mon_name}' reached level 100. Added {effective_levels} level(s) and converted {excess} extra level(s) into {extra_coins} coins."
             )
@@ -93,104 +99,132 @@ async def assign_levels_to_mon(ctx, mon_name: str, levels: int, user_id: str):
             await ctx.send("Failed to update the mon's level.")
 
 # ------------------ Raw Data Fetching Functions ------------------
+# Species rows come from the in-memory catalog (core.species_catalog), which reads
+# the reference tables once. Each call returns a new list of shared, read-only records,
+# so callers may filter or extend the list but not edit the records themselves.
 def fetch_pokemon_data():
-    """Fetches Pokémon data from the Pokemon table."""
-    pokemon_data = []
-    try:
-        cursor.execute('SELECT "Name", "Stage", "Type1", "Type2" FROM Pokemon')
-        for row in cursor.fetchall():
-            name, stage, type1, type2 = row
-            types = []
-            if type1:
-                types.append(type1.strip())
-            if type2:
-                types.append(type2.strip())
-            pokemon_data.append({
-                "name": name,
-                "stage": stage,
-                "types": types,
-                "attribute": "",  # default attribute
-                "origin": "pokemon"
-            })
-    except Exception as e:
-        print(f"Error fetching Pokémon data: {e}")
-    return pokemon_data
+    """Returns the Pokémon records from the species catalog."""
+    return list(catalog.pokemon)
 
 
 def fetch_digimon_data():
-    """Fetches Digimon data from the Digimon table."""
-    digimon_data = []
-    try:
-        cursor.execute(
-            'SELECT "Name", "Stage", "Rarity", "Kind", "Attribute", "Evolves Into 1", "Evolves Into 2", "Evolves Into 3" FROM Digimon'
-        )
-        for row in cursor.fetchall():
-            name, stage, rarity, kind, attribute, evolves1, evolves2, evolves3 = row
-            # We'll store the 'kind' as the first element in a types list for filtering purposes.
-            types = [kind.strip()] if kind else []
-            digimon_data.append({
-                "name": name,
-                "stage": stage,
-                "rarity": rarity,
-                "types": types,  # Contains 'kind'
-                "attribute": attribute,
-                "origin": "digimon"
-            })
-    except Exception as e:
-        print(f"Error fetching Digimon data: {e}")
-    return digimon_data
+    """Returns the Digimon records from the species catalog."""
+    return list(catalog.digimon)
 
 
 def fetch_yokai_data():
-    """Fetches Yo-Kai data from the YoKai table."""
-    yokai_data = []
-    try:
-        cursor.execute('SELECT "Name", "Rank", "Tribe", "Attribute", "Stage" FROM YoKai')
-        for row in cursor.fetchall():
-            name, rank, tribe, attribute, stage = row
-            yokai_data.append({
-                "name": name,
-                "rank": rank,
-                "tribe": tribe,
-                "attribute": attribute,
-                "stage": stage,
-                "origin": "yokai"
-            })
-    except Exception as e:
-        print(f"Error fetching Yo-Kai data: {e}")
-    return yokai_data
+    """Returns the Yo-Kai records from the species catalog."""
+    return list(catalog.yokai)
 
 
 # ------------------ Pool Construction & Filtering ------------------
-def get_default_pool():
+# Each variant's pool is built once per species catalog version (see
+# core.species_catalog) and shared by every roll until the catalog is reloaded.
+def _lower_names(names) -> set:
+    return {name.strip().lower() for name in names}
+
+
+def _stage(mon) -> str:
+    return (mon.get("stage") or "").strip().lower()
+
+
+def _name(mon) -> str:
+    return (mon.get("name") or "").strip().lower()
+
+
+def _build_default_pool(species: dict) -> list:
     """
-    Builds the default mon pool for a standard roll.
     For the default roll we exclude legendaries and mythicals,
     include only Digimon with stage in {"training 1", "training 2", "rookie"},
     and for Pokémon include only those in {"second stage", "final stage"}.
+    Yo-Kai are not filtered.
     """
-    pokemon = fetch_pokemon_data()
-    digimon = fetch_digimon_data()
-    yokai = fetch_yokai_data()
-
-    legendary_set = set(name.lower() for name in legendary_list)
-    mythical_set = set(name.lower() for name in mythical_list)
-
-    filtered_pokemon = []
-    for p in pokemon:
-        name = p.get("name", "").lower()
-        stage = p.get("stage", "").lower()
-        if name in legendary_set or name in mythical_set:
-            continue
-        if stage in {"second stage", "final stage"}:
-            filtered_pokemon.append(p)
+    excluded = _lower_names(legendary_list) | _lower_names(mythical_list)
+    pokemon = [p for p in species["pokemon"]
+               if _name(p) not in excluded and _stage(p) in {"second stage", "final stage"}]
+    digimon = [d for d in species["digimon"] if _stage(d) in {"training 1", "training 2", "rookie"}]
+    return pokemon + digimon + list(species["yokai"])
 
-    filtered_digimon = [d for d in digimon if d.get("stage", "").lower() in {"training 1", "training 2", "rookie"}]
 
-    # For Yo-Kai, no extra filtering for the default pool.
-    filtered_yokai = yokai
+def _build_garden_pool(species: dict) -> list:
+    """
+    Pokémon: base stage with at least one of {flying, normal, grass, bug, water}.
+    Digimon: stage in {"training 1", "training 2", "rookie"} with kind "plant" or "wind".
+    Yo-Kai: attribute "earth" or "wind".
+    """
+    allowed_types = {"flying", "normal", "grass", "bug", "water"}
+    pokemon = [p for p in species["pokemon"]
+               if _stage(p) in {"base", "base stage"} and any(t.lower() in allowed_types for t in p.get("types", ()))]
+    digimon = [d for d in species["digimon"]
+               if _stage(d) in {"training 1", "training 2", "rookie"}
+               and d.get("types") and d["types"][0].lower() in {"plant", "wind"}]
+    yokai = [y for y in species["yokai"] if (y.get("attribute") or "").lower() in {"earth", "wind"}]
+    return pokemon + digimon + yokai
+
 
-    return filtered_pokemon + filtered_digimon + filtered_yokai
+def _build_egg_pool(species: dict) -> list:
+    """
+    Pokémon in "Base Stage" (or "base") or in no_evolution, excluding legendaries and mythicals.
+    Digimon whose stage is exactly "training 1". Yo-Kai whose rank is E, D, C, or B.
+    """
+    excluded = _lower_names(legendary_list) | _lower_names(mythical_list)
+    no_evo_set = _lower_names(no_evolution)
+    pokemon = [p for p in species["pokemon"]
+               if _name(p) not in excluded and (_stage(p) in {"base", "base stage"} or _name(p) in no_evo_set)]
+    digimon = [d for d in species["digimon"] if _stage(d) == "training 1"]
+    yokai = [y for y in species["yokai"] if (y.get("rank") or "").strip().lower() in {"e", "d", "c", "b"}]
+    return pokemon + digimon + yokai
+
+
+def _build_starter_pool(species: dict) -> list:
+    no_evo_set = _lower_names(no_evolution)
+    pokemon = [p for p in species["pokemon"] if _stage(p) in {"base", "base stage"} or _name(p) in no_evo_set]
+    digimon = [d for d in species["digimon"] if _stage(d) in {"baby", "rookie"}]
+    return pokemon + digimon + list(species["yokai"])
+
+
+def _build_legendary_pool(species: dict) -> list:
+    legendary_set = _lower_names(legendary_list)
+    return [p for p in species["pokemon"] if _name(p) in legendary_set]
+
+
+def _build_mythical_pool(species: dict) -> list:
+    mythical_set = _lower_names(mythical_list)
+    return [p for p in species["pokemon"] if _name(p) in mythical_set]
+
+
+POOL_BUILDERS = {
+    "default": _build_default_pool,
+    "garden": _build_garden_pool,
+    "egg": _build_egg_pool,
+    "starter": _build_starter_pool,
+    "legendary": _build_legendary_pool,
+    "mythical": _build_mythical_pool,
+}
+for _pool_name, _build in POOL_BUILDERS.items():
+    catalog.register_pool(_pool_name, _build)
+
+# Variants that roll from another variant's pool. Egg rolls through roll_mons use
+# the default pool; hatching uses get_egg_pool().
+VARIANT_POOLS = {
+    "standard": "default",
+    "egg": "default",
+    "breeding": "default",
+    "gamecorner": "default",
+    "special": "default",
+}
+
+# unique_terms keys for the "special" variant that narrow the pool through the
+# catalog's secondary indexes (e.g. {"origin": "yokai", "rank": "S"}).
+SPECIAL_INDEX_TERMS = ("origin", "stage", "rank", "attribute", "type")
+
+
+def get_default_pool():
+    """
+    Returns the default mon pool for a standard roll (see _build_default_pool).
+    The list is a fresh copy; its records are the catalog's shared, read-only ones.
+    """
+    return list(catalog.pool("default"))
 
 
 def get_pool_by_variant(variant: str, unique_terms: dict = None):
@@ -206,98 +240,102 @@ def get_pool_by_variant(variant: str, unique_terms: dict = None):
       - "legendary"
       - "mythical"
       - "starter"
-    unique_terms is an optional dict that can override or add filtering parameters.
+    Unknown variants fall back to the default pool.
+    For "special", unique_terms may narrow the default pool: "filter" matches a
+    substring of the name, and any of SPECIAL_INDEX_TERMS match that field exactly
+    (case-insensitive; "origin" restricts the other terms to one origin).
     """
     variant = variant.lower()
-    if variant in {"default", "standard"}:
-        return get_default_pool()
-    elif variant == "egg":
-        # Egg rolls handled separately.
-        return get_default_pool()
-    elif variant == "breeding":
-        return get_default_pool()
-    elif variant == "garden":
-        # Apply garden-specific filters.
-        pool = []
-        # For Pokémon: Only include base stage and at least one allowed type.
-        allowed_types = {"flying", "normal", "grass", "bug", "water"}
-        for p in fetch_pokemon_data():
-            if str(p.get("stage", "")).lower() in {"base", "base stage"}:
-                p_types = [t.lower() for t in p.get("types", [])]
-                if any(t in allowed_types for t in p_types):
-                    pool.append(p)
-        # For Digimon: Only include those whose stage is in {"training 1", "training 2", "rookie"}
-        # and whose kind (first element in types) is either "plant" or "wind".
-        for d in fetch_digimon_data():
-            stage = str(d.get("stage", "")).lower()
-            if stage in {"training 1", "training 2", "rookie"}:
-                d_types = d.get("types", [])
-                if d_types:
-                    kind = d_types[0].lower()
-                    if kind in {"plant", "wind"}:
-                        pool.append(d)
-        # For YoKai: Only include those with attribute "earth" or "wind".
-        for y in fetch_yokai_data():
-            if str(y.get("attribute", "")).lower() in {"earth", "wind"}:
-                pool.append(y)
-        return pool
-    elif variant == "gamecorner":
-        return get_default_pool()
-    elif variant == "special":
+    pool_name = VARIANT_POOLS.get(variant, variant)
+    if pool_name not in POOL_BUILDERS:
+        pool_name = "default"
+    if variant != "special" or not unique_terms:
+        return list(catalog.pool(pool_name))
+
+    origin = unique_terms.get("origin")
+    pool = None
+    for field in SPECIAL_INDEX_TERMS:
+        value = unique_terms.get(field)
+        if not value:
+            continue
+        if pool is None:
+            pool = list(catalog.lookup(field, value, origin=origin, pool=pool_name))
+        else:
+            pool = catalog.narrow(pool, field, value, origin=origin)
+    if "filter" in unique_terms:
+        term = unique_terms["filter"].strip().lower()
+        if pool is None:
+            names = catalog.folded_names(pool_name)
+            pool = [mon for mon, name in zip(catalog.pool(pool_name), names) if term in name]
+        else:
+            pool = [mon for mon in pool if term in _name(mon)]
+    return pool if pool is not None else list(catalog.pool(pool_name))
+
+
+POSSIBLE_TYPES = (
+    "Normal", "Fire", "Water", "Electric", "Grass", "Ice", "Fighting", "Poison",
+    "Ground", "Flying", "Psychic", "Bug", "Rock", "Ghost", "Dragon", "Dark", "Steel", "Fairy"
+)
+RANDOM_ATTRIBUTES = ("Free", "Virus", "Data", "Variable")
+MAX_ROLLED_TYPES = 3
+
+
+def roll_mons_batch(pool: list = None, count: int = 1, force_fusion: bool = False, force_min_types: int = None,
+                    rng=None) -> list:
+    """
+    Rolls `count` mons from the pool (the default pool when omitted) in one pass.
+    Each mon has a fusion chance of one half (always, with force_fusion, once the
+    pool has two entries), 1-3 random types (at least force_min_types), and a
+    random attribute.
+
+    Species picks, type counts and attributes are each drawn for the whole batch
+    with one call. rng is any object with the random module's interface: pass a
+    seeded random.Random for reproducible rolls. It defaults to the module-level
+    generator.
+    Every mon is a new dict; the pool's catalog records are never modified.
+    """
+    rng = rng or random
+    if pool is None:
         pool = get_default_pool()
-        if unique_terms and "filter" in unique_terms:
-            term = unique_terms["filter"].lower()
-            pool = [m for m in pool if term in m.get("name", "").lower()]
-        return pool
-    elif variant == "legendary":
-        pool = fetch_pokemon_data()
-        legendary_set = set(name.lower() for name in legendary_list)
-        return [m for m in pool if m.get("name", "").lower() in legendary_set]
-    elif variant == "mythical":
-        pool = fetch_pokemon_data()
-        mythical_set = set(name.lower() for name in mythical_list)
-        return [m for m in pool if m.get("name", "").lower() in mythical_set]
-    elif variant == "starter":
-        pokemon = fetch_pokemon_data()
-        digimon = fetch_digimon_data()
-        starter_pokemon = [
-            p for p in pokemon if str(p.get("stage", "")).lower() in {"base", "base stage"}
-                                  or p.get("name", "").lower() in {n.lower() for n in no_evolution}
-        ]
-        starter_digimon = [d for d in digimon if str(d.get("stage", "")).lower() in {"baby", "rookie"}]
-        yokai = fetch_yokai_data()
-        return starter_pokemon + starter_digimon + yokai
+    if not pool or count <= 0:
+        return []
+    size = len(pool)
+    min_types = min(force_min_types or 1, MAX_ROLLED_TYPES)
+
+    picks = rng.choices(range(size), k=count)
+    type_counts = rng.choices(range(min_types, MAX_ROLLED_TYPES + 1), k=count)
+    attributes = rng.choices(RANDOM_ATTRIBUTES, k=count)
+    if size < 2:
+        fusions = [False] * count
+    elif force_fusion:
+        fusions = [True] * count
     else:
-        return get_default_pool()
+        fusions = [rng.random() < 0.5 for _ in range(count)]
+
+    rolled = []
+    for pick, fusion, num_types, attribute in zip(picks, fusions, type_counts, attributes):
+        if fusion:
+            first, second = rng.sample(range(size), 2)
+            mon = {
+                "name": f"{pool[first]['name']} / {pool[second]['name']}",
+                "stage": "Fusion",
+                "origin": "fusion"
+            }
+        else:
+            mon = dict(pool[pick])
+        mon["types"] = rng.sample(POSSIBLE_TYPES, num_types)
+        mon["attribute"] = attribute
+        rolled.append(mon)
+    return rolled
 
 
-def roll_single_mon(pool: list, force_fusion: bool = False, force_min_types: int = None) -> dict:
+def roll_single_mon(pool: list = None, force_fusion: bool = False, force_min_types: int = None, rng=None) -> dict:
     """
-    Rolls a single mon from the provided pool.
-    With a chance for fusion if force_fusion is True or random chance passes.
+    Rolls a single mon from the provided pool (the default pool when omitted); see roll_mons_batch.
+    Returns None if the pool is empty.
     """
-    POSSIBLE_TYPES = [
-        "Normal", "Fire", "Water", "Electric", "Grass", "Ice", "Fighting", "Poison",
-        "Ground", "Flying", "Psychic", "Bug", "Rock", "Ghost", "Dragon", "Dark", "Steel", "Fairy"
-    ]
-    RANDOM_ATTRIBUTES = ["Free", "Virus", "Data", "Variable"]
-    if force_fusion or (len(pool) >= 2 and random.random() < 0.5):
-        mon1, mon2 = random.sample(pool, 2)
-        fused = {
-            "name": f"{mon1['name']} / {mon2['name']}",
-            "stage": "Fusion",
-            "origin": "fusion"
-        }
-        num_types = random.randint(force_min_types if force_min_types else 1, 3)
-        fused["types"] = random.sample(POSSIBLE_TYPES, num_types)
-        fused["attribute"] = random.choice(RANDOM_ATTRIBUTES)
-        return fused
-    else:
-        mon = random.choice(pool)
-        num_types = random.randint(force_min_types if force_min_types else 1, 3)
-        mon["types"] = random.sample(POSSIBLE_TYPES, num_types)
-        mon["attribute"] = random.choice(RANDOM_ATTRIBUTES)
-        return mon
+    rolled = roll_mons_batch(pool, 1, force_fusion=force_fusion, force_min_types=force_min_types, rng=rng)
+    return rolled[0] if rolled else None
 
 
 # ------------------ Embed and View Building ------------------
@@ -323,11 +361,60 @@ def build_mon_embed(rolled_mons: list) -> discord.Embed:
     return embed
 
 
+def rolled_mon_row(mon: dict) -> dict:
+    """Maps a rolled mon onto the row shape add_mons_bulk expects."""
+    return {
+        "name": mon.get("name") or mon.get("species1") or "Unknown",
+        "level": mon.get("level", 1),
+        "species1": mon.get("species1") or mon.get("name") or "Unknown",
+        "species2": mon.get("species2", ""),
+        "species3": mon.get("species3", ""),
+        "types": mon.get("types") or ["Normal"],
+        "attribute": mon.get("attribute", ""),
+        "img_link": mon.get("img_link", ""),
+    }
+
+
+class ClaimMonsModal(discord.ui.Modal, title="Claim Mons"):
+    """
+    Registers every selected mon to one trainer in a single bulk insert.
+    """
+    trainer_name = discord.ui.TextInput(label="Trainer Name", placeholder="Enter trainer's name", required=True)
+
+    def __init__(self, roll_view: "RollMonsView"):
+        super().__init__()
+        self.roll_view = roll_view
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        user_id = str(interaction.user.id)
+        trainer = await run_db(fetch_trainer_by_name, self.trainer_name.value.strip())
+        if not trainer or trainer["user_id"] != user_id:
+            await interaction.followup.send(f"Trainer '{self.trainer_name.value.strip()}' not found.", ephemeral=True)
+            return
+        selected = self.roll_view.selected
+        try:
+            await async_add_mons_bulk(trainer["id"], user_id, [rolled_mon_row(mon) for mon in selected])
+        except Exception as e:
+            await interaction.followup.send(f"Error registering mons: {e}", ephemeral=True)
+            return
+        self.roll_view.claimed = len(selected)
+        self.roll_view.finish()
+        if interaction.message:
+            await interaction.message.edit(view=self.roll_view)
+        names = ", ".join(rolled_mon_row(mon)["name"] for mon in selected)
+        await interaction.followup.send(
+            f"Registered {len(selected)} mons to trainer **{trainer['character_name']}**: {names}", ephemeral=True
+        )
+
+
 class RollMonsView(discord.ui.View):
     """
     A views with a button for each rolled mon plus a skip button.
     Claim limit determines how many mon buttons can be pressed (default 1).
-    Pressing a mon button launches the register_mon modal.
+    With a claim limit of 1, pressing a mon button launches the register_mon modal.
+    With a higher limit, mon buttons toggle a selection and "Claim Selected" registers
+    the whole selection to one trainer at once.
     """
 
     def __init__(self, rolled_mons: list, claim_limit: int = 1):
@@ -335,45 +422,78 @@ class RollMonsView(discord.ui.View):
         self.rolled_mons = rolled_mons
         self.claim_limit = claim_limit
         self.claimed = 0
+        self.selected = []
         for mon in rolled_mons:
             # Use species1 if available, otherwise fallback to the mon's name.
             species_label = (mon.get("species1") or mon.get("name") or "Unknown").strip()
             # Truncate label if necessary (Discord limits button label length to 80 characters)
             species_label = species_label[:80]
             button = discord.ui.Button(label=f"Claim {species_label}", style=discord.ButtonStyle.primary)
-            button.callback = self.make_claim_callback(mon)
+            button.callback = self.make_claim_callback(mon, button)
             self.add_item(button)
+        if claim_limit > 1:
+            claim_button = discord.ui.Button(label="Claim Selected", style=discord.ButtonStyle.success,
+                                             custom_id="claim_selected")
+            claim_button.callback = self.claim_selected_callback
+            self.add_item(claim_button)
         skip_button = discord.ui.Button(label="Skip", style=discord.ButtonStyle.secondary, custom_id="skip")
         skip_button.callback = self.skip_callback
         self.add_item(skip_button)
 
-    def make_claim_callback(self, mon: dict):
+    def finish(self):
+        for item in self.children:
+            if isinstance(item, discord.ui.Button) and item.custom_id != "skip":
+                item.disabled = True
+
+    def make_claim_callback(self, mon: dict, button: discord.ui.Button):
         async def callback(interaction: discord.Interaction):
             if self.claimed >= self.claim_limit:
                 await interaction.response.send_message("Maximum mons already claimed.", ephemeral=True)
                 return
+            if self.claim_limit > 1:
+                # Toggle the mon in or out of the pending selection.
+                if mon in self.selected:
+                    self.selected.remove(mon)
+                    button.style = discord.ButtonStyle.primary
+                elif len(self.selected) >= self.claim_limit:
+                    await interaction.response.send_message(
+                        f"You can claim at most {self.claim_limit} mons.", ephemeral=True
+                    )
+                    return
+                else:
+                    self.selected.append(mon)
+                    button.style = discord.ButtonStyle.success
+                await interaction.response.edit_message(view=self)
+                return
+            from core.mon import register_mon  # centralized registration modal
             await register_mon(interaction, mon)
             self.claimed += 1
             if self.claimed >= self.claim_limit:
-                for item in self.children:
-                    if isinstance(item, discord.ui.Button) and item.custom_id != "skip":
-                        item.disabled = True
+                self.finish()
                 await interaction.message.edit(view=self)
 
         return callback
 
+    async def claim_selected_callback(self, interaction: discord.Interaction):
+        if not self.selected:
+            await interaction.response.send_message("Select at least one mon to claim.", ephemeral=True)
+            return
+        await interaction.response.send_modal(ClaimMonsModal(self))
+
     async def skip_callback(self, interaction: discord.Interaction):
         await interaction.response.send_message("No mons claimed.", ephemeral=True)
         self.stop()
 
 
 # ------------------ Main Roll Function ------------------
-async def roll_mons(ctx, variant: str = "default", amount: int = 10, unique_terms: dict = None, claim_limit: int = 1):
+async def roll_mons(ctx, variant: str = "default", amount: int = 10, unique_terms: dict = None, claim_limit: int = 1,
+                    rng=None):
     """
     Rolls a set of mons based on the variant.
     Supported variants: "default", "egg", "breeding", "garden", "gamecorner", "special", "legendary", "mythical", "starter".
     unique_terms is an optional dict for extra filtering.
     Amount defaults to 10.
+    rng is passed to roll_mons_batch (e.g. a seeded random.Random for a reproducible preview).
 
     For the garden variant, the pool is filtered as follows:
       • Pokémon: Only include mons with stage "base" or "base stage" and with at least one type in {flying, normal, grass, bug, water}.
@@ -396,7 +516,7 @@ async def roll_mons(ctx, variant: str = "default", amount: int = 10, unique_term
             await ctx.send("No mons available for the given criteria.", ephemeral=True)
         return
 
-    rolled_mons = [roll_single_mon(pool) for _ in range(amount)]
+    rolled_mons = roll_mons_batch(pool, amount, rng=rng)
     embed = build_mon_embed(rolled_mons)
     view = RollMonsView(rolled_mons, claim_limit=claim_limit)
 
@@ -408,36 +528,7 @@ async def roll_mons(ctx, variant: str = "default", amount: int = 10, unique_term
 
 def get_egg_pool():
     """
-    Builds a pool for egg rolls.
-    Only includes:
-      - Pokémon that are in "Base Stage" (or "base") or whose name is in no_evolution,
-        excluding legendary and mythical Pokémon.
-      - Digimon whose stage is exactly "training 1" (case-insensitive).
-      - Yo-Kai whose rank is one of E, D, C, or B.
+    Returns the pool for egg rolls (see _build_egg_pool).
+    The list is a fresh copy; its records are the catalog's shared, read-only ones.
     """
-    pokemon = fetch_pokemon_data()
-    digimon = fetch_digimon_data()
-    yokai = fetch_yokai_data()
-
-    legendary_set = set(name.lower() for name in legendary_list)
-    mythical_set = set(name.lower() for name in mythical_list)
-    no_evo_set = set(n.lower() for n in no_evolution)
-
-    # Filter Pokémon: only include those in base stage or in the no_evolution list.
-    filtered_pokemon = []
-    for p in pokemon:
-        name = (p.get("name") or "").lower()
-        stage = (p.get("stage") or "").lower()
-        if name in legendary_set or name in mythical_set:
-            continue
-        if stage in {"base", "base stage"} or name in no_evo_set:
-            filtered_pokemon.append(p)
-
-    # Filter Digimon: only include those with stage exactly "training 1".
-    filtered_digimon = [d for d in digimon if (d.get("stage") or "").strip().lower() == "training 1"]
-
-    # Filter Yo-Kai: only include those whose rank is E, D, C, or B.
-    allowed_ranks = {"e", "d", "c", "b"}
-    filtered_yokai = [y for y in yokai if (y.get("rank") or "").strip().lower() in allowed_ranks]
-
-    return filtered_pokemon + filtered_digimon + filtered_yokai
\ No newline at end of file
+    return list(catalog.pool("egg"))
@@ -0,0 +1,167 @@
+"""
+Deadline scheduler.
+One asyncio task owns every pending timeout (adventure sudden death, pomodoro
+completion, ...) in a min-heap keyed by deadline, instead of each session
+parking its own task on asyncio.sleep.
+
+Timers are addressed by a hashable key such as ("adventure", channel_id).
+Moving a deadline is O(1): reschedule() only rewrites the timer's deadline and
+leaves its heap entry in place. When a stale entry reaches the top of the heap
+it is pushed back at the new deadline, so a timer that is pushed back on every
+message costs one heap operation per expiry window rather than one task each time.
+"""
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+from typing import Any, Callable, Hashable, Optional
+
+
+class _Timer:
+    __slots__ = ("key", "deadline", "callback", "args", "queued_at")
+
+    def __init__(self, key, deadline: float, callback: Callable, args: tuple):
+        self.key = key
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.queued_at = deadline  # deadline of this timer's entry in the heap
+
+
+class Scheduler:
+    """
+    Single-task timer service. All methods must be called from the event loop thread.
+    Deadlines are on the loop's monotonic clock; pass delays in seconds.
+    """
+
+    def __init__(self):
+        self._timers = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.fired = 0
+        self.rescheduled = 0
+        self.cancelled = 0
+
+    # ----------------------------
+    # Public API
+    # ----------------------------
+    def schedule(self, key: Hashable, delay: float, callback: Callable, *args) -> None:
+        """
+        Runs callback(*args) (a plain function or coroutine function) after `delay`
+        seconds. Scheduling an existing key replaces that timer.
+        """
+        self._ensure_running()
+        deadline = asyncio.get_running_loop().time() + max(delay, 0)
+        timer = _Timer(key, deadline, callback, args)
+        self._timers[key] = timer
+        self._push(timer)
+
+    def reschedule(self, key: Hashable, delay: float) -> bool:
+        """
+        Moves an existing timer to fire `delay` seconds from now.
+        Returns False if no timer is pending under `key`.
+        """
+        timer = self._timers.get(key)
+        if timer is None:
+            return False
+        timer.deadline = asyncio.get_running_loop().time() + max(delay, 0)
+        self.rescheduled += 1
+        if timer.deadline < timer.queued_at:
+            # Earlier than its heap entry: it needs a fresh entry to fire on time.
+            self._push(timer)
+        return True
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drops a pending timer; its heap entry is discarded when it surfaces."""
+        if self._timers.pop(key, None) is None:
+            return False
+        self.cancelled += 1
+        return True
+
+    def remaining(self, key: Hashable) -> Optional[float]:
+        timer = self._timers.get(key)
+        if timer is None:
+            return None
+        return max(timer.deadline - asyncio.get_running_loop().time(), 0.0)
+
+    def pending(self, limit: int = 20) -> list:
+        """The soonest pending timers as (key, seconds remaining)."""
+        now = asyncio.get_running_loop().time()
+        soonest = heapq.nsmallest(limit, self._timers.values(), key=lambda t: t.deadline)
+        return [(timer.key, max(timer.deadline - now, 0.0)) for timer in soonest]
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._timers),
+            "heap_size": len(self._heap),
+            "fired": self.fired,
+            "rescheduled": self.rescheduled,
+            "cancelled": self.cancelled,
+        }
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # ----------------------------
+    # Internals
+    # ----------------------------
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def _push(self, timer: _Timer) -> None:
+        timer.queued_at = timer.deadline
+        head = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (timer.deadline, next(self._seq), timer))
+        if head is None or timer.deadline < head:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            now = loop.time()
+            while self._heap and self._heap[0][0] <= now:
+                queued_at, _, timer = heapq.heappop(self._heap)
+                if self._timers.get(timer.key) is not timer or timer.queued_at != queued_at:
+                    continue  # cancelled, replaced, or superseded by an earlier entry
+                if timer.deadline > now:
+                    self._push(timer)  # pushed back since it was queued
+                    continue
+                del self._timers[timer.key]
+                self._fire(timer)
+            timeout = self._heap[0][0] - now if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _fire(self, timer: _Timer) -> None:
+        self.fired += 1
+        try:
+            result = timer.callback(*timer.args)
+        except Exception:
+            logging.exception(f"Error in scheduled callback for {timer.key!r}")
+            return
+        if inspect.isawaitable(result):
+            asyncio.ensure_future(self._await_callback(timer.key, result))
+
+    @staticmethod
+    async def _await_callback(key: Any, awaitable) -> None:
+        try:
+            await awaitable
+        except Exception:
+            logging.exception(f"Error in scheduled callback for {key!r}")
+
+
+scheduler = Scheduler()
@@ -0,0 +1,391 @@
+"""
+Google Sheets sync service.
+Outbox rows written by notify_sheet_update are queued here, coalesced per
+(entity, entity_id) over a short window and pushed to the sheets backend by a
+fixed pool of worker threads, so a burst of updates never fans out into one
+thread (and one API call) per row.
+
+The sheet_update_requests table is the source of truth: a row stays 'pending'
+until the backend accepts it. Failed rows are retried with exponential backoff
+and jitter, and after MAX_ATTEMPTS they are parked as 'dead'. Pending rows left
+over from a previous run are picked up again on start.
+"""
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Payload fields that accumulate when updates are merged instead of last-write-wins
+# (counts are summed, lists such as bulk-added mons are concatenated).
+ADDITIVE_FIELDS = {"increment", "mons"}
+
+MAX_ATTEMPTS = 8
+BACKOFF_BASE = 2.0
+BACKOFF_CAP = 300.0
+# Never-attempted rows younger than this are assumed to be on their way through
+# enqueue() already; the poller only adopts them once they are older.
+ORPHAN_AGE = 60
+
+
+class GoogleSheetsSink:
+    """
+    Delivers merged updates to the Google Sheets backend. Uses the backend's
+    batch entry point when it has one, otherwise sends the updates one by one.
+    """
+
+    def process(self, updates: list) -> None:
+        from Google_Sheets import google_sheets_authentication as sheets
+        process_batch = getattr(sheets, "process_update_batch", None)
+        if process_batch is not None:
+            process_batch(updates)
+        else:
+            for update in updates:
+                sheets.process_update_request(update)
+
+
+class LocalSink:
+    """
+    In-memory stand-in for the sheets backend, for tests and throughput
+    benchmarks. Can simulate per-call latency and a random failure rate.
+    """
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0, seed=None, keep: int = 100):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.written = 0
+        self.recent = deque(maxlen=keep)
+
+    def process(self, updates: list) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.calls += 1
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                raise RuntimeError("LocalSink: simulated failure")
+            self.written += len(updates)
+            self.recent.extend(updates)
+
+
+def backoff_delay(attempts: int) -> float:
+    """Exponential backoff with equal jitter: half the delay is fixed, half random."""
+    delay = min(BACKOFF_CAP, BACKOFF_BASE * (2 ** max(attempts - 1, 0)))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class _PendingUpdate:
+    """All queued outbox rows for one (entity, entity_id), merged per update type."""
+    __slots__ = ("entity", "entity_id", "ids", "changes", "first_seen")
+
+    def __init__(self, entity, entity_id, first_seen: float):
+        self.entity = entity
+        self.entity_id = entity_id
+        self.ids = []
+        self.changes = {}
+        self.first_seen = first_seen
+
+    def merge(self, update: dict) -> None:
+        self.ids.append(update["id"])
+        update_type = update["update_type"]
+        if update_type.endswith("_removed"):
+            # Nothing written before a removal matters any more.
+            self.changes.clear()
+        merged = self.changes.setdefault(update_type, {})
+        for key, value in (update.get("payload") or {}).items():
+            if key in ADDITIVE_FIELDS and key in merged:
+                merged[key] = merged[key] + value
+            else:
+                merged[key] = value
+
+    def to_updates(self) -> list:
+        return [
+            {
+                "id": self.ids[-1],
+                "ids": list(self.ids),
+                "entity": self.entity,
+                "entity_id": self.entity_id,
+                "update_type": update_type,
+                "payload": payload,
+            }
+            for update_type, payload in self.changes.items()
+        ]
+
+
+class SheetSyncService:
+    """
+    Coalescing queue in front of a bounded worker pool.
+
+    enqueue() merges an outbox row into the pending entry for its entity. A
+    dispatcher thread hands entries whose coalescing window has elapsed to the
+    workers, up to `max_batch` entities per sink call. While every worker is
+    busy the dispatcher waits, and new rows keep merging into pending entries.
+    An entity is never processed by two workers at once.
+    """
+
+    def __init__(self, workers: int = 4, coalesce_window: float = 0.5, max_batch: int = 50,
+                 poll_interval: float = 5.0, sink=None):
+        self.workers = workers
+        self.coalesce_window = coalesce_window
+        self.max_batch = max_batch
+        self.poll_interval = poll_interval
+        self.sink = sink or GoogleSheetsSink()
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._in_flight = set()
+        self._queued_ids = set()
+        self._slots = threading.BoundedSemaphore(workers)
+        self._executor = None
+        self._dispatcher = None
+        self._poller = None
+        self._stopped = threading.Event()
+        self._running = False
+        self._counters = {"enqueued": 0, "coalesced": 0, "batches": 0, "writes": 0, "failures": 0,
+                          "retries": 0, "dead": 0}
+
+    # ----------------------------
+    # Lifecycle
+    # ----------------------------
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._stopped.clear()
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sheet-sync")
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="sheet-sync-dispatcher", daemon=True)
+            self._poller = threading.Thread(target=self._poll_loop, name="sheet-sync-outbox", daemon=True)
+            self._dispatcher.start()
+            self._poller.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flushes everything still queued, then shuts the workers down."""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._stopped.set()
+            self._cond.notify_all()
+        self._poller.join(timeout)
+        self._dispatcher.join(timeout)
+        self._executor.shutdown(wait=True)
+
+    # ----------------------------
+    # Producer side
+    # ----------------------------
+    def enqueue(self, update: dict) -> None:
+        key = (update["entity"], update["entity_id"])
+        with self._cond:
+            if update["id"] in self._queued_ids:
+                return
+            self._queued_ids.add(update["id"])
+            entry = self._pending.get(key)
+            if entry is None:
+                entry = self._pending[key] = _PendingUpdate(update["entity"], update["entity_id"], time.monotonic())
+            else:
+                self._counters["coalesced"] += 1
+            entry.merge(update)
+            self._counters["enqueued"] += 1
+            self._cond.notify()
+        if not self._running:
+            self.start()
+
+    def stats(self) -> dict:
+        with self._cond:
+            stats = dict(self._counters)
+            stats["queued"] = len(self._pending)
+            stats["in_flight"] = len(self._in_flight)
+        return stats
+
+    # ----------------------------
+    # Outbox
+    # ----------------------------
+    def recover(self, include_fresh: bool = False) -> int:
+        """
+        Queues pending outbox rows that are due and not already queued.
+        include_fresh also adopts never-attempted rows regardless of age (used
+        on start, when nothing from the previous run is queued in memory).
+        Returns the number of rows queued.
+        """
+        from core.database import iter_rows
+        query = """
+            SELECT id, entity, entity_id, update_type, payload FROM sheet_update_requests
+            WHERE status = 'pending'
+              AND (next_attempt_at <= ?
+                   OR (next_attempt_at IS NULL AND (? OR created_at <= datetime('now', ?))))
+            ORDER BY id
+        """
+        queued = 0
+        # Streamed, so a large backlog after an outage is adopted without loading it all at once.
+        for row in iter_rows(query, (time.time(), int(include_fresh), f"-{ORPHAN_AGE} seconds")):
+            with self._cond:
+                if row["id"] in self._queued_ids:
+                    continue
+            try:
+                payload = json.loads(row["payload"]) if row["payload"] else {}
+            except ValueError:
+                payload = {}
+            self.enqueue({
+                "id": row["id"],
+                "entity": row["entity"],
+                "entity_id": row["entity_id"],
+                "update_type": row["update_type"],
+                "payload": payload,
+            })
+            queued += 1
+        if queued:
+            logging.info(f"Sheet sync queued {queued} outbox row(s) for delivery.")
+        return queued
+
+    def outbox_stats(self) -> dict:
+        """Depth and lag of the durable outbox, plus the dead-letter count."""
+        from core.database import fetch_one
+        row = fetch_one(
+            """
+            SELECT
+                SUM(status = 'pending') AS depth,
+                SUM(status = 'dead') AS dead,
+                (julianday('now') - julianday(MIN(CASE WHEN status = 'pending' THEN created_at END))) * 86400 AS lag
+            FROM sheet_update_requests
+            WHERE status IN ('pending', 'dead')
+            """
+        )
+        return {
+            "depth": (row["depth"] or 0) if row else 0,
+            "dead": (row["dead"] or 0) if row else 0,
+            "lag_seconds": (row["lag"] or 0.0) if row else 0.0,
+        }
+
+    def retry_dead(self) -> int:
+        """Moves dead-lettered rows back to pending for an immediate retry."""
+        from core.database import execute_query
+        cur = execute_query(
+            "UPDATE sheet_update_requests SET status = 'pending', attempts = 0, next_attempt_at = ? "
+            "WHERE status = 'dead'",
+            (time.time(),)
+        )
+        return cur.rowcount
+
+    def _mark_processed(self, ids: list) -> None:
+        from core.database import execute_query
+        placeholders = ", ".join("?" for _ in ids)
+        execute_query(
+            f"UPDATE sheet_update_requests SET status = 'processed', processed_at = CURRENT_TIMESTAMP, "
+            f"error_message = NULL WHERE id IN ({placeholders})",
+            tuple(ids)
+        )
+
+    def _mark_failed(self, ids: list, error: str) -> int:
+        """Schedules the rows for another attempt, or dead-letters them. Returns how many died."""
+        from core.database import fetch_all, transaction
+        dead = 0
+        with transaction() as tx:
+            placeholders = ", ".join("?" for _ in ids)
+            rows = fetch_all(f"SELECT id, attempts FROM sheet_update_requests WHERE id IN ({placeholders})", tuple(ids))
+            for row in rows:
+                attempts = row["attempts"] + 1
+                if attempts >= MAX_ATTEMPTS:
+                    dead += 1
+                    tx.execute(
+                        "UPDATE sheet_update_requests SET status = 'dead', attempts = ?, error_message = ?, "
+                        "next_attempt_at = NULL WHERE id = ?",
+                        (attempts, error, row["id"])
+                    )
+                else:
+                    tx.execute(
+                        "UPDATE sheet_update_requests SET attempts = ?, error_message = ?, next_attempt_at = ? "
+                        "WHERE id = ?",
+                        (attempts, error, time.time() + backoff_delay(attempts), row["id"])
+                    )
+        return dead
+
+    def _poll_loop(self) -> None:
+        include_fresh = True
+        while True:
+            try:
+                self.recover(include_fresh=include_fresh)
+                include_fresh = False
+            except Exception as e:
+                logging.error(f"Sheet sync outbox scan failed: {e}")
+            if self._stopped.wait(self.poll_interval):
+                return
+
+    # ----------------------------
+    # Dispatcher and workers
+    # ----------------------------
+    def _take_due(self, now: float, flush: bool) -> list:
+        batch = []
+        for key, entry in list(self._pending.items()):
+            if len(batch) >= self.max_batch:
+                break
+            if not flush and entry.first_seen + self.coalesce_window > now:
+                # Entries are kept in arrival order, so the rest are newer still.
+                break
+            if key in self._in_flight:
+                continue
+            del self._pending[key]
+            self._in_flight.add(key)
+            batch.append(entry)
+        return batch
+
+    def _next_wait(self, now: float):
+        for key, entry in self._pending.items():
+            if key not in self._in_flight:
+                return max(0.0, entry.first_seen + self.coalesce_window - now)
+        return None
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            self._slots.acquire()
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    batch = self._take_due(now, flush=not self._running)
+                    if batch:
+                        break
+                    if not self._running and not self._pending:
+                        self._slots.release()
+                        return
+                    self._cond.wait(self._next_wait(now) if self._running else 0.05)
+            self._executor.submit(self._process, batch)
+
+    def _process(self, batch: list) -> None:
+        updates = [update for entry in batch for update in entry.to_updates()]
+        ids = [update_id for entry in batch for update_id in entry.ids]
+        dead = 0
+        try:
+            if updates:
+                self.sink.process(updates)
+            outcome = "writes"
+        except Exception as e:
+            logging.error(f"Sheet sync batch of {len(updates)} update(s) failed: {e}")
+            outcome = "failures"
+            try:
+                dead = self._mark_failed(ids, str(e))
+            except Exception as mark_error:
+                logging.error(f"Could not record sheet sync failure: {mark_error}")
+        else:
+            try:
+                self._mark_processed(ids)
+            except Exception as mark_error:
+                # The rows stay pending and will be delivered again; sheet writes are idempotent.
+                logging.error(f"Could not mark sheet updates processed: {mark_error}")
+        finally:
+            with self._cond:
+                for entry in batch:
+                    self._in_flight.discard((entry.entity, entry.entity_id))
+                self._queued_ids.difference_update(ids)
+                self._counters["batches"] += 1
+                self._counters[outcome] += len(updates)
+                if outcome == "failures":
+                    self._counters["retries"] += len(ids) - dead
+                    self._counters["dead"] += dead
+                self._cond.notify()
+            self._slots.release()
+
+
+sheet_sync = SheetSyncService()
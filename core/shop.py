@@ -1,9 +1,10 @@
 import random
 import datetime
 import json
-from core.database import execute_query, fetch_one
+from core.database import execute_query
+from core.database import async_execute_query, async_fetch_one, run_db, transaction
 from core.items import roll_items
-from core.currency import get_currency, add_currency
+from core.currency import debit_currency
 
 def get_today_date():
     return datetime.date.today().isoformat()
@@ -25,9 +26,9 @@ create_generic_shop_table()
 async def roll_generic_shop_items(shop: str, user_id: str, category_filter: str = None, exclude_categories: list = None, default_count_range: tuple = (2, 5)):
     today = get_today_date()
     # Remove any outdated roll for this shop and user
-    execute_query("DELETE FROM generic_shop_rolls WHERE shop=? AND user_id=? AND date<>?", (shop, user_id, today))
+    await async_execute_query("DELETE FROM generic_shop_rolls WHERE shop=? AND user_id=? AND date<>?", (shop, user_id, today))
     # Check if today's roll already exists.
-    row = fetch_one("SELECT items FROM generic_shop_rolls WHERE shop=? AND user_id=? AND date=?", (shop, user_id, today))
+    row = await async_fetch_one("SELECT items FROM generic_shop_rolls WHERE shop=? AND user_id=? AND date=?", (shop, user_id, today))
     if row:
         return json.loads(row[0])
     # Determine number of items to roll
@@ -55,9 +56,24 @@ async def roll_generic_shop_items(shop: str, user_id: str, category_filter: str
             "max_purchase": 9999  # treat None as no limit
         })
     # Store the rolled items for today
-    execute_query("INSERT INTO generic_shop_rolls (shop, user_id, date, items) VALUES (?, ?, ?, ?)", (shop, user_id, today, json.dumps(items)))
+    await async_execute_query("INSERT INTO generic_shop_rolls (shop, user_id, date, items) VALUES (?, ?, ?, ?)", (shop, user_id, today, json.dumps(items)))
     return items
 
+def _debit_purchase(shop: str, user_id: str, items: list, item: dict, quantity: int, total_price: int):
+    """
+    Debits the price and records the purchase count in one commit; runs on the DB executor.
+    Returns the new balance, or None when funds are insufficient (nothing is changed).
+    """
+    with transaction():
+        balance = debit_currency(user_id, total_price, "shop_purchase", f"{shop}:{item['name']}")
+        if balance is None:
+            return None
+        item["purchased"] += quantity
+        new_items_json = json.dumps(items)
+        execute_query("UPDATE generic_shop_rolls SET items=? WHERE shop=? AND user_id=? AND date=?",
+                      (new_items_json, shop, user_id, get_today_date()))
+    return balance
+
 async def purchase_shop_item(ctx, shop: str, item_name: str, quantity: int):
     user_id = str(ctx.author.id)
     items = await roll_generic_shop_items(shop, user_id)
@@ -65,21 +81,15 @@ async def purchase_shop_item(ctx, shop: str, item_name: str, quantity: int):
     for item in items:
         if item["name"].lower() == item_name.lower():
             total_price = item["price"] * quantity
-            # Check currency
-            funds = get_currency(user_id)
-            if funds < total_price:
-                await ctx.send("Insufficient funds.")
-                return
             # Check max purchase limit
             if item["purchased"] + quantity > item["max_purchase"]:
                 await ctx.send("Purchase exceeds the daily limit for this item.")
                 return
-            # Deduct currency and update purchase count
-            add_currency(user_id, -total_price)
-            item["purchased"] += quantity
-            new_items_json = json.dumps(items)
-            execute_query("UPDATE generic_shop_rolls SET items=? WHERE shop=? AND user_id=? AND date=?",
-                            (new_items_json, shop, user_id, get_today_date()))
+            # Check currency, then deduct it and update the purchase count in one commit
+            balance = await run_db(_debit_purchase, shop, user_id, items, item, quantity, total_price)
+            if balance is None:
+                await ctx.send("Insufficient funds.")
+                return
             await ctx.send(f"Successfully purchased {quantity} × **{item_name}**!")
             return
     await ctx.send(f"Item **{item_name}** is not available in the {shop.title()} shop today.")
@@ -0,0 +1,353 @@
+"""
+Species catalog.
+The Pokemon, Digimon and YoKai reference tables are read once into immutable
+records that every roll shares, instead of three full table scans each time a
+pool is built. Records are read-only mappings (record["name"], record.get("stage"))
+with list columns frozen to tuples; code that wants to change a rolled mon works
+on the fresh dict that roll_single_mon returns, never on the catalog itself.
+
+The tables only change when an admin re-imports species data, so the catalog is
+loaded at startup and refreshed explicitly with catalog.reload(). A table that
+fails to load is left empty and the snapshot is marked incomplete; until a
+reload succeeds, mon_origin() declines to answer rather than report "pokemon"
+for species it cannot see.
+
+Everything derived from the records lives on the same versioned snapshot:
+secondary indexes by origin, stage, rank, attribute and type and the
+name -> origins map (built with the snapshot), and named roll pools registered
+with register_pool() (built on first use). The pokemon_babies breeding table
+is loaded alongside the species. A reload starts a new
+snapshot, so derived data is rebuilt once per reload rather than once per roll.
+"""
+import logging
+import threading
+import time
+from types import MappingProxyType
+
+from core.database import fetch_all
+
+
+# Fields with a secondary index. Values are folded with _fold(); every index except
+# "origin" is keyed by (origin, value), since a stage or attribute name means
+# something different for each origin.
+INDEX_FIELDS = ("origin", "stage", "rank", "attribute", "type")
+
+
+def _fold(value) -> str:
+    return str(value or "").strip().lower()
+
+
+def _freeze(entry: dict) -> MappingProxyType:
+    return MappingProxyType({
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in entry.items()
+    })
+
+
+# ----------------------------
+# Table Loaders
+# ----------------------------
+def _load_pokemon() -> tuple:
+    records = []
+    for name, stage, type1, type2 in fetch_all('SELECT "Name", "Stage", "Type1", "Type2" FROM Pokemon'):
+        types = [t.strip() for t in (type1, type2) if t]
+        records.append(_freeze({
+            "name": name,
+            "stage": stage,
+            "types": types,
+            "attribute": "",  # default attribute
+            "origin": "pokemon",
+        }))
+    return tuple(records)
+
+
+def _load_digimon() -> tuple:
+    records = []
+    for name, stage, rarity, kind, attribute in fetch_all(
+        'SELECT "Name", "Stage", "Rarity", "Kind", "Attribute" FROM Digimon'
+    ):
+        records.append(_freeze({
+            "name": name,
+            "stage": stage,
+            "rarity": rarity,
+            "types": [kind.strip()] if kind else [],  # 'kind' is kept as the first type for filtering
+            "attribute": attribute,
+            "origin": "digimon",
+        }))
+    return tuple(records)
+
+
+def _load_yokai() -> tuple:
+    records = []
+    for name, rank, tribe, attribute, stage in fetch_all('SELECT "Name", "Rank", "Tribe", "Attribute", "Stage" FROM YoKai'):
+        records.append(_freeze({
+            "name": name,
+            "rank": rank,
+            "tribe": tribe,
+            "attribute": attribute,
+            "stage": stage,
+            "origin": "yokai",
+        }))
+    return tuple(records)
+
+
+def _load_babies() -> tuple:
+    """(parent species, baby species) pairs from the pokemon_babies table."""
+    return tuple(
+        (parent.strip(), baby.strip())
+        for parent, baby in fetch_all("SELECT parent_species, baby_species FROM pokemon_babies")
+        if parent and baby and baby.strip()
+    )
+
+
+_LOADERS = {
+    "pokemon": _load_pokemon,
+    "digimon": _load_digimon,
+    "yokai": _load_yokai,
+}
+
+
+def _index_keys(record, field: str) -> set:
+    origin = record["origin"]
+    if field == "origin":
+        return {origin}
+    if field == "type":
+        return {(origin, _fold(t)) for t in record.get("types", ()) if t}
+    value = _fold(record.get(field))
+    return {(origin, value)} if value else set()
+
+
+def _build_index(records, field: str) -> dict:
+    index = {}
+    for record in records:
+        for key in _index_keys(record, field):
+            index.setdefault(key, []).append(record)
+    return {key: tuple(bucket) for key, bucket in index.items()}
+
+
+def mon_origin_value(origins) -> str:
+    """
+    The mons.origin column value for a set of origins: "digimon" and/or "yokai"
+    (comma-separated, sorted) when any species has those origins, else "pokemon".
+    """
+    special = sorted(set(origins) & {"digimon", "yokai"})
+    return ",".join(special) if special else "pokemon"
+
+
+class _Snapshot:
+    """One loaded version of the catalog and everything derived from it."""
+    __slots__ = ("version", "species", "failed", "indexes", "origins_by_name", "babies", "baby_names",
+                 "pools", "pool_indexes", "folded_names")
+
+    def __init__(self, version: int, species: dict, babies: tuple = (), failed=()):
+        self.version = version
+        self.species = species
+        self.failed = frozenset(failed)
+        records = [record for origin_records in species.values() for record in origin_records]
+        self.indexes = {field: _build_index(records, field) for field in INDEX_FIELDS}
+        origins_by_name = {}
+        for record in records:
+            origins_by_name.setdefault(_fold(record["name"]), set()).add(record["origin"])
+        self.origins_by_name = {name: frozenset(origins) for name, origins in origins_by_name.items()}
+        self.babies = {}
+        for parent, baby in babies:
+            self.babies.setdefault(_fold(parent), baby)
+        self.baby_names = tuple(baby for _, baby in babies)
+        self.pools = {}
+        self.pool_indexes = {}
+        self.folded_names = {}
+
+
+class SpeciesCatalog:
+    """
+    Thread-safe, load-once holder of the species records by origin.
+    Readers get a consistent snapshot: reload() builds a complete new snapshot
+    and swaps it in at once, so a roll never sees a half-loaded catalog.
+    Derived pools and indexes are cached per snapshot; two threads racing to
+    build the same one produce equal results, so the cache needs no lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._current = None
+        self._pool_builders = {}
+        self.version = 0
+        self.loaded_at = None
+
+    def _snapshot(self) -> _Snapshot:
+        snapshot = self._current
+        if snapshot is None:
+            with self._lock:
+                if self._current is None:
+                    self._load()
+                snapshot = self._current
+        return snapshot
+
+    def _load(self) -> None:
+        # Caller holds the lock. A table that fails to load is left empty rather
+        # than taking the other origins down with it.
+        species = {}
+        failed = []
+        for origin, loader in _LOADERS.items():
+            try:
+                species[origin] = loader()
+            except Exception as e:
+                logging.error(f"Error loading {origin} species data: {e}")
+                species[origin] = ()
+                failed.append(origin)
+        try:
+            babies = _load_babies()
+        except Exception as e:
+            logging.error(f"Error loading pokemon_babies data: {e}")
+            babies = ()
+        self._current = _Snapshot(self.version + 1, species, babies, failed)
+        self.version = self._current.version
+        self.loaded_at = time.time()
+        counts = ", ".join(f"{origin}: {len(records)}" for origin, records in species.items())
+        logging.info(f"Species catalog v{self.version} loaded ({counts}).")
+
+    # ----------------------------
+    # Public API
+    # ----------------------------
+    def load(self) -> None:
+        """Loads the catalog if it has not been loaded yet."""
+        self._snapshot()
+
+    def reload(self) -> dict:
+        """Re-reads every species table and returns the new per-origin counts."""
+        with self._lock:
+            self._load()
+            return {origin: len(records) for origin, records in self._current.species.items()}
+
+    def install(self, species: dict, babies=()) -> None:
+        """
+        Replaces the catalog with the given records (origin -> list of dicts shaped
+        like the table loaders' output, plus (parent, baby) species pairs) instead of
+        reading the database. Used by simulations and benchmarks that run against a
+        synthetic catalog.
+        """
+        with self._lock:
+            frozen = {origin: tuple(_freeze(dict(record)) for record in species.get(origin, ()))
+                      for origin in _LOADERS}
+            self._current = _Snapshot(self.version + 1, frozen, tuple(babies))
+            self.version = self._current.version
+            self.loaded_at = time.time()
+
+    @property
+    def complete(self) -> bool:
+        """False while any species table failed to load in the current snapshot."""
+        return not self._snapshot().failed
+
+    def records(self, origin: str) -> tuple:
+        """All records of one origin ("pokemon", "digimon" or "yokai")."""
+        return self._snapshot().species[origin]
+
+    @property
+    def pokemon(self) -> tuple:
+        return self.records("pokemon")
+
+    @property
+    def digimon(self) -> tuple:
+        return self.records("digimon")
+
+    @property
+    def yokai(self) -> tuple:
+        return self.records("yokai")
+
+    def origins_of(self, name: str) -> frozenset:
+        """Every origin with a species of this name (case-insensitive); empty if unknown."""
+        return self._snapshot().origins_by_name.get(_fold(name), frozenset())
+
+    def mon_origin(self, names):
+        """
+        The mons.origin value for a mon with these species names (see mon_origin_value),
+        or None while the catalog is incomplete, since a species from a table that
+        failed to load would otherwise be reported as "pokemon".
+        """
+        snapshot = self._snapshot()
+        if snapshot.failed:
+            return None
+        origins_by_name = snapshot.origins_by_name
+        origins = set()
+        for name in names:
+            if name:
+                origins |= origins_by_name.get(_fold(name), frozenset())
+        return mon_origin_value(origins)
+
+    def baby_species(self, parent: str):
+        """The baby species listed for a parent species in pokemon_babies, or None."""
+        return self._snapshot().babies.get(_fold(parent))
+
+    @property
+    def baby_names(self) -> tuple:
+        """Every baby species in pokemon_babies, in table order."""
+        return self._snapshot().baby_names
+
+    def register_pool(self, name: str, build) -> None:
+        """
+        Registers how to build a named pool: build(species) returns its members,
+        where `species` maps origin -> records of one snapshot. It runs once per
+        catalog version, the first time the pool is asked for.
+        """
+        self._pool_builders[name] = build
+
+    def pool(self, name: str) -> tuple:
+        """The records of a registered pool for the current catalog version."""
+        return self._pool(self._snapshot(), name)
+
+    def _pool(self, snapshot: _Snapshot, name: str) -> tuple:
+        pool = snapshot.pools.get(name)
+        if pool is None:
+            pool = snapshot.pools[name] = tuple(self._pool_builders[name](snapshot.species))
+        return pool
+
+    def lookup(self, field: str, value: str, origin: str = None, pool: str = None) -> tuple:
+        """
+        Records whose `field` matches `value` (case-insensitively), optionally
+        limited to one origin and/or to the members of a registered pool.
+        For field="origin", `value` is the origin itself.
+        """
+        snapshot = self._snapshot()
+        if pool is None:
+            index = snapshot.indexes[field]
+        else:
+            index = snapshot.pool_indexes.get((pool, field))
+            if index is None:
+                index = snapshot.pool_indexes[(pool, field)] = _build_index(self._pool(snapshot, pool), field)
+        if field == "origin":
+            return index.get(value, ())
+        value = _fold(value)
+        if origin is not None:
+            return index.get((origin, value), ())
+        matches = ()
+        for other in snapshot.species:
+            matches += index.get((other, value), ())
+        return matches
+
+    def narrow(self, records, field: str, value: str, origin: str = None) -> list:
+        """Keeps the records (from any pool or list) that lookup() would return, in order."""
+        keep = {id(record) for record in self.lookup(field, value, origin=origin)}
+        return [record for record in records if id(record) in keep]
+
+    def folded_names(self, pool: str) -> tuple:
+        """Lower-cased names of a registered pool's members, in pool order, for substring searches."""
+        snapshot = self._snapshot()
+        names = snapshot.folded_names.get(pool)
+        if names is None:
+            names = snapshot.folded_names[pool] = tuple(_fold(record["name"]) for record in self._pool(snapshot, pool))
+        return names
+
+    def stats(self) -> dict:
+        snapshot = self._current
+        species = snapshot.species if snapshot else {}
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "failed": sorted(snapshot.failed) if snapshot else [],
+            "pools": len(snapshot.pools) if snapshot else 0,
+            "babies": len(snapshot.babies) if snapshot else 0,
+            **{origin: len(species.get(origin, ())) for origin in _LOADERS},
+        }
+
+
+catalog = SpeciesCatalog()
@@ -1,28 +1,31 @@
 import asyncio
 import logging
-from core.database import cursor, db, update_trainer_field
-from core.database import fetch_trainer_by_name
+from core.database import execute_query, fetch_one, fetch_all, update_trainer_field
+from core.database import invalidate_trainer_identity, transaction
+from core.database import fetch_trainer_by_name, fetch_trainers, fetch_mons, iter_trainers
+
+# Fields shown by trainer pickers and listings.
+TRAINER_LIST_COLUMNS = ("id", "character_name", "level", "main_ref", "user_id")
 
 def get_trainers(user_id: str) -> list:
     """
     Retrieves all trainer records for the given user.
     """
-    cursor.execute("SELECT id, character_name, level, main_ref, player_user_id FROM trainers WHERE player_user_id = ?", (user_id,))
-    rows = cursor.fetchall()
-    return [{"id": row[0], "character_name": row[1], "level": row[2], "main_ref": row[3], "player_user_id": row[4]} for row in rows]
+    return fetch_trainers("player_user_id = ?", (user_id,), TRAINER_LIST_COLUMNS)
 
 def get_other_trainers_from_db(user_id: str) -> list:
-    cursor.execute("SELECT id, character_name, level, main_ref, player_user_id FROM trainers WHERE player_user_id != ?", (user_id,))
-    rows = cursor.fetchall()
-    return [{"id": row[0], "character_name": row[1], "level": row[2], "main_ref": row[3], "player_user_id": row[4]} for row in rows]
+    return fetch_trainers("player_user_id != ?", (user_id,), TRAINER_LIST_COLUMNS)
 
 def add_trainer(user_id: str, name: str, level: int = 1, main_ref: str = ""):
-    cursor.execute("INSERT INTO trainers (player_user_id, character_name, level, main_ref) VALUES (?, ?, ?, ?)", (user_id, name, level, main_ref))
-    db.commit()
+    execute_query("INSERT INTO trainers (player_user_id, character_name, level, main_ref) VALUES (?, ?, ?, ?)", (user_id, name, level, main_ref))
 
 def delete_trainer(user_id: str, trainer_name: str):
-    cursor.execute("DELETE FROM trainers WHERE player_user_id = ? AND LOWER(name) = ?", (user_id, trainer_name.lower()))
-    db.commit()
+    with transaction():
+        rows = fetch_all("SELECT id FROM trainers WHERE player_user_id = ? AND LOWER(character_name) = ?",
+                         (user_id, trainer_name.lower()))
+        for row in rows:
+            execute_query("DELETE FROM trainers WHERE id = ?", (row["id"],))
+            invalidate_trainer_identity(row["id"])
 
 def update_trainer(trainer_id: int, **kwargs):
     if not kwargs:
@@ -34,13 +37,13 @@ def update_trainer(trainer_id: int, **kwargs):
         values.append(value)
     values.append(trainer_id)
     query = "UPDATE trainers SET " + ", ".join(fields) + " WHERE id = ?"
-    cursor.execute(query, tuple(values))
-    db.commit()
+    execute_query(query, tuple(values))
+    if "character_name" in kwargs:
+        invalidate_trainer_identity(trainer_id)
 
 async def assign_levels_to_trainer(interaction, trainer_name: str, levels: int):
     user_id = str(interaction.user.id)
-    cursor.execute("SELECT id, level FROM trainers WHERE player_user_id = ? AND LOWER(name)=?", (user_id, trainer_name.lower()))
-    row = cursor.fetchone()
+    row = fetch_one("SELECT id, level FROM trainers WHERE player_user_id = ? AND LOWER(name)=?", (user_id, trainer_name.lower()))
     if not row:
         await interaction.response.send_message(f"Trainer '{trainer_name}' not found. Please add the trainer first.", ephemeral=True)
         return
@@ -52,35 +55,14 @@ async def assign_levels_to_trainer(interaction, trainer_name: str, levels: int):
         ephemeral=True
     )
 
-def get_all_trainers() -> list:
+def get_all_trainers():
     """
-    Retrieves all trainers from the database.
+    Streams all trainers from the database as Trainer records.
     """
-    cursor.execute("SELECT id, character_name, level, main_ref, player_user_id FROM trainers")
-    rows = cursor.fetchall()
-    return [{"id": row[0], "character_name": row[1], "level": row[2], "main_ref": row[3], "player_user_id": row[4]} for row in rows]
+    return iter_trainers(columns=TRAINER_LIST_COLUMNS)
 
 def get_mons_for_trainer_dict(trainer_id: int) -> list:
     """
-    Retrieves all mons for the given trainer as a list of dictionaries.
-    """
-    query = """
-        SELECT id, mon_name, level, species1, species2, species3, main_ref 
-        FROM mons 
-        WHERE trainer_id = ?
+    Retrieves all mons for the given trainer as Mon records.
     """
-    cursor.execute(query, (trainer_id,))
-    rows = cursor.fetchall()
-    mons = []
-    for row in rows:
-        mon = {
-            "id": row[0],
-            "mon_name": row[1],
-            "level": row[2],
-            "species1": row[3] if row[3] is not None else "",
-            "species2": row[4] if row[4] is not None else "",
-            "species3": row[5] if row[5] is not None else "",
-            "main_ref": row[6] if row[6] is not None else ""
-        }
-        mons.append(mon)
-    return mons
+    return fetch_mons("trainer_id = ?", (trainer_id,), ("id", "name", "level", "species1", "species2", "species3", "img_link"))
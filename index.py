@@ -1,7 +1,12 @@
 import discord
 from discord.ext import commands
-#from logic.adventure import active_adventure_sessions
+from logic.adventure import active_adventure_sessions, restore_adventure_sessions
 from core import config
+from core.database import create_tables, backfill_mon_origins
+from core.sheet_sync import sheet_sync
+from core.scheduler import scheduler
+from core.species_catalog import catalog
+import asyncio
 import logging
 
 # Import all views
@@ -12,7 +17,7 @@ from views.schedule import ScheduleMenuView
 from views.submissions import SubmissionTypeView
 from views.mission import MissionSelectView
 from views.adventure import AdventureView
-from views.gamecorner import GameCornerDurationView
+from views.gamecorner import GameCornerDurationView, restore_gamecorner_sessions
 from views.boss import BossUIView
 from views.AdminActions.Overall import AdminActionsView
 
@@ -25,6 +30,24 @@ intents.message_content = True
 intents.members = True
 
 class MyBot(commands.Bot):
+    sessions_restored = False
+
+    async def setup_hook(self):
+        # Create base tables and apply pending schema migrations before connecting.
+        create_tables()
+        # Read the species reference tables once; rolls share the in-memory catalog.
+        catalog.load()
+        # Fill mons.origin left NULL (older rows, or saved while a species table failed to load).
+        backfill_mon_origins()
+        # Start sheet sync; it also re-queues outbox rows left pending by the last run.
+        sheet_sync.start()
+
+    async def close(self):
+        # Flush queued sheet updates before disconnecting.
+        await asyncio.get_running_loop().run_in_executor(None, sheet_sync.stop)
+        await scheduler.stop()
+        await super().close()
+
     async def on_ready(self):
         logging.info(f"Logged in as {self.user.name}")
         try:
@@ -33,6 +56,20 @@ class MyBot(commands.Bot):
             logging.error(f"Error syncing command tree: {e}")
         logging.info("Bot is ready!")
 
+        # Resume adventures and game corner sessions that were in progress before the
+        # restart (once; on_ready fires again on every reconnect). Channels are only
+        # resolvable from here on.
+        if not self.sessions_restored:
+            self.sessions_restored = True
+            try:
+                await asyncio.wait_for(restore_adventure_sessions(self), timeout=30)
+            except Exception as e:
+                logging.error(f"Error restoring adventure sessions: {e}")
+            try:
+                await restore_gamecorner_sessions(self)
+            except Exception as e:
+                logging.error(f"Error restoring game corner sessions: {e}")
+
         # Create persistent view instances and add them to the bot.
         views = [
             MainMenuView(),
@@ -1,10 +1,14 @@
 import asyncio
+import functools
+import json
 import logging
 import random
+import time
 from typing import Dict, Any, Optional
 
 import discord
-from core.database import save_session, update_session, delete_session
+from core.database import run_db, aiter_rows, save_session, update_session, delete_session
+from core.scheduler import scheduler
 from core.rollmons import roll_single_mon
 from core.trainer import assign_levels_to_trainer
 from core.mon import assign_levels_to_mon
@@ -12,44 +16,114 @@ from core.mon import assign_levels_to_mon
 # Global in-memory store for active adventure sessions
 active_adventure_sessions: Dict[int, "AdventureSession"] = {}
 
+# Sessions are written behind: changes mark the session dirty and are flushed
+# to adventure_sessions at most once per this many seconds (and on end).
+SESSION_FLUSH_INTERVAL = 10
+HARD_MODE_TIMEOUT = 900  # 15 minutes without a message ends a hard-mode adventure
+
+
+@functools.lru_cache(maxsize=1)
+def load_adventures() -> Dict[str, Any]:
+    with open("data/adventures.JSON", "r") as f:
+        return json.load(f)
+
+
+def get_area_data(region: str, area: str) -> Dict[str, Any]:
+    """Looks up an area block in adventures.JSON by its region and area keys."""
+    return load_adventures().get(region, {}).get("areas", {}).get(area, {})
+
+
 class AdventureSession:
     """
     Represents an active adventure session in a designated Discord channel.
+    State lives in memory; the database copy stores only the region/area keys and
+    counters, and is refreshed by a debounced flush rather than on every message.
     """
-    def __init__(self, channel: discord.TextChannel, area_data: Dict[str, Any], hard_mode: bool = False) -> None:
+    def __init__(self, channel: discord.TextChannel, area_data: Dict[str, Any], hard_mode: bool = False,
+                 region: Optional[str] = None, area: Optional[str] = None,
+                 state: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Starts a new session, or, when `state` (a stored snapshot) is given, resumes
+        one after a restart without writing it again.
+        """
         self.channel: discord.TextChannel = channel
         self.area_data: Dict[str, Any] = area_data
+        self.region: Optional[str] = region
+        self.area: Optional[str] = area
         self.hard_mode: bool = hard_mode
         self.progress: int = 0
         self.encounters_triggered: int = 0
         self.max_encounters: int = 3
         self.players: set[str] = set()  # store user IDs as strings
-        self.timer_task: Optional[asyncio.Task] = None
+        self.timer_deadline: Optional[float] = None  # wall-clock time the hard-mode timer fires
+        self._dirty: bool = False
         self.sudden_death_messages = [
             "Time's up! Your adventure ends in sudden death!",
             "You took too long... fate has intervened!",
             "No response for too long; your adventure meets a grim end."
         ]
+        if state is not None:
+            self.progress = state.get("progress", 0)
+            self.encounters_triggered = state.get("encounters_triggered", 0)
+            self.max_encounters = state.get("max_encounters", 3)
+            self.players = set(state.get("players", []))
+            active_adventure_sessions[self.channel.id] = self
+            if self.hard_mode:
+                deadline = state.get("timer_deadline") or time.time() + HARD_MODE_TIMEOUT
+                self.reset_timer(max(deadline - time.time(), 0))
+            logging.info(f"Adventure session restored in channel {self.channel.id} with hard_mode={self.hard_mode}")
+            return
+        if self.hard_mode:
+            self.reset_timer()
         # Save session to database and add to active sessions
-        save_session(self)
+        save_session(self.channel.id, self.snapshot())
         active_adventure_sessions[self.channel.id] = self
         logging.info(f"Adventure session created in channel {self.channel.id} with hard_mode={self.hard_mode}")
-        if self.hard_mode:
-            self.reset_timer()
 
-    def reset_timer(self) -> None:
-        if self.timer_task:
-            self.timer_task.cancel()
-        self.timer_task = asyncio.create_task(self.start_timer())
+    def snapshot(self) -> Dict[str, Any]:
+        """The persisted form of the session: area keys and counters, not the area block."""
+        return {
+            "region": self.region,
+            "area": self.area,
+            "hard_mode": self.hard_mode,
+            "progress": self.progress,
+            "encounters_triggered": self.encounters_triggered,
+            "max_encounters": self.max_encounters,
+            "players": sorted(self.players),
+            "timer_deadline": self.timer_deadline
+        }
+
+    def mark_dirty(self) -> None:
+        """Schedules a flush unless one is already pending."""
+        self._dirty = True
+        key = ("adventure_flush", self.channel.id)
+        if scheduler.remaining(key) is None:
+            scheduler.schedule(key, SESSION_FLUSH_INTERVAL, self.flush)
 
-    async def start_timer(self) -> None:
+    async def flush(self) -> None:
+        """Writes the session to the database if it changed since the last write."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        # Snapshot on the event loop; only the write runs on the DB executor.
+        state = self.snapshot()
         try:
-            await asyncio.sleep(900)  # 15 minutes
-            sudden_message = random.choice(self.sudden_death_messages)
-            await self.channel.send(sudden_message)
-            await self.end_adventure()
-        except asyncio.CancelledError:
-            pass
+            await run_db(update_session, self.channel.id, state)
+        except Exception as e:
+            self._dirty = True
+            logging.error(f"Error saving adventure session in channel {self.channel.id}: {e}")
+
+    def reset_timer(self, delay: float = HARD_MODE_TIMEOUT) -> None:
+        """Arms the sudden-death timer, or pushes an armed one back to `delay` from now."""
+        self.timer_deadline = time.time() + delay
+        key = ("adventure_timeout", self.channel.id)
+        if not scheduler.reschedule(key, delay):
+            scheduler.schedule(key, delay, self.sudden_death)
+
+    async def sudden_death(self) -> None:
+        sudden_message = random.choice(self.sudden_death_messages)
+        await self.channel.send(sudden_message)
+        await self.end_adventure()
 
     async def handle_message(self, message: discord.Message) -> None:
         logging.info(f"Handling message from {message.author} in channel {message.channel.id}: {message.content}")
@@ -58,7 +132,8 @@ class AdventureSession:
         if content == "end":
             await self.channel.send("Adventure ended by player command.")
             await self.end_adventure()
-        elif content == "next":
+            return
+        if content == "next":
             if self.encounters_triggered < self.max_encounters:
                 encounters = self.area_data.get("encounters", [])
                 if encounters:
@@ -76,20 +151,57 @@ class AdventureSession:
         else:
             word_count = len(content.split())
             self.progress += word_count
-            update_session(self)
             await self.channel.send(f"Progress updated: total words = {self.progress}")
+        self.mark_dirty()
         if self.hard_mode:
             self.reset_timer()
 
     async def end_adventure(self) -> None:
-        if self.timer_task:
-            self.timer_task.cancel()
+        scheduler.cancel(("adventure_timeout", self.channel.id))
+        scheduler.cancel(("adventure_flush", self.channel.id))
+        # Persist the final tally before the (slow, interactive) reward round.
+        await self.flush()
         await self.channel.send("Adventure session has ended. Processing rewards...")
         await finalize_adventure_rewards(self)
-        delete_session(self.channel.id)
+        await run_db(delete_session, self.channel.id)
         active_adventure_sessions.pop(self.channel.id, None)
         logging.info(f"Adventure session in channel {self.channel.id} ended.")
 
+async def restore_adventure_sessions(client: discord.Client) -> int:
+    """
+    Rebuilds active_adventure_sessions from adventure_sessions after a restart.
+    Rows whose channel no longer exists are dropped. Returns the number restored.
+    """
+    restored = 0
+    stale = []
+    async for row in aiter_rows("SELECT channel_id, data FROM adventure_sessions"):
+        channel_id = row["channel_id"]
+        if channel_id in active_adventure_sessions:
+            continue
+        channel = client.get_channel(channel_id)
+        if channel is None:
+            stale.append(channel_id)
+            continue
+        try:
+            state = json.loads(row["data"]) if row["data"] else {}
+        except ValueError:
+            logging.error(f"Unreadable adventure session for channel {channel_id}; dropping it.")
+            stale.append(channel_id)
+            continue
+        # Rows written before sessions stored area keys carry the whole area block.
+        area_data = state.get("area_data") or get_area_data(state.get("region"), state.get("area"))
+        session = AdventureSession(channel, area_data, hard_mode=state.get("hard_mode", False),
+                                   region=state.get("region"), area=state.get("area"), state=state)
+        if "area_data" in state:
+            session.mark_dirty()
+        restored += 1
+    for channel_id in stale:
+        await run_db(delete_session, channel_id)
+    if restored or stale:
+        logging.info(f"Restored {restored} adventure session(s); dropped {len(stale)} stale.")
+    return restored
+
+
 async def finalize_adventure_rewards(session: AdventureSession) -> None:
     logging.info("Finalizing adventure rewards...")
     total_word_count = session.progress
@@ -1,7 +1,8 @@
 import discord
 from core.currency import add_currency
-from core.database import fetch_one, execute_query
-from core.database import update_character_level, update_mon_img_link
+from core.database import execute_query, fetch_one
+from core.database import run_db, transaction, request_scoped
+from core.database import update_character_level, _update_character_level, _update_mon_img_link
 from core.database import add_item  # (alias for update_character_sheet_item)
 
 # Bonus mapping for art submissions.
@@ -20,6 +21,28 @@ BONUS_VALUES = {
 }
 
 # ---------------- Reference Art ----------------
+def _apply_reference_art(trainer_id: int, trainer_name: str, player_id: str, mon_name: str, image_link: str):
+    """
+    Writes a reference art reward; runs on the DB executor. The image link, levels
+    and coins are awarded together or not at all. Returns an error message, or None.
+    """
+    with transaction() as tx:
+        if not _update_mon_img_link(trainer_name, mon_name, image_link):
+            tx.abort()
+            return "Error updating image link."
+
+        execute_query("UPDATE mons SET img_link = ? WHERE mon_name = ? AND trainer_id = ?",
+                      (image_link, mon_name, trainer_id))
+
+        if not _update_character_level(trainer_name, mon_name, 6):
+            tx.abort()
+            return "Failed to update mon's level in the sheet."
+        execute_query("UPDATE mons SET level = level + 6 WHERE mon_name = ? AND trainer_id = ?",
+                      (mon_name, trainer_id))
+        add_currency(player_id, 200, "reference_art", mon_name)
+    return None
+
+@request_scoped
 async def process_reference_art(interaction: discord.Interaction, mon_name: str, image_link: str) -> str:
     """
     Processes a reference art submission by:
@@ -36,19 +59,9 @@ async def process_reference_art(interaction: discord.Interaction, mon_name: str,
         return "Trainer not found for that mon."
     trainer_name = trainer_row[0]
 
-    img_update_error = await update_mon_img_link(trainer_name, mon_name, image_link)
-    if img_update_error:
-        return f"Error updating image link: {img_update_error}"
-
-    execute_query("UPDATE mons SET img_link = ? WHERE mon_name = ? AND trainer_id = ?",
-                  (image_link, mon_name, trainer_id))
-
-    update_success = await update_character_level(trainer_name, mon_name, 6)
-    if not update_success:
-        return "Failed to update mon's level in the sheet."
-    execute_query("UPDATE mons SET level = level + 6 WHERE mon_name = ? AND trainer_id = ?",
-                  (mon_name, trainer_id))
-    add_currency(player_id, 200)
+    error = await run_db(_apply_reference_art, trainer_id, trainer_name, player_id, mon_name, image_link)
+    if error:
+        return error
 
     return (f"Reference art submitted successfully! {mon_name} has been updated: "
             f"+6 levels and 200 coins awarded.")
@@ -89,7 +102,7 @@ async def process_other_art(interaction: discord.Interaction, selected_bonuses:
     success = await update_character_level(recipient, recipient, total_levels)
     if not success:
         return "Failed to update the recipient's sheet with the new levels."
-    add_currency(str(interaction.user.id), coins)
+    add_currency(str(interaction.user.id), coins, "art_submission")
     return f"Other art submitted! {total_levels} levels awarded to {recipient} and {coins} coins granted."
 
 class OtherArtRecipientModal(discord.ui.Modal, title="Specify Recipient for Other Art"):
@@ -109,7 +122,7 @@ class OtherArtRecipientModal(discord.ui.Modal, title="Specify Recipient for Othe
             await interaction.response.send_message("Failed to update recipient's sheet.", ephemeral=True)
         else:
             from core.currency import add_currency
-            add_currency(str(interaction.user.id), coins)
+            add_currency(str(interaction.user.id), coins, "art_submission")
             await interaction.response.send_message(
                 f"Other art submitted! {total_levels} levels awarded to {recipient} and {coins} coins granted.",
                 ephemeral=True
@@ -168,7 +181,7 @@ async def launch_bonus_view(interaction: discord.Interaction, art_type: str, par
                            f"and {coins} coins awarded.")
                 else:
                     msg = (f"Other art submission: {total_levels} levels awarded and {coins} coins granted.")
-                add_currency(str(interaction.user.id), coins)
+                add_currency(str(interaction.user.id), coins, "art_submission")
                 if not interaction.response.is_done():
                     await interaction.response.send_message(msg, ephemeral=True)
                 else:
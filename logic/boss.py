@@ -5,7 +5,8 @@ Handles active boss retrieval, damage processing, reward distribution, and boss
 import random
 import asyncio
 from typing import Optional
-from core.database import execute_query, fetch_one, fetch_all
+from core.database import execute_query, fetch_one
+from core.database import async_execute_query, async_fetch_one, async_fetch_all, run_db, transaction
 from core.currency import add_currency
 import logging
 
@@ -50,14 +51,14 @@ EXTRA_TAUNT_MESSAGES = [
 ]
 
 async def deal_boss_damage(user_id: str, damage_amount: int, bot=None, channel=None) -> None:
-    boss = get_active_boss()
+    boss = await run_db(get_active_boss)
     if not boss:
         if channel:
             await channel.send("No active boss to attack!")
         return
     new_health = max(0, boss["current_health"] - damage_amount)
-    execute_query("UPDATE boss SET current_health = ? WHERE id = ?", (new_health, boss["id"]))
-    execute_query(
+    await async_execute_query("UPDATE boss SET current_health = ? WHERE id = ?", (new_health, boss["id"]))
+    await async_execute_query(
         "INSERT INTO boss_damage (boss_id, user_id, damage) VALUES (?, ?, ?)",
         (boss["id"], user_id, damage_amount)
     )
@@ -73,32 +74,42 @@ async def deal_boss_damage(user_id: str, damage_amount: int, bot=None, channel=N
     if new_health <= 0:
         await finalize_boss_defeat(boss["id"], bot=bot, channel=channel)
 
+def _distribute_boss_rewards(boss_id: int, damage_rows: list, total_damage: int) -> None:
+    # All payouts and the boss reset commit as one unit.
+    with transaction():
+        for entry in damage_rows:
+            uid, dmg = entry["user_id"], entry["damage"]
+            fraction = dmg / total_damage
+            base_levels, base_coins = 1, 100
+            extra_levels = base_levels + int(round(4 * fraction))
+            extra_coins = base_coins + int(round(400 * fraction))
+            add_currency(uid, extra_coins, "boss_defeat", boss_id)
+            execute_query(
+                "INSERT INTO boss_rewards (boss_id, user_id, levels, coins, claimed) VALUES (?, ?, ?, ?, 0)",
+                (boss_id, uid, extra_levels, extra_coins)
+            )
+        end_current_boss()
+
 async def finalize_boss_defeat(boss_id: int, bot=None, channel=None) -> None:
-    row = fetch_one("SELECT SUM(damage) AS total FROM boss_damage WHERE boss_id = ?", (boss_id,))
+    row = await async_fetch_one("SELECT SUM(damage) AS total FROM boss_damage WHERE boss_id = ?", (boss_id,))
     total_damage = row["total"] or 1
-    damage_rows = fetch_all("SELECT user_id, damage FROM boss_damage WHERE boss_id = ?", (boss_id,))
+    damage_rows = await async_fetch_all("SELECT user_id, damage FROM boss_damage WHERE boss_id = ?", (boss_id,))
     if not damage_rows:
-        end_current_boss()
+        await run_db(end_current_boss)
         if channel:
             await channel.send("Boss defeated but no damage recorded!")
         return
-    for entry in damage_rows:
-        uid, dmg = entry["user_id"], entry["damage"]
-        fraction = dmg / total_damage
-        base_levels, base_coins = 1, 100
-        extra_levels = base_levels + int(round(4 * fraction))
-        extra_coins = base_coins + int(round(400 * fraction))
-        add_currency(uid, extra_coins)
-        execute_query(
-            "INSERT INTO boss_rewards (boss_id, user_id, levels, coins, claimed) VALUES (?, ?, ?, ?, 0)",
-            (boss_id, uid, extra_levels, extra_coins)
-        )
-    end_current_boss()
+    await run_db(_distribute_boss_rewards, boss_id, damage_rows, total_damage)
     if channel:
         await channel.send("**The boss has been defeated!** Rewards have been distributed.")
 
+def _claim_boss_rewards(user_id: str, total_coins: int) -> None:
+    with transaction():
+        add_currency(user_id, total_coins, "boss_reward_claim")
+        execute_query("UPDATE boss_rewards SET claimed = 1 WHERE user_id = ? AND claimed = 0", (user_id,))
+
 async def claim_boss_rewards(user_id: str) -> str:
-    row = fetch_one(
+    row = await async_fetch_one(
         """
         SELECT boss_id, SUM(levels) AS total_levels, SUM(coins) AS total_coins
         FROM boss_rewards
@@ -113,10 +124,9 @@ async def claim_boss_rewards(user_id: str) -> str:
     total_levels = int(row["total_levels"] or 0)
     total_coins = int(row["total_coins"] or 0)
     if total_levels <= 0 and total_coins <= 0:
-        execute_query("UPDATE boss_rewards SET claimed = 1 WHERE user_id = ? AND claimed = 0", (user_id,))
+        await async_execute_query("UPDATE boss_rewards SET claimed = 1 WHERE user_id = ? AND claimed = 0", (user_id,))
         return "No meaningful rewards found. Marked as claimed."
-    add_currency(user_id, total_coins)
-    execute_query("UPDATE boss_rewards SET claimed = 1 WHERE user_id = ? AND claimed = 0", (user_id,))
+    await run_db(_claim_boss_rewards, user_id, total_coins)
     return f"Claimed rewards: {total_levels} levels and {total_coins} coins."
 
 def reset_boss(name: str, max_health: int, image_link: str, flavor_text: str) -> None:
@@ -128,9 +138,9 @@ def reset_boss(name: str, max_health: int, image_link: str, flavor_text: str) ->
     execute_query(query, (name, max_health, max_health, image_link, flavor_text))
 
 async def force_kill_boss(bot=None, channel=None) -> str:
-    boss = get_active_boss()
+    boss = await run_db(get_active_boss)
     if boss and boss["current_health"] > 0:
-        execute_query("UPDATE boss SET current_health = 0 WHERE id = ?", (boss["id"],))
+        await async_execute_query("UPDATE boss SET current_health = 0 WHERE id = ?", (boss["id"],))
         await finalize_boss_defeat(boss["id"], bot=bot, channel=channel)
         return f"Boss '{boss['name']}' has been force killed."
     return "No active boss to force kill."
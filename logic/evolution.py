@@ -3,7 +3,7 @@ from discord.ui import Select, Modal, TextInput, Button, View
 from typing import List, Optional
 from logic.market.witchs_hut import evolve_mon
 from core.trainer import get_trainers
-from core.database import fetch_all
+from core.database import fetch_mons, request_scoped
 
 EVOLUTION_ITEMS: List[str] = [
     "Normal Evolution Stone", "Fire Evolution Stone", "Fighting Evolution Stone", "Water Evolution Stone",
@@ -15,19 +15,8 @@ EVOLUTION_ITEMS: List[str] = [
     "Digital Repair Mode"
 ]
 
-def get_full_mons_for_trainer(trainer_id: int) -> List[dict]:
-    rows = fetch_all("SELECT mon_id, mon_name, species1, species2, species3, trainer_id FROM mons WHERE trainer_id = ?", (trainer_id,))
-    return [
-        {
-            "id": row["mon_id"],
-            "mon_name": row["mon_name"],
-            "species1": row["species1"] or "",
-            "species2": row["species2"] or "",
-            "species3": row["species3"] or "",
-            "trainer_id": row["trainer_id"]
-        }
-        for row in rows
-    ]
+def get_full_mons_for_trainer(trainer_id: int) -> list:
+    return fetch_mons("trainer_id = ?", (trainer_id,), ("id", "name", "species1", "species2", "species3", "trainer_id"))
 
 class EvolutionFlowView(View):
     """
@@ -47,14 +36,16 @@ class EvolutionFlowView(View):
     class TrainerSelect(Select):
         def __init__(self, parent_view: 'EvolutionFlowView') -> None:
             self.parent_view = parent_view
-            trainers = get_trainers(parent_view.user_id)
-            options = [discord.SelectOption(label=t["name"], value=str(t["id"])) for t in trainers]
+            # Keep the rows the options were built from; the callback picks from them.
+            self.trainers = get_trainers(parent_view.user_id)
+            options = [discord.SelectOption(label=t["name"], value=str(t["id"])) for t in self.trainers]
             super().__init__(placeholder="Select your trainer", min_values=1, max_values=1, options=options)
 
+        @request_scoped
         async def callback(self, interaction: discord.Interaction) -> None:
             trainer_id = int(self.values[0])
             self.parent_view.selected_trainer = next(
-                t for t in get_trainers(self.parent_view.user_id) if t["id"] == trainer_id
+                t for t in self.trainers if t["id"] == trainer_id
             )
             self.parent_view.clear_items()
             self.parent_view.add_item(self.parent_view.MonSelect(self.parent_view))
@@ -66,14 +57,14 @@ class EvolutionFlowView(View):
     class MonSelect(Select):
         def __init__(self, parent_view: 'EvolutionFlowView') -> None:
             self.parent_view = parent_view
-            mons = get_full_mons_for_trainer(parent_view.selected_trainer["id"])
-            options = [discord.SelectOption(label=mon["mon_name"], value=str(mon["id"])) for mon in mons]
+            self.mons = get_full_mons_for_trainer(parent_view.selected_trainer["id"])
+            options = [discord.SelectOption(label=mon["mon_name"], value=str(mon["id"])) for mon in self.mons]
             super().__init__(placeholder="Select a mon to evolve", min_values=1, max_values=1, options=options)
 
         async def callback(self, interaction: discord.Interaction) -> None:
             mon_id = int(self.values[0])
             self.parent_view.selected_mon = next(
-                m for m in get_full_mons_for_trainer(self.parent_view.selected_trainer["id"]) if m["id"] == mon_id
+                m for m in self.mons if m["id"] == mon_id
             )
             self.parent_view.clear_items()
             self.parent_view.add_item(self.parent_view.ItemSelect(self.parent_view))
@@ -152,6 +143,7 @@ class EvolutionFlowView(View):
             self.parent_view = parent_view
             super().__init__(label="Confirm Evolution", style=discord.ButtonStyle.primary, custom_id="confirm_evolution")
 
+        @request_scoped
         async def callback(self, interaction: discord.Interaction) -> None:
             response_message = await evolve_mon(
                 self.parent_view.user_id,
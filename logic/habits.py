@@ -1,4 +1,4 @@
-from core.database import execute_query, fetch_one
+from core.database import execute_query, fetch_one, fetch_all
 from datetime import datetime
 
 def add_habit(user_id: str, name: str, time: str = None, difficulty: str = "medium") -> None:
@@ -8,10 +8,10 @@ def add_habit(user_id: str, name: str, time: str = None, difficulty: str = "medi
     )
 
 def get_habits(user_id: str) -> list:
-    rows = execute_query(
+    rows = fetch_all(
         "SELECT habit_name, time, difficulty, streak, last_completed FROM habits WHERE user_id = ?",
         (user_id,)
-    ).fetchall()
+    )
     return [
         {
             "name": row["habit_name"],
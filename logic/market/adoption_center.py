@@ -3,7 +3,7 @@ import random
 import discord
 
 from core.items import get_inventory_quantity
-from core.rollmons import roll_single_mon
+from core.rollmons import roll_mons_batch
 
 # Global dictionary to store the last adoption date per user.
 USER_ADOPTION_LAST = {}
@@ -73,11 +73,7 @@ async def start_adoption_activity(interaction, user_id: str, trainer_name: str =
     await interaction.followup.send(start_msg, ephemeral=True)
 
     num_rolls = random.randint(1, 4)
-    rolled_mons = []
-    for _ in range(num_rolls):
-        mon = roll_single_mon()
-        if mon:
-            rolled_mons.append(mon)
+    rolled_mons = roll_mons_batch(count=num_rolls)
     if not rolled_mons:
         await interaction.followup.send("No mons available for adoption at this time.", ephemeral=True)
         return
@@ -3,8 +3,7 @@ import random
 import discord
 from discord.ui import View, Select
 from core.mon import register_mon
-from core.rollmons import roll_single_mon, get_default_pool, build_mon_embed, RollMonsView
-from core.trainer import get_temporary_inventory_columns
+from core.rollmons import roll_mons_batch, get_default_pool, build_mon_embed, RollMonsView
 
 # Load antique definitions from a JSON file.
 with open("data/antiques.JSON", "r") as f:
@@ -12,10 +11,12 @@ with open("data/antiques.JSON", "r") as f:
 
 ANTIQUES = {item["name"]: item for item in antique_list}
 
-def antique_appraise_item(antique_item: dict) -> list:
+def antique_appraise_item(antique_item: dict, rng=None) -> list:
     """
     Rolls a list of mons based on an antique item's appraisal properties.
+    rng is any object with the random module's interface (defaults to the module).
     """
+    rng = rng or random
     roll_count = antique_item.get("roll_count", 1)
     overrides = antique_item.get("override_parameters", {})
     force_fusion = antique_item.get("force_fusion", False)
@@ -24,33 +25,28 @@ def antique_appraise_item(antique_item: dict) -> list:
     pool = get_default_pool()
     rolled_mons = []
 
-    for _ in range(roll_count):
-        if not allow_fusion:
-            mon = roll_single_mon(pool, force_fusion=False)
-        else:
-            mon = roll_single_mon(pool, force_fusion=force_fusion)
-
+    for mon in roll_mons_batch(pool, roll_count, force_fusion=allow_fusion and force_fusion, rng=rng):
         original_name = mon.get("name", "Unknown")
         if "species_all" in overrides and overrides["species_all"]:
             if " / " in original_name:
                 parts = original_name.split(" / ")
-                new_parts = [random.choice(overrides["species_all"]) for _ in parts]
+                new_parts = [rng.choice(overrides["species_all"]) for _ in parts]
                 mon["name"] = " / ".join(new_parts)
             else:
-                mon["name"] = random.choice(overrides["species_all"])
+                mon["name"] = rng.choice(overrides["species_all"])
         else:
             if " / " in original_name:
                 parts = original_name.split(" / ")
                 if "species1" in overrides and overrides["species1"]:
-                    parts[0] = random.choice(overrides["species1"])
+                    parts[0] = rng.choice(overrides["species1"])
                 if len(parts) > 1 and "species2" in overrides and overrides["species2"]:
-                    parts[1] = random.choice(overrides["species2"])
+                    parts[1] = rng.choice(overrides["species2"])
                 if len(parts) > 2 and "species3" in overrides and overrides["species3"]:
-                    parts[2] = random.choice(overrides["species3"])
+                    parts[2] = rng.choice(overrides["species3"])
                 mon["name"] = " / ".join(parts)
             else:
                 if "species1" in overrides and overrides["species1"]:
-                    mon["name"] = random.choice(overrides["species1"])
+                    mon["name"] = rng.choice(overrides["species1"])
 
         if " / " in mon["name"]:
             parts = [p.strip() for p in mon["name"].split(" / ")]
@@ -63,9 +59,9 @@ def antique_appraise_item(antique_item: dict) -> list:
             mon["species3"] = ""
 
         if "type" in overrides and overrides["type"]:
-            mon["types"] = [random.choice(overrides["type"])]
+            mon["types"] = [rng.choice(overrides["type"])]
         if "attribute" in overrides and overrides["attribute"]:
-            mon["attribute"] = random.choice(overrides["attribute"])
+            mon["attribute"] = rng.choice(overrides["attribute"])
 
         rolled_mons.append(mon)
     return rolled_mons
@@ -5,7 +5,7 @@ from core.database import update_character_sheet_item
 #from core.database import update_character_sheet_item, update_mon_sheet_data
 from core.rollmons import fetch_pokemon_data, fetch_digimon_data, fetch_yokai_data
 from data.lists import legendary_list, mythical_list, no_evolution
-from core.database import cursor, update_mon_data
+from core.database import fetch_one, update_mon_data
 
 # Global constant for possible types
 POSSIBLE_TYPES: List[str] = [
@@ -266,12 +266,11 @@ def get_mon(trainer_id: str, mon_name: str) -> Optional[Dict[str, Any]]:
     """
     Retrieves a mon record from the database for the given trainer and mon name.
     """
-    cursor.execute(
+    row = fetch_one(
         "SELECT id, species1, species2, species3, type1, type2, type3, type4, type5, attribute "
         "FROM mons WHERE mon_name = ? AND player_user_id = ?",
         (mon_name, trainer_id)
     )
-    row = cursor.fetchone()
     if row:
         mon = {
             "id": row[0],
@@ -1,7 +1,8 @@
 import random
 from typing import Dict, List
 import discord
-from core.database import cursor
+from core.database import fetch_one, async_add_mons_bulk
+from core.species_catalog import catalog, mon_origin_value
 from core.database import update_character_sheet_item
 
 # Global constants for breeding randomization.
@@ -73,56 +74,61 @@ def get_parent_species(mon: Dict) -> List[str]:
 
 
 def is_yokai(species: str) -> bool:
-    cursor.execute('SELECT "Name" FROM YoKai WHERE lower("Name") = ?', (species.lower(),))
-    return cursor.fetchone() is not None
+    return "yokai" in catalog.origins_of(species)
 
 
 def is_digimon(species: str) -> bool:
-    cursor.execute('SELECT "Name" FROM Digimon WHERE lower("Name") = ?', (species.lower(),))
-    return cursor.fetchone() is not None
+    return "digimon" in catalog.origins_of(species)
 
 
 def determine_origin(mon: Dict) -> set:
-    origins = set()
-    mon_name = (mon.get("mon_name") or "").strip()
-    if is_digimon(mon_name):
-        origins.add("digimon")
-    if is_yokai(mon_name):
-        origins.add("yokai")
-    for sp in get_parent_species(mon):
-        if is_digimon(sp):
-            origins.add("digimon")
-        if is_yokai(sp):
-            origins.add("yokai")
-    if not origins:
-        origins.add("pokemon")
-    return origins
-
-
-def get_baby_species(species: str) -> str:
-    cursor.execute("SELECT baby_species FROM pokemon_babies WHERE lower(parent_species) = ?", (species.lower(),))
-    row = cursor.fetchone()
-    if row and row[0] and row[0].strip():
-        return row[0].strip()
-    cursor.execute("SELECT baby_species FROM pokemon_babies")
-    babies = [r[0].strip() for r in cursor.fetchall() if r[0]]
-    return random.choice(babies) if babies else ""
-
-
-def build_species_pool(parent1: Dict, parent2: Dict) -> List[str]:
+    """
+    The mon's origins: "digimon" and/or "yokai" if any of its species are, else "pokemon".
+    Uses the stored mons.origin column when present, otherwise resolves the species
+    (or, without any, the mon's name) against the in-memory species catalog.
+    """
+    if mon.get("origin"):
+        return set(mon["origin"].split(","))
+    names = get_parent_species(mon) or [(mon.get("mon_name") or "").strip()]
+    origin = catalog.mon_origin(names)
+    if origin is None:
+        # Catalog incomplete: go by the origins it could load. Never stored.
+        origin = mon_origin_value(set().union(*(catalog.origins_of(name) for name in names)))
+    return set(origin.split(","))
+
+
+def get_baby_species(species: str, rng=None) -> str:
+    baby = catalog.baby_species(species)
+    if baby:
+        return baby
+    babies = catalog.baby_names
+    return (rng or random).choice(babies) if babies else ""
+
+
+def build_species_pool(parent1: Dict, parent2: Dict, rng=None) -> List[str]:
+    rng = rng or random
     pool = []
     for mon in [parent1, parent2]:
+        origins = determine_origin(mon)
         for sp in get_parent_species(mon):
-            origins = determine_origin(mon)
             if "pokemon" in origins and "digimon" not in origins and "yokai" not in origins:
-                baby = get_baby_species(sp)
+                baby = get_baby_species(sp, rng)
                 if baby:
                     pool.append(baby)
             elif "digimon" in origins:
-                pool.append(random.choice(FRESH_DIGIMON))
+                pool.append(rng.choice(FRESH_DIGIMON))
             elif "yokai" in origins:
                 pool.append(sp)
-    return list(set(pool)) if pool else ["UnknownSpecies"]
+    # Deduplicate in first-seen order, so a seeded rng gives the same offspring every run.
+    return list(dict.fromkeys(pool)) if pool else ["UnknownSpecies"]
+
+
+def _mutation_species(species: dict) -> list:
+    return [record["name"].strip() for origin in ("digimon", "yokai") for record in species[origin] if record["name"]]
+
+
+# Digimon and Yo-kai names a species mutation can draw from, built once per catalog version.
+catalog.register_pool("breeding_mutation", _mutation_species)
 
 
 def get_combined_types(parent1: dict, parent2: dict) -> list:
@@ -132,60 +138,60 @@ def get_combined_types(parent1: dict, parent2: dict) -> list:
     return combined if combined else ["Normal"]
 
 
-def get_combined_attribute(parent1: dict, parent2: dict) -> str:
+def get_combined_attribute(parent1: dict, parent2: dict, rng=None) -> str:
     attrs = []
     if parent1.get("attribute"):
         attrs.append(parent1["attribute"])
     if parent2.get("attribute"):
         attrs.append(parent2["attribute"])
-    return random.choice(attrs) if attrs else "Free"
+    return (rng or random).choice(attrs) if attrs else "Free"
 
 
-def breed_offspring(parent1: dict, parent2: dict) -> list:
+def breed_offspring(parent1: dict, parent2: dict, rng=None) -> list:
     """
     Breeds offspring by fusing up to three species from the parents.
     The offspring will store the fusion across three separate species fields.
+    Species origins, baby species and mutation candidates all come from the
+    in-memory species catalog, so breeding issues no queries.
+    rng is any object with the random module's interface (defaults to the module).
     """
-    species_pool = build_species_pool(parent1, parent2)
+    rng = rng or random
+    species_pool = build_species_pool(parent1, parent2, rng)
     types_pool = get_combined_types(parent1, parent2)
-    default_attr = get_combined_attribute(parent1, parent2)
-    num_offspring = random.randint(1, 3)
+    default_attr = get_combined_attribute(parent1, parent2, rng)
+    num_offspring = rng.randint(1, 3)
     offspring_list = []
     for i in range(num_offspring):
         # Fusion: choose between 1 and up to 3 species from the candidate pool.
         if species_pool:
             max_species = min(3, len(species_pool))
-            num_species = random.randint(1, max_species)
-            selected_species = random.sample(species_pool, num_species)
+            num_species = rng.randint(1, max_species)
+            selected_species = rng.sample(species_pool, num_species)
             off_species1 = selected_species[0] if len(selected_species) >= 1 else ""
             off_species2 = selected_species[1] if len(selected_species) >= 2 else ""
             off_species3 = selected_species[2] if len(selected_species) >= 3 else ""
         else:
             off_species1, off_species2, off_species3 = "UnknownSpecies", "", ""
 
-        num_types = random.randint(1, min(5, len(types_pool))) if types_pool else 1
-        off_types = random.sample(types_pool, num_types) if types_pool else ["Normal"]
+        num_types = rng.randint(1, min(5, len(types_pool))) if types_pool else 1
+        off_types = rng.sample(types_pool, num_types) if types_pool else ["Normal"]
         off_attr = default_attr
         # 20% chance for a mutation altering species, types, or attribute.
-        if random.random() < 0.20:
-            mutation_choice = random.choice(["species", "types", "attribute"])
+        if rng.random() < 0.20:
+            mutation_choice = rng.choice(["species", "types", "attribute"])
             if mutation_choice == "species":
-                cursor.execute("SELECT Name FROM Digimon")
-                digimon_candidates = [row[0].strip() for row in cursor.fetchall() if row[0]]
-                cursor.execute('SELECT "Name" FROM YoKai')
-                yokai_candidates = [row[0].strip() for row in cursor.fetchall() if row[0]]
-                mutation_pool = digimon_candidates + yokai_candidates + species_pool
+                mutation_pool = list(catalog.pool("breeding_mutation")) + species_pool
                 if mutation_pool:
                     max_species_mut = min(3, len(mutation_pool))
-                    num_species_mut = random.randint(1, max_species_mut)
-                    selected_mut_species = random.sample(mutation_pool, num_species_mut)
+                    num_species_mut = rng.randint(1, max_species_mut)
+                    selected_mut_species = rng.sample(mutation_pool, num_species_mut)
                     off_species1 = selected_mut_species[0] if len(selected_mut_species) >= 1 else ""
                     off_species2 = selected_mut_species[1] if len(selected_mut_species) >= 2 else ""
                     off_species3 = selected_mut_species[2] if len(selected_mut_species) >= 3 else ""
             elif mutation_choice == "types":
-                off_types = random.sample(POSSIBLE_TYPES, random.randint(1, 5))
+                off_types = rng.sample(POSSIBLE_TYPES, rng.randint(1, 5))
             elif mutation_choice == "attribute":
-                off_attr = random.choice(RANDOM_ATTRIBUTES)
+                off_attr = rng.choice(RANDOM_ATTRIBUTES)
         offspring = {
             "mon_name": f"Offspring {i + 1} of {parent1.get('mon_name', 'Parent1')} & {parent2.get('mon_name', 'Parent2')}",
             "species1": off_species1,
@@ -202,14 +208,17 @@ def breed_offspring(parent1: dict, parent2: dict) -> list:
 
 async def breed_mons(mon1_id: int, mon2_id: int, user_id: str) -> list:
     from core.mon import is_mon_viable_for_breeding
-    cursor.execute("SELECT * FROM mons WHERE id = ?", (mon1_id,))
-    parent1_tuple = cursor.fetchone()
-    cursor.execute("SELECT * FROM mons WHERE id = ?", (mon2_id,))
-    parent2_tuple = cursor.fetchone()
+    keys = ["id", "trainer_id", "player", "mon_name", "species1", "species2", "species3",
+            "type1", "type2", "type3", "type4", "type5", "attribute", "img_link", "origin"]
+    parent_query = """
+        SELECT mon_id, trainer_id, player_user_id, name, species1, species2, species3,
+               type1, type2, type3, type4, type5, attribute, img_link, origin
+        FROM mons WHERE mon_id = ?
+    """
+    parent1_tuple = fetch_one(parent_query, (mon1_id,))
+    parent2_tuple = fetch_one(parent_query, (mon2_id,))
     if not parent1_tuple or not parent2_tuple:
         return []
-    keys = ["id", "trainer_id", "player", "mon_name", "species1", "species2", "species3",
-            "type1", "type2", "type3", "type4", "type5", "attribute", "img_link"]
     parent1 = dict(zip(keys, parent1_tuple))
     parent2 = dict(zip(keys, parent2_tuple))
     # Combine type columns into a list.
@@ -224,8 +233,7 @@ async def breed_mons(mon1_id: int, mon2_id: int, user_id: str) -> list:
     if not is_mon_viable_for_breeding(mon1_id) or not is_mon_viable_for_breeding(mon2_id):
         return []
     trainer_id = parent1["trainer_id"] if parent1["player"] == user_id else parent2["trainer_id"]
-    cursor.execute("SELECT name FROM trainers WHERE id = ?", (trainer_id,))
-    row = cursor.fetchone()
+    row = fetch_one("SELECT character_name FROM trainers WHERE id = ?", (trainer_id,))
     if row:
         trainer_name = row[0]
         removal_success = await update_character_sheet_item(trainer_name, "Legacy Leeway", -1)
@@ -248,6 +256,33 @@ class OffspringRegistrationButton(discord.ui.Button):
         await interaction.response.edit_message(view=self.view)
         await interaction.followup.send(f"{self.offspring['mon_name']} registered successfully!", ephemeral=True)
 
+class RegisterAllOffspringButton(discord.ui.Button):
+    def __init__(self):
+        super().__init__(label="Register All", style=discord.ButtonStyle.success)
+
+    async def callback(self, interaction: discord.Interaction):
+        pending = [item for item in self.view.children
+                   if isinstance(item, OffspringRegistrationButton) and not item.disabled]
+        if not pending:
+            await interaction.response.send_message("All offspring are already registered.", ephemeral=True)
+            return
+        trainer = self.view.player_trainer
+        await interaction.response.defer(ephemeral=True)
+        try:
+            # One transaction, one mon count update and one sheet update for the whole litter.
+            await async_add_mons_bulk(trainer["id"], str(interaction.user.id),
+                                      [item.offspring for item in pending])
+        except Exception as e:
+            await interaction.followup.send(f"Failed to register offspring: {e}", ephemeral=True)
+            return
+        for item in pending:
+            item.disabled = True
+        self.disabled = True
+        await interaction.edit_original_response(view=self.view)
+        await interaction.followup.send(
+            f"Registered {len(pending)} offspring to {trainer['name']}.", ephemeral=True
+        )
+
 class DoneButton(discord.ui.Button):
     def __init__(self):
         super().__init__(label="Done", style=discord.ButtonStyle.secondary)
@@ -259,14 +294,18 @@ class DoneButton(discord.ui.Button):
         await interaction.followup.send("Offspring registration completed.", ephemeral=True)
 
 class OffspringRegistrationView(discord.ui.View):
-    def __init__(self, user: discord.User, offspring_list: list, player_mon: dict, other_mon: dict):
+    def __init__(self, user: discord.User, offspring_list: list, player_mon: dict, other_mon: dict,
+                 player_trainer: dict = None):
         super().__init__(timeout=120)
         self.user = user
         self.offspring_list = offspring_list
         self.player_mon = player_mon
         self.other_mon = other_mon
+        self.player_trainer = player_trainer
         for offspring in offspring_list:
             self.add_item(OffspringRegistrationButton(offspring))
+        if player_trainer and len(offspring_list) > 1:
+            self.add_item(RegisterAllOffspringButton())
         self.add_item(DoneButton())
 
 class BreedAgainButton(discord.ui.Button):
@@ -179,7 +179,7 @@ class FarmMonSelectViewLogic(discord.ui.View):
             )
             await interaction.followup.send(embed=embed)
             reg_view = OffspringRegistrationView(
-                self.user, offspring_list, player_mon, other_mon
+                self.user, offspring_list, player_mon, other_mon, player_trainer=self.player_trainer
             )
             await interaction.followup.send("Register your offspring:", view=reg_view)
             result_view = FarmResultView(
@@ -1,15 +1,13 @@
 import logging
 import discord
-from core.database import fetch_all, update_character_sheet_item
+from core.database import fetch_trainers, update_character_sheet_item
 from logic.market.nursery_options import get_temp_inventory, collect_nursery_options
 from core.items import check_inventory
 
 def get_trainers(user_id: str) -> list:
     """Retrieve trainers for the user from the database."""
     try:
-        query = "SELECT id, name FROM trainers WHERE player_user_id = ?"
-        rows = fetch_all(query, (user_id,))
-        return [{'id': row["id"], 'name': row["name"]} for row in rows]
+        return fetch_trainers("player_user_id = ?", (user_id,), ("id", "character_name"))
     except Exception as e:
         logging.error(f"Error fetching trainers for {user_id}: {e}")
         return []
@@ -1,25 +1,19 @@
-import json
 import logging
 
 import discord
 
-from core.database import fetch_trainer_by_name
+from core.database import fetch_trainer_by_name, get_inventory
 
-def get_temp_inventory(trainer_name: str) -> dict:
+def get_temp_inventory(trainer_name: str, prefix: str = None) -> dict:
     """
-    Retrieves the trainer's inventory (stored as JSON) and returns it as a dictionary.
+    Retrieves the trainer's inventory as a dictionary of item -> quantity,
+    optionally limited to items whose name starts with `prefix`.
     """
     trainer = fetch_trainer_by_name(trainer_name)
     if not trainer:
         logging.error(f"Trainer {trainer_name} not found in get_temp_inventory.")
         return {}
-    inv_str = trainer.get("inventory", "{}")
-    try:
-        inventory = json.loads(inv_str) if inv_str else {}
-    except Exception as e:
-        logging.error(f"Error parsing inventory for {trainer_name}: {e}")
-        inventory = {}
-    return inventory
+    return get_inventory(trainer["id"], prefix=prefix)
 
 async def collect_nursery_options(interaction: discord.Interaction, trainer_name: str, temp_inventory: dict) -> list:
     """
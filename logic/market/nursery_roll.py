@@ -1,6 +1,7 @@
 import discord
 import re
-from core.rollmons import get_default_pool, roll_single_mon, build_mon_embed, RollMonsView
+from core.rollmons import get_default_pool, roll_mons_batch, build_mon_embed, RollMonsView
+from core.species_catalog import catalog
 
 def extract_first_word(item_name: str) -> str:
     return item_name.split()[0] if item_name else ""
@@ -11,8 +12,35 @@ def extract_quantity_from_label(label: str) -> int:
         return int(match.group(1))
     return 1
 
-async def run_nursery_roll(interaction: discord.Interaction, selections: dict, trainer_name: str):
+def select_from_pool(pool: list, pool_name: str, field: str, value: str, origin: str) -> list:
+    """
+    Keeps the mons of one origin whose `field` matches `value`, through the species
+    catalog indexes. While the pool is still the untouched named pool, the answer
+    is a precomputed index bucket; after other items have changed it, the pool is
+    narrowed by record identity.
+    """
+    if pool_name:
+        return list(catalog.lookup(field, value, origin=origin, pool=pool_name))
+    return catalog.narrow(pool, field, value, origin=origin)
+
+
+def drop_origin(pool: list, pool_name: str, origin: str) -> list:
+    if pool_name:
+        return [mon for other in ("pokemon", "digimon", "yokai") if other != origin
+                for mon in catalog.lookup("origin", other, pool=pool_name)]
+    return [mon for mon in pool if mon.get("origin") != origin]
+
+
+def build_nursery_roll(selections: dict, amount: int = 10, rng=None):
+    """
+    Applies the nursery item selections and rolls `amount` mons.
+    Returns (rolled_mons, claim_limit); rolled_mons is empty when the selected
+    items leave no mons to roll from.
+    rng is passed to roll_mons_batch (e.g. a seeded random.Random).
+    """
     pool = get_default_pool()
+    # Name of the catalog pool `pool` still equals; None once an item has changed it.
+    pool_name = "default"
     roll_params = {
         "force_fusion": False,
         "force_min_types": None,
@@ -37,35 +65,28 @@ async def run_nursery_roll(interaction: discord.Interaction, selections: dict, t
                 roll_params["code_override"] = "Data"
         elif key == "rank_incense":
             rank = value.split()[0]
-            pool = [mon for mon in pool if mon.get("origin") == "yokai" and mon.get("rank", "").upper() == rank.upper()]
+            pool, pool_name = select_from_pool(pool, pool_name, "rank", rank, "yokai"), None
         elif key == "color_insense":
             color = value.split()[0]
-            pool = [mon for mon in pool if mon.get("origin") == "yokai" and mon.get("attribute", "").lower() == color.lower()]
+            pool, pool_name = select_from_pool(pool, pool_name, "attribute", color, "yokai"), None
         elif key == "spell_tag":
-            pool = [mon for mon in pool if mon.get("origin") != "yokai"]
+            pool, pool_name = drop_origin(pool, pool_name, "yokai"), None
         elif key == "summoning_stone":
-            from core.rollmons import fetch_yokai_data
-            yokai = fetch_yokai_data()
-            pool.extend(yokai)
+            pool, pool_name = pool + list(catalog.yokai), None
         elif key == "digimeat":
-            from core.rollmons import fetch_digimon_data
-            digimon = fetch_digimon_data()
-            pool.extend(digimon)
+            pool, pool_name = pool + list(catalog.digimon), None
         elif key == "digitofu":
-            pool = [mon for mon in pool if mon.get("origin") != "digimon"]
+            pool, pool_name = drop_origin(pool, pool_name, "digimon"), None
         elif key == "soothe_bell":
-            from core.rollmons import fetch_pokemon_data
-            pokemon = fetch_pokemon_data()
-            pool.extend(pokemon)
+            pool, pool_name = pool + list(catalog.pokemon), None
         elif key == "broken_bell":
-            pool = [mon for mon in pool if mon.get("origin") != "pokemon"]
+            pool, pool_name = drop_origin(pool, pool_name, "pokemon"), None
         elif key == "poffin":
             desired_type = extract_first_word(value)
-            pool = [mon for mon in pool if mon.get("origin") == "pokemon" and any(
-                desired_type.lower() == t.lower() for t in mon.get("types", []))]
+            pool, pool_name = select_from_pool(pool, pool_name, "type", desired_type, "pokemon"), None
         elif key == "tag":
             tag = value.replace("#", "").strip()
-            pool = [mon for mon in pool if mon.get("origin") == "digimon" and mon.get("attribute", "").lower() == tag.lower()]
+            pool, pool_name = select_from_pool(pool, pool_name, "attribute", tag, "digimon"), None
         elif key == "dna_splicer":
             qty = extract_quantity_from_label(value)
             claim_limit += qty
@@ -84,14 +105,11 @@ async def run_nursery_roll(interaction: discord.Interaction, selections: dict, t
         elif key == "species_override":
             roll_params["species_override"] = True
 
-    amount = 10
-    rolled_mons = []
-    for _ in range(amount):
-        mon = roll_single_mon(pool, force_fusion=roll_params["force_fusion"],
-                              force_min_types=roll_params["force_min_types"])
+    rolled_mons = roll_mons_batch(pool, amount, force_fusion=roll_params["force_fusion"],
+                                  force_min_types=roll_params["force_min_types"], rng=rng)
+    for mon in rolled_mons:
         if not mon.get("species1"):
             mon["species1"] = mon.get("name", "Unknown")
-        rolled_mons.append(mon)
 
     if roll_params.get("type_override"):
         for mon in rolled_mons:
@@ -105,6 +123,14 @@ async def run_nursery_roll(interaction: discord.Interaction, selections: dict, t
     if roll_params.get("species_override"):
         for mon in rolled_mons:
             mon["species1"] = f"{mon['species1']} (override pending)"
+    return rolled_mons, claim_limit
+
+
+async def run_nursery_roll(interaction: discord.Interaction, selections: dict, trainer_name: str):
+    rolled_mons, claim_limit = build_nursery_roll(selections)
+    if not rolled_mons:
+        await interaction.followup.send("No mons available for the selected items.", ephemeral=True)
+        return
 
     embed = build_mon_embed(rolled_mons)
     view = RollMonsView(rolled_mons, claim_limit=claim_limit)
@@ -2,8 +2,8 @@ import json
 import os
 import random
 from core.currency import add_currency
-from core.database import execute_query, fetch_one, fetch_all, update_mon_data
-from core.database import update_character_level, update_character_sheet_item
+from core.database import execute_query, fetch_one, fetch_all, update_mon_data, run_db, transaction
+from core.database import _update_character_level, _update_character_sheet_item
 
 def load_missions():
     filename = "../data/missions.JSON"
@@ -121,7 +121,8 @@ def progress_mission(user_id: str, amount: int) -> dict:
     db_store_active_mission(user_id, mission)
     return mission
 
-async def process_mon_level_reward(user_id: str, mon_name: str, level_reward: int) -> str:
+def _apply_mon_level_reward(user_id: str, mon_name: str, level_reward: int) -> str:
+    """Blocking body of process_mon_level_reward; joins the caller's transaction, if any."""
     row = fetch_one("SELECT mon_id, trainer_id, level FROM mons WHERE mon_name = ? AND player_user_id = ?", (mon_name, user_id))
     if not row:
         return f"Mon '{mon_name}' not found or does not belong to you."
@@ -133,45 +134,79 @@ async def process_mon_level_reward(user_id: str, mon_name: str, level_reward: in
     new_level = current_level + level_reward
     if current_level >= 100:
         extra_coins = level_reward * 25
-        add_currency(user_id, extra_coins)
+        add_currency(user_id, extra_coins, "mission_level_overflow", mon_id)
         return f"Mon '{mon_name}' is at level 100. Converted {level_reward} level(s) into {extra_coins} coins."
     elif new_level > 100:
         effective_levels = 100 - current_level
         excess = level_reward - effective_levels
-        success = await update_character_level(trainer_name, mon_name, effective_levels)
+        success = _update_character_level(trainer_name, mon_name, effective_levels)
         if success:
             update_mon_data(mon_id, level=new_level)
             extra_coins = excess * 25
-            add_currency(user_id, extra_coins)
+            add_currency(user_id, extra_coins, "mission_level_overflow", mon_id)
             return f"Mon '{mon_name}' reached level 100. Added {effective_levels} level(s) and converted {excess} extra level(s) into {extra_coins} coins."
         else:
             return "Failed to update the mon's sheet."
     else:
-        success = await update_character_level(trainer_name, mon_name, level_reward)
+        success = _update_character_level(trainer_name, mon_name, level_reward)
         if success:
             update_mon_data(mon_id, level=new_level)
             return f"Added {level_reward} level(s) to mon '{mon_name}' on trainer {trainer_name}'s sheet."
         else:
             return "Failed to update the mon's sheet."
 
+async def process_mon_level_reward(user_id: str, mon_name: str, level_reward: int) -> str:
+    return await run_db(_apply_mon_level_reward, user_id, mon_name, level_reward)
+
+def _apply_mission_rewards(user_id: str, mission: dict, rolled_items: list) -> list:
+    """
+    Writes every payout of a claimed mission and clears it in one commit, so a
+    failure cannot pay twice. Runs on the DB executor; returns the summary lines.
+    """
+    reward_summary = []
+    with transaction():
+        coin_reward = mission["reward"].get("coin_reward", 0)
+        if coin_reward:
+            add_currency(user_id, coin_reward, "mission_reward", mission.get("mission_id"))
+            reward_summary.append(f"{coin_reward} coins")
+        level_reward = mission["reward"].get("level_reward", 0)
+        if level_reward and mission.get("selected_mons"):
+            level_msgs = [_apply_mon_level_reward(user_id, mon_name, level_reward)
+                          for mon_name in mission["selected_mons"]]
+            reward_summary.append("Level Rewards: " + "; ".join(level_msgs))
+        if mission["reward"].get("item_reward"):
+            if rolled_items:
+                first_mon = mission["selected_mons"][0]
+                row = fetch_one("SELECT trainer_id FROM mons WHERE mon_name = ? AND player_user_id = ?", (first_mon, user_id))
+                if row:
+                    trainer_row = fetch_one("SELECT name FROM trainers WHERE id = ?", (row["trainer_id"],))
+                    if trainer_row:
+                        trainer_name = trainer_row["name"]
+                        success_items = [item for item in rolled_items
+                                         if _update_character_sheet_item(trainer_name, item, 1)]
+                        if success_items:
+                            reward_summary.append("Items: " + ", ".join(success_items))
+                        else:
+                            reward_summary.append("Failed to update sheet with items.")
+                    else:
+                        reward_summary.append("Trainer not found for item reward.")
+                else:
+                    reward_summary.append("No trainer found for item reward.")
+            else:
+                reward_summary.append("No items rolled.")
+        if not mission.get("repeatable", True):
+            mark_mission_done(user_id, mission["mission_id"])
+        db_delete_active_mission(user_id)
+    return reward_summary
+
 async def claim_mission_rewards(ctx, user_id: str) -> str:
     mission = db_get_active_mission(user_id)
     if not mission:
         return "No active mission found."
     if not mission.get("complete", False):
         return "Mission not complete yet."
-    reward_summary = []
-    coin_reward = mission["reward"].get("coin_reward", 0)
-    if coin_reward:
-        add_currency(user_id, coin_reward)
-        reward_summary.append(f"{coin_reward} coins")
-    level_reward = mission["reward"].get("level_reward", 0)
-    if level_reward and mission.get("selected_mons"):
-        level_msgs = []
-        for mon_name in mission["selected_mons"]:
-            msg = await process_mon_level_reward(user_id, mon_name, level_reward)
-            level_msgs.append(msg)
-        reward_summary.append("Level Rewards: " + "; ".join(level_msgs))
+    # Roll first; the writes then go through in one transaction with nothing else awaited.
+    rolled_items = []
     item_reward = mission["reward"].get("item_reward")
     if item_reward:
         try:
@@ -179,40 +214,14 @@ async def claim_mission_rewards(ctx, user_id: str) -> str:
         except Exception:
             num_items = 1
         from core.items import roll_items
-        rolled_items = await roll_items(num=num_items)
-        if rolled_items:
-            first_mon = mission["selected_mons"][0]
-            row = fetch_one("SELECT trainer_id FROM mons WHERE mon_name = ? AND player_user_id = ?", (first_mon, user_id))
-            if row:
-                trainer_row = fetch_one("SELECT name FROM trainers WHERE id = ?", (row["trainer_id"],))
-                if trainer_row:
-                    trainer_name = trainer_row["name"]
-                    success_items = []
-                    for item in rolled_items:
-                        success = await update_character_sheet_item(trainer_name, item, 1)
-                        if success:
-                            success_items.append(item)
-                    if success_items:
-                        reward_summary.append("Items: " + ", ".join(success_items))
-                    else:
-                        reward_summary.append("Failed to update sheet with items.")
-                else:
-                    reward_summary.append("Trainer not found for item reward.")
-            else:
-                reward_summary.append("No trainer found for item reward.")
-        else:
-            reward_summary.append("No items rolled.")
-    rollmons_reward = mission["reward"].get("rollmons_reward")
-    if rollmons_reward:
+        rolled_items = await roll_items(amount=num_items)
+    reward_summary = await run_db(_apply_mission_rewards, user_id, mission, rolled_items)
+    if mission["reward"].get("rollmons_reward"):
+        # The mon roll is a claim prompt sent to the channel, so it goes out once the
+        # mission has been cleared.
         from core.rollmons import roll_mons
-        rolled_mon = roll_mons(ctx, 'default', 1)
-        if rolled_mon:
-            reward_summary.append(f"Mon reward: {rolled_mon.get('name', 'Unknown')}")
-        else:
-            reward_summary.append("No mon reward rolled.")
-    if not mission.get("repeatable", True):
-        mark_mission_done(user_id, mission["mission_id"])
-    db_delete_active_mission(user_id)
+        await roll_mons(ctx, 'default', 1)
+        reward_summary.append("Mon reward: rolled, claim it from the list")
     summary = "Rewards claimed: " + ", ".join(reward_summary)
     return summary
 
@@ -32,8 +32,7 @@ def build_schedule_message(user_id: str) -> str:
 def reset_daily_schedules() -> None:
     from logic.tasks import reset_tasks
     from logic.habits import reset_habits
-    from core.database import fetch_all
-    users = fetch_all("SELECT DISTINCT player_user_id AS user_id FROM trainers")
-    for user in users:
+    from core.database import iter_rows
+    for user in iter_rows("SELECT DISTINCT player_user_id AS user_id FROM trainers"):
         reset_habits(user["user_id"])
         reset_tasks(user["user_id"])
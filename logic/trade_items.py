@@ -2,6 +2,7 @@ import random
 import datetime
 import json
 from core.database import execute_query
+from core.database import async_execute_query, async_fetch_one, run_db, transaction
 from core.items import roll_items
 
 def get_today_date():
@@ -24,8 +25,8 @@ create_shop_rolls_table()
 async def roll_shop_items(shop: str, user_id: str, *, category_filter: str = None, exclude_categories: list = None, count_range: tuple = (2, 5)):
     today = get_today_date()
     # Delete previous rolls.
-    execute_query("DELETE FROM shop_rolls WHERE shop=? AND user_id=? AND date<>?", (shop, user_id, today))
-    row = execute_query("SELECT items FROM shop_rolls WHERE shop=? AND user_id=? AND date=?", (shop, user_id, today)).fetchone()
+    await async_execute_query("DELETE FROM shop_rolls WHERE shop=? AND user_id=? AND date<>?", (shop, user_id, today))
+    row = await async_fetch_one("SELECT items FROM shop_rolls WHERE shop=? AND user_id=? AND date=?", (shop, user_id, today))
     if row:
         return json.loads(row[0])
     count = random.randint(*count_range)
@@ -57,12 +58,27 @@ async def roll_shop_items(shop: str, user_id: str, *, category_filter: str = Non
             "purchased": 0
         })
     items_json = json.dumps(items)
-    execute_query("INSERT INTO shop_rolls (shop, user_id, date, items) VALUES (?, ?, ?, ?)", (shop, user_id, today, items_json))
+    await async_execute_query("INSERT INTO shop_rolls (shop, user_id, date, items) VALUES (?, ?, ?, ?)", (shop, user_id, today, items_json))
     return items
 
+def _debit_purchase(shop: str, user_id: str, today: str, items: list, item: dict, quantity: int, total_price: int):
+    """
+    Debits the price and records the purchase count in one commit; runs on the DB executor.
+    Returns the new balance, or None when funds are insufficient (nothing is changed).
+    """
+    from core.currency import debit_currency
+    with transaction():
+        balance = debit_currency(user_id, total_price, "shop_purchase", f"{shop}:{item['name']}")
+        if balance is None:
+            return None
+        item["purchased"] += quantity
+        new_items_json = json.dumps(items)
+        execute_query("UPDATE shop_rolls SET items=? WHERE shop=? AND user_id=? AND date=?", (new_items_json, shop, user_id, today))
+    return balance
+
 async def purchase_item(shop: str, user_id: str, item_name: str, quantity: int):
     today = get_today_date()
-    row = execute_query("SELECT items FROM shop_rolls WHERE shop=? AND user_id=? AND date=?", (shop, user_id, today)).fetchone()
+    row = await async_fetch_one("SELECT items FROM shop_rolls WHERE shop=? AND user_id=? AND date=?", (shop, user_id, today))
     if not row:
         return False, "No items available in the shop for today."
     items = json.loads(row[0])
@@ -71,13 +87,8 @@ async def purchase_item(shop: str, user_id: str, item_name: str, quantity: int):
             if item["purchased"] + quantity > item["max_purchase"]:
                 return False, f"You can only purchase {item['max_purchase'] - item['purchased']} more of {item_name}."
             total_price = item["price"] * quantity
-            from core.currency import get_currency, add_currency
-            funds = get_currency(user_id)
-            if funds < total_price:
+            balance = await run_db(_debit_purchase, shop, user_id, today, items, item, quantity, total_price)
+            if balance is None:
                 return False, "Insufficient funds."
-            add_currency(user_id, -total_price)
-            item["purchased"] += quantity
-            new_items_json = json.dumps(items)
-            execute_query("UPDATE shop_rolls SET items=? WHERE shop=? AND user_id=? AND date=?", (new_items_json, shop, user_id, today))
             return True, f"Purchased {quantity} x {item_name} for {total_price} coins."
     return False, f"Item {item_name} not found in shop."
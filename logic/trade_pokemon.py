@@ -27,7 +27,7 @@ async def transfer_mon(mon_id: int, old_trainer: dict, new_trainer: dict) -> boo
     try:
         new_trainer_id = new_trainer['id']
         new_player = new_trainer.get('user_id')
-        success_db = update_mon_data(mon_id, trainer_id=new_trainer_id, player=new_player)
+        success_db = update_mon_data(mon_id, trainer_id=new_trainer_id, player_user_id=new_player)
         if not success_db:
             logging.error(f"DB update failed for mon id {mon_id}")
             return False
@@ -69,7 +69,7 @@ async def process_writing_submission(
         else:
             assigned_levels = {}
 
-    add_currency(str(interaction.user.id) if interaction else "unknown", coins)
+    add_currency(str(interaction.user.id) if interaction else "unknown", coins, "writing_submission")
     return {
         "total_levels": total_levels,
         "coins": coins,
@@ -1,26 +1,44 @@
 import discord
 from discord.ui import View, Button, Modal, TextInput
-from core.database import cursor, db
+from core.database import execute_query, fetch_one, fetch_page
+from views.AdminActions.Pagination import KeysetPaginationView
 # Existing boss functions already in use
 
-# Helper function to retrieve all bosses.
-def get_all_bosses():
-    cursor.execute(
-        "SELECT id, name, max_health, current_health, image_link, flavor_text, is_active FROM boss"
+BOSSES_PER_PAGE = 5
+
+
+def _boss_from_row(row) -> dict:
+    return {
+        "id": row[0],
+        "name": row[1],
+        "max_health": row[2],
+        "current_health": row[3],
+        "image_link": row[4] if row[4] else "N/A",
+        "flavor_text": row[5] if row[5] else "N/A",
+        "is_active": bool(row[6])
+    }
+
+
+# Helper function to retrieve one page of bosses, ordered by id.
+def get_bosses_page(after=None, before=None, limit: int = BOSSES_PER_PAGE):
+    return fetch_page(
+        "boss", "id, name, max_health, current_health, image_link, flavor_text, is_active", "id",
+        after=after, before=before, limit=limit, build=_boss_from_row
     )
-    rows = cursor.fetchall()
-    bosses = []
-    for row in rows:
-        bosses.append({
-            "id": row[0],
-            "name": row[1],
-            "max_health": row[2],
-            "current_health": row[3],
-            "image_link": row[4] if row[4] else "N/A",
-            "flavor_text": row[5] if row[5] else "N/A",
-            "is_active": bool(row[6])
-        })
-    return bosses
+
+
+def render_bosses_page(page, page_number: int) -> discord.Embed:
+    if not page.rows:
+        description = "No bosses found."
+    else:
+        description = "\n\n".join(
+            [
+                f"ID: {b['id']} | Name: {b['name']}\nMax HP: {b['max_health']} | Current HP: {b['current_health']}\n"
+                f"Active: {'Yes' if b['is_active'] else 'No'}\nFlavor: {b['flavor_text']}\nImage: {b['image_link']}"
+                for b in page.rows
+            ]
+        )
+    return discord.Embed(title=f"All Bosses (Page {page_number})", description=description, color=discord.Color.red())
 
 # Modal to add a new boss.
 class AddBossModal(Modal, title="Add New Boss"):
@@ -51,11 +69,10 @@ class AddBossModal(Modal, title="Add New Boss"):
         except ValueError:
             active_val = 1
 
-        cursor.execute(
+        execute_query(
             "INSERT INTO boss (name, max_health, current_health, image_link, flavor_text, is_active) VALUES (?, ?, ?, ?, ?, ?)",
             (boss_name, max_hp, current_hp, img, flavor, active_val)
         )
-        db.commit()
         await interaction.response.send_message(f"Boss '{boss_name}' added successfully.", ephemeral=True)
 
 # Modal to edit an existing boss.
@@ -112,8 +129,7 @@ class EditBossModal(Modal, title="Edit Boss"):
             values.append(value)
         values.append(boss_id_val)
         query = "UPDATE boss SET " + ", ".join(fields) + " WHERE id = ?"
-        cursor.execute(query, tuple(values))
-        db.commit()
+        execute_query(query, tuple(values))
         await interaction.response.send_message(f"Boss ID {boss_id_val} updated with {updates}.", ephemeral=True)
 
 # Modal to reset a boss's health.
@@ -126,14 +142,12 @@ class ResetBossHealthModal(Modal, title="Reset Boss Health"):
         except ValueError:
             await interaction.response.send_message("Invalid Boss ID.", ephemeral=True)
             return
-        cursor.execute("SELECT max_health FROM boss WHERE id = ?", (boss_id_val,))
-        row = cursor.fetchone()
+        row = fetch_one("SELECT max_health FROM boss WHERE id = ?", (boss_id_val,))
         if not row:
             await interaction.response.send_message("Boss not found.", ephemeral=True)
             return
         max_hp = row[0]
-        cursor.execute("UPDATE boss SET current_health = ? WHERE id = ?", (max_hp, boss_id_val))
-        db.commit()
+        execute_query("UPDATE boss SET current_health = ? WHERE id = ?", (max_hp, boss_id_val))
         await interaction.response.send_message(f"Boss ID {boss_id_val} health reset to {max_hp}.", ephemeral=True)
 
 # Modal to toggle a boss's active status.
@@ -146,15 +160,13 @@ class ToggleBossActiveModal(Modal, title="Toggle Boss Active Status"):
         except ValueError:
             await interaction.response.send_message("Invalid Boss ID.", ephemeral=True)
             return
-        cursor.execute("SELECT is_active FROM boss WHERE id = ?", (boss_id_val,))
-        row = cursor.fetchone()
+        row = fetch_one("SELECT is_active FROM boss WHERE id = ?", (boss_id_val,))
         if not row:
             await interaction.response.send_message("Boss not found.", ephemeral=True)
             return
         current_status = row[0]
         new_status = 0 if current_status else 1
-        cursor.execute("UPDATE boss SET is_active = ? WHERE id = ?", (new_status, boss_id_val))
-        db.commit()
+        execute_query("UPDATE boss SET is_active = ? WHERE id = ?", (new_status, boss_id_val))
         status_text = "active" if new_status else "inactive"
         await interaction.response.send_message(f"Boss ID {boss_id_val} is now {status_text}.", ephemeral=True)
 
@@ -172,8 +184,7 @@ class DeleteBossModal(Modal, title="Delete Boss"):
         except ValueError:
             await interaction.response.send_message("Invalid Boss ID.", ephemeral=True)
             return
-        cursor.execute("DELETE FROM boss WHERE id = ?", (boss_id_val,))
-        db.commit()
+        execute_query("DELETE FROM boss WHERE id = ?", (boss_id_val,))
         await interaction.response.send_message(f"Boss ID {boss_id_val} deleted.", ephemeral=True)
 
 # --- New: Modal to Force Kill a Boss ---
@@ -191,8 +202,7 @@ class ForceKillBossModal(Modal, title="Force Kill Boss"):
             await interaction.response.send_message("Invalid Boss ID.", ephemeral=True)
             return
         # Force kill: set current health to 0 and mark inactive.
-        cursor.execute("UPDATE boss SET current_health = 0, is_active = 0 WHERE id = ?", (boss_id_val,))
-        db.commit()
+        execute_query("UPDATE boss SET current_health = 0, is_active = 0 WHERE id = ?", (boss_id_val,))
         await interaction.response.send_message(f"Boss ID {boss_id_val} force killed (health set to 0 and inactive).", ephemeral=True)
 
 # --- New: Modal to Manually Add Boss Damage ---
@@ -210,10 +220,9 @@ class AddBossDamageModal(Modal, title="Add Boss Damage"):
             return
         user_id_val = self.user_id.value.strip()
         # Insert a damage record.
-        cursor.execute("INSERT INTO boss_damage (boss_id, user_id, damage) VALUES (?, ?, ?)", (boss_id_val, user_id_val, damage_val))
+        execute_query("INSERT INTO boss_damage (boss_id, user_id, damage) VALUES (?, ?, ?)", (boss_id_val, user_id_val, damage_val))
         # Update boss health.
-        cursor.execute("SELECT current_health FROM boss WHERE id = ?", (boss_id_val,))
-        row = cursor.fetchone()
+        row = fetch_one("SELECT current_health FROM boss WHERE id = ?", (boss_id_val,))
         if not row:
             await interaction.response.send_message("Boss not found.", ephemeral=True)
             return
@@ -221,8 +230,7 @@ class AddBossDamageModal(Modal, title="Add Boss Damage"):
         new_health = current_health - damage_val
         if new_health < 0:
             new_health = 0
-        cursor.execute("UPDATE boss SET current_health = ? WHERE id = ?", (new_health, boss_id_val))
-        db.commit()
+        execute_query("UPDATE boss SET current_health = ? WHERE id = ?", (new_health, boss_id_val))
         await interaction.response.send_message(
             f"Added damage of {damage_val} to Boss ID {boss_id_val}. New health is {new_health}.", ephemeral=True
         )
@@ -233,19 +241,7 @@ class BossManagementView(View):
         super().__init__(timeout=None)
 
     async def refresh_list(self, interaction: discord.Interaction):
-        bosses = get_all_bosses()
-        if not bosses:
-            description = "No bosses found."
-        else:
-            description = "\n\n".join(
-                [
-                    f"ID: {b['id']} | Name: {b['name']}\nMax HP: {b['max_health']} | Current HP: {b['current_health']}\n"
-                    f"Active: {'Yes' if b['is_active'] else 'No'}\nFlavor: {b['flavor_text']}\nImage: {b['image_link']}"
-                    for b in bosses
-                ]
-            )
-        embed = discord.Embed(title="All Bosses", description=description, color=discord.Color.red())
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await KeysetPaginationView(get_bosses_page, render_bosses_page).send(interaction)
 
     @discord.ui.button(label="List Bosses", style=discord.ButtonStyle.secondary, custom_id="list_bosses", row=0)
     async def list_bosses(self, interaction: discord.Interaction, button: Button):
@@ -1,31 +1,52 @@
 import discord
 from discord.ui import View, Button, Modal, TextInput
 import json
-from core.database import cursor, db
+from core.database import execute_query, fetch_page
+from views.AdminActions.Pagination import KeysetPaginationView
+
+MISSIONS_PER_PAGE = 5
+
+
+def _mission_from_row(row) -> dict:
+    return {
+        "id": row[0],
+        "name": row[1],
+        "flavor": row[2],
+        "requirements": row[3],
+        "item_rewards": row[4],
+        "mon_rewards": row[5],
+        "mon_rewards_params": row[6],
+        "on_success": row[7],
+        "on_fail": row[8],
+        "difficulty": row[9],
+        "ephemeral": row[10],
+        "max_mons": row[11]
+    }
+
+
+def get_missions_page(after=None, before=None, limit: int = MISSIONS_PER_PAGE):
+    return fetch_page(
+        "missions",
+        "id, name, flavor, requirements, item_rewards, mon_rewards, mon_rewards_params, on_success, on_fail, difficulty, ephemeral, max_mons",
+        "id", after=after, before=before, limit=limit, build=_mission_from_row
+    )
 
 
-def get_all_missions():
-    cursor.execute(
-        "SELECT id, name, flavor, requirements, item_rewards, mon_rewards, mon_rewards_params, on_success, on_fail, difficulty, ephemeral, max_mons FROM missions"
-    )
-    rows = cursor.fetchall()
-    missions = []
-    for row in rows:
-        missions.append({
-            "id": row[0],
-            "name": row[1],
-            "flavor": row[2],
-            "requirements": row[3],
-            "item_rewards": row[4],
-            "mon_rewards": row[5],
-            "mon_rewards_params": row[6],
-            "on_success": row[7],
-            "on_fail": row[8],
-            "difficulty": row[9],
-            "ephemeral": row[10],
-            "max_mons": row[11]
-        })
-    return missions
+def render_missions_page(page, page_number: int) -> discord.Embed:
+    if not page.rows:
+        description = "No missions found."
+    else:
+        description = "\n".join(
+            [
+                f"ID: {m['id']} | Name: {m['name']} | Difficulty: {m['difficulty']} | Max Mons: {m['max_mons']}\n"
+                f"Flavor: {m['flavor']}\nRequirements: {m['requirements']}\n"
+                f"Rewards: {m['item_rewards']}, Mon Rewards: {m['mon_rewards']} ({m['mon_rewards_params']})\n"
+                f"On Success: {m['on_success']}\nOn Fail: {m['on_fail']}\n"
+                f"Ephemeral: {m['ephemeral']}\n"
+                for m in page.rows
+            ]
+        )
+    return discord.Embed(title=f"All Missions (Page {page_number})", description=description, color=discord.Color.purple())
 
 
 # Modal for adding a new mission via JSON input.
@@ -60,8 +81,7 @@ class AddMissionModal(Modal, title="Add Mission"):
                 int(data.get("ephemeral", 0)),
                 int(data.get("max_mons", 0))
             )
-            cursor.execute(query, params)
-            db.commit()
+            execute_query(query, params)
             await interaction.response.send_message(f"Mission '{data.get('name')}' added successfully.", ephemeral=True)
         except json.JSONDecodeError:
             await interaction.response.send_message("Invalid JSON format.", ephemeral=True)
@@ -109,8 +129,7 @@ class EditMissionModal(Modal, title="Edit Mission"):
         values.append(mission_name_val)
         query = "UPDATE missions SET " + ", ".join(fields) + " WHERE name = ?"
         try:
-            cursor.execute(query, tuple(values))
-            db.commit()
+            execute_query(query, tuple(values))
             await interaction.response.send_message(f"Mission '{mission_name_val}' updated successfully.",
                                                     ephemeral=True)
         except Exception as e:
@@ -136,8 +155,7 @@ class DeleteMissionModal(Modal, title="Delete Mission"):
             return
         mission_name_val = self.mission_name.value.strip()
         try:
-            cursor.execute("DELETE FROM missions WHERE name = ?", (mission_name_val,))
-            db.commit()
+            execute_query("DELETE FROM missions WHERE name = ?", (mission_name_val,))
             await interaction.response.send_message(f"Mission '{mission_name_val}' deleted successfully.",
                                                     ephemeral=True)
         except Exception as e:
@@ -150,22 +168,7 @@ class MissionManagementView(View):
         super().__init__(timeout=None)
 
     async def refresh_list(self, interaction: discord.Interaction):
-        missions = get_all_missions()
-        if not missions:
-            description = "No missions found."
-        else:
-            description = "\n".join(
-                [
-                    f"ID: {m['id']} | Name: {m['name']} | Difficulty: {m['difficulty']} | Max Mons: {m['max_mons']}\n"
-                    f"Flavor: {m['flavor']}\nRequirements: {m['requirements']}\n"
-                    f"Rewards: {m['item_rewards']}, Mon Rewards: {m['mon_rewards']} ({m['mon_rewards_params']})\n"
-                    f"On Success: {m['on_success']}\nOn Fail: {m['on_fail']}\n"
-                    f"Ephemeral: {m['ephemeral']}\n"
-                    for m in missions
-                ]
-            )
-        embed = discord.Embed(title="All Missions", description=description, color=discord.Color.purple())
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await KeysetPaginationView(get_missions_page, render_missions_page).send(interaction)
 
     @discord.ui.button(label="List Missions", style=discord.ButtonStyle.secondary, custom_id="list_missions", row=0)
     async def list_missions(self, interaction: discord.Interaction, button: Button):
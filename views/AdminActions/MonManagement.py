@@ -1,7 +1,8 @@
 import discord
 import math
 from discord.ui import View, Button, Modal, TextInput
-from core.database import cursor, db, add_mon_to_db, update_mon_data
+from core.database import fetch_page, add_mon, async_add_mons_bulk, update_mon_data, remove_mon
+from views.AdminActions.Pagination import KeysetPaginationView
 
 # --- Existing Single Mon Modals ---
 
@@ -44,10 +45,10 @@ class AddMonModal(Modal, title="Add New Mon"):
         type4 = types_list[3] if len(types_list) > 3 else ""
         type5 = types_list[4] if len(types_list) > 4 else ""
 
-        add_mon_to_db(
+        add_mon(
             trainer_id=trainer_id_val,
             player=player_id_val,
-            mon_name=mon_name_val,
+            name=mon_name_val,
             level=level_val,
             species1=species1,
             species2=species2,
@@ -121,8 +122,7 @@ class DeleteMonModal(Modal, title="Delete Mon"):
         except ValueError:
             await interaction.response.send_message("Invalid Mon ID.", ephemeral=True)
             return
-        cursor.execute("DELETE FROM mons WHERE id = ?", (mon_id_val,))
-        db.commit()
+        remove_mon(mon_id_val)
         await interaction.response.send_message(f"Mon ID {mon_id_val} deleted.", ephemeral=True)
 
 # --- New: Bulk Add Mons Modal ---
@@ -154,7 +154,7 @@ class BulkAddMonsModal(Modal, title="Bulk Add Mons"):
             await interaction.response.send_message("No data provided.", ephemeral=True)
             return
         lines = bulk_text.splitlines()
-        added = 0
+        rows = []
         errors = []
         for i, line in enumerate(lines, start=1):
             # Expect CSV: mon_name, level, species, types, attribute, img_link
@@ -170,59 +170,67 @@ class BulkAddMonsModal(Modal, title="Bulk Add Mons"):
             # For species and types, split by semicolon.
             species_list = parts[2].split(";") if len(parts) > 2 and parts[2] else []
             species_list = [s.strip() for s in species_list if s.strip()]
-            species1 = species_list[0] if species_list else mon_name_val
-            species2 = species_list[1] if len(species_list) > 1 else ""
-            species3 = species_list[2] if len(species_list) > 2 else ""
             types_list = parts[3].split(";") if len(parts) > 3 and parts[3] else []
             types_list = [t.strip() for t in types_list if t.strip()]
-            type1 = types_list[0] if types_list else "Normal"
-            type2 = types_list[1] if len(types_list) > 1 else ""
-            type3 = types_list[2] if len(types_list) > 2 else ""
-            type4 = types_list[3] if len(types_list) > 3 else ""
-            type5 = types_list[4] if len(types_list) > 4 else ""
-            attribute_val = parts[4] if len(parts) > 4 and parts[4] else "Free"
-            img_link_val = parts[5] if len(parts) > 5 else ""
-            try:
-                add_mon_to_db(
-                    trainer_id=trainer_id_val,
-                    player=player_id_val,
-                    mon_name=mon_name_val,
-                    level=level_val,
-                    species1=species1,
-                    species2=species2,
-                    species3=species3,
-                    type1=type1,
-                    type2=type2,
-                    type3=type3,
-                    type4=type4,
-                    type5=type5,
-                    attribute=attribute_val,
-                    img_link=img_link_val
-                )
-                added += 1
-            except Exception as e:
-                errors.append(f"Line {i}: {e}")
-        response_text = f"Bulk add complete: {added} mons added."
+            rows.append({
+                "name": mon_name_val,
+                "level": level_val,
+                "species1": species_list[0] if species_list else mon_name_val,
+                "species2": species_list[1] if len(species_list) > 1 else "",
+                "species3": species_list[2] if len(species_list) > 2 else "",
+                "types": types_list or ["Normal"],
+                "attribute": parts[4] if len(parts) > 4 and parts[4] else "Free",
+                "img_link": parts[5] if len(parts) > 5 else "",
+            })
         if errors:
-            response_text += "\nErrors:\n" + "\n".join(errors)
-        await interaction.response.send_message(response_text, ephemeral=True)
+            # Nothing is inserted until every line parses.
+            await interaction.response.send_message("Bulk add aborted:\n" + "\n".join(errors), ephemeral=True)
+            return
+        await interaction.response.defer(ephemeral=True)
+        try:
+            mon_ids = await async_add_mons_bulk(trainer_id_val, player_id_val, rows)
+        except Exception as e:
+            await interaction.followup.send(f"Bulk add failed, no mons were added:\n{e}", ephemeral=True)
+            return
+        await interaction.followup.send(f"Bulk add complete: {len(mon_ids)} mons added.", ephemeral=True)
+
+# --- Mon listing pages ---
+
+MON_LIST_SOURCE = "mons m LEFT JOIN trainers t ON m.trainer_id = t.id"
+MON_LIST_COLUMNS = "m.mon_id, t.character_name, m.name, m.level, m.attribute, m.img_link"
+MONS_PER_PAGE = 10
+
+
+def mon_list_view(title: str, where: str = "", params=()) -> KeysetPaginationView:
+    """Builds a Prev/Next pager over the mon listing, optionally filtered."""
+    def fetch(after=None, before=None):
+        return fetch_page(MON_LIST_SOURCE, MON_LIST_COLUMNS, "m.mon_id", where, params,
+                          after=after, before=before, limit=MONS_PER_PAGE)
+
+    def render(page, page_number):
+        if not page.rows:
+            description = "No mons found."
+        else:
+            description = "\n".join(
+                [
+                    f"ID: {row[0]} | Trainer: {row[1] if row[1] else 'N/A'} | Name: {row[2]} | Level: {row[3]} | Attr: {row[4]} | Img: {row[5]}"
+                    for row in page.rows
+                ]
+            )
+        return discord.Embed(title=f"{title} (Page {page_number})", description=description, color=discord.Color.orange())
+
+    return KeysetPaginationView(fetch, render)
+
 
 # --- New: Filtered List Mons Modal with Pagination ---
 
 class FilterMonsModal(Modal, title="Filtered List Mons"):
     trainer_id = TextInput(label="Trainer ID", placeholder="Optional: Enter trainer's numeric ID", required=False)
     player_id = TextInput(label="Player ID", placeholder="Optional: Enter player's Discord ID", required=False)
-    page_number = TextInput(label="Page Number", placeholder="Enter page number (default 1)", required=False)
 
     async def on_submit(self, interaction: discord.Interaction):
         trainer_filter = self.trainer_id.value.strip()
         player_filter = self.player_id.value.strip()
-        try:
-            page = int(self.page_number.value.strip()) if self.page_number.value.strip() else 1
-        except ValueError:
-            page = 1
-        per_page = 10
-        query = "SELECT m.id, t.name, m.mon_name, m.level, m.attribute, m.img_link FROM mons m LEFT JOIN trainers t ON m.trainer_id = t.id"
         filters = []
         params = []
         if trainer_filter:
@@ -233,23 +241,10 @@ class FilterMonsModal(Modal, title="Filtered List Mons"):
                 await interaction.response.send_message("Invalid Trainer ID filter.", ephemeral=True)
                 return
         if player_filter:
-            filters.append("m.player = ?")
+            filters.append("m.player_user_id = ?")
             params.append(player_filter)
-        if filters:
-            query += " WHERE " + " AND ".join(filters)
-        query += " ORDER BY m.id ASC LIMIT ? OFFSET ?"
-        params.extend([per_page, per_page * (page - 1)])
-        cursor.execute(query, tuple(params))
-        rows = cursor.fetchall()
-        if not rows:
-            description = "No mons found for the given filters/page."
-        else:
-            description = "\n".join([
-                f"ID: {row[0]} | Trainer: {row[1] if row[1] else 'N/A'} | Name: {row[2]} | Level: {row[3]} | Attr: {row[4]} | Img: {row[5]}"
-                for row in rows
-            ])
-        embed = discord.Embed(title=f"Mon List (Page {page})", description=description, color=discord.Color.orange())
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        view = mon_list_view("Mon List", " AND ".join(filters), tuple(params))
+        await view.send(interaction)
 
 # --- Main Mon Management Admin View with Pagination & Bulk Add ---
 
@@ -258,21 +253,7 @@ class MonManagementView(View):
         super().__init__(timeout=None)
 
     async def refresh_list(self, interaction: discord.Interaction):
-        # Default: list all mons (page 1)
-        query = "SELECT m.id, t.name, m.mon_name, m.level, m.attribute, m.img_link FROM mons m LEFT JOIN trainers t ON m.trainer_id = t.id ORDER BY m.id ASC LIMIT 10 OFFSET 0"
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        if not rows:
-            description = "No mons found."
-        else:
-            description = "\n".join(
-                [
-                    f"ID: {row[0]} | Trainer: {row[1] if row[1] else 'N/A'} | Name: {row[2]} | Level: {row[3]} | Attr: {row[4]} | Img: {row[5]}"
-                    for row in rows
-                ]
-            )
-        embed = discord.Embed(title="All Mons (Page 1)", description=description, color=discord.Color.orange())
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        await mon_list_view("All Mons").send(interaction)
 
     @discord.ui.button(label="List Mons", style=discord.ButtonStyle.secondary, custom_id="list_mons", row=0)
     async def list_mons(self, interaction: discord.Interaction, button: Button):
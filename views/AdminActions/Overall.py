@@ -92,6 +92,6 @@ class AdminActionsView(View):
 
     @discord.ui.button(label="System Diagnostics", style=discord.ButtonStyle.primary, custom_id="admin_system_diag", row=3)
     async def system_diag(self, interaction: discord.Interaction, button: Button):
-        from views import SystemDiagnosticsView  # Ensure this file exists
+        from views.AdminActions.SystemDiagnostics import SystemDiagnosticsView
         view = SystemDiagnosticsView()
         await interaction.response.send_message("System Diagnostics Admin Actions:", view=view, ephemeral=True)
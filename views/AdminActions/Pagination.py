@@ -0,0 +1,48 @@
+import discord
+from discord.ui import View, Button
+from core.database import run_db
+
+
+# Prev/Next pager shared by the admin listings.
+class KeysetPaginationView(View):
+    """
+    Pages through a keyset listing (see core.database.fetch_page). Only the current
+    page's boundary keys are kept in the view, so every step is one indexed seek.
+
+    fetch(after=None, before=None) -> Page runs on the DB executor;
+    render(page, page_number) -> discord.Embed builds the message.
+    """
+
+    def __init__(self, fetch, render, timeout: float = 300):
+        super().__init__(timeout=timeout)
+        self.fetch = fetch
+        self.render = render
+        self.page = None
+        self.page_number = 1
+
+    async def load(self, after=None, before=None) -> discord.Embed:
+        self.page = await run_db(self.fetch, after=after, before=before)
+        if not self.page.has_prev:
+            self.page_number = 1
+        self.prev_button.disabled = not self.page.has_prev
+        self.next_button.disabled = not self.page.has_next
+        return self.render(self.page, self.page_number)
+
+    async def send(self, interaction: discord.Interaction):
+        embed = await self.load()
+        if interaction.response.is_done():
+            await interaction.followup.send(embed=embed, view=self, ephemeral=True)
+        else:
+            await interaction.response.send_message(embed=embed, view=self, ephemeral=True)
+
+    @discord.ui.button(label="Prev", style=discord.ButtonStyle.secondary, row=0)
+    async def prev_button(self, interaction: discord.Interaction, button: Button):
+        self.page_number = max(1, self.page_number - 1)
+        embed = await self.load(before=self.page.first_key)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, row=0)
+    async def next_button(self, interaction: discord.Interaction, button: Button):
+        self.page_number += 1
+        embed = await self.load(after=self.page.last_key)
+        await interaction.response.edit_message(embed=embed, view=self)
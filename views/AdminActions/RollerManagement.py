@@ -1,6 +1,8 @@
 import discord
 from discord.ui import View, Button, Modal, TextInput
 import random
+from core.database import run_db, backfill_mon_origins
+from core.species_catalog import catalog
 
 # Modal to test the item rolling function.
 class TestItemRollModal(Modal, title="Test Item Roll"):
@@ -59,6 +61,11 @@ class TestMonRollModal(Modal, title="Test Mon Roll"):
         placeholder="Enter claim limit (default 1)",
         required=False
     )
+    seed = TextInput(
+        label="Seed",
+        placeholder="Optional: same seed and variant give the same roll",
+        required=False
+    )
 
     async def on_submit(self, interaction: discord.Interaction):
         variant_val = self.variant.value.strip().lower()
@@ -70,11 +77,13 @@ class TestMonRollModal(Modal, title="Test Mon Roll"):
             claim_limit_val = int(self.claim_limit.value.strip()) if self.claim_limit.value.strip() else 1
         except ValueError:
             claim_limit_val = 1
+        seed_val = self.seed.value.strip()
+        rng = random.Random(seed_val) if seed_val else None
 
         # Import and call the roll_mons function from your rollmons module.
         from core.rollmons import roll_mons
         # roll_mons sends its own embed with a claim view.
-        await roll_mons(interaction, variant=variant_val, amount=amount_val, claim_limit=claim_limit_val)
+        await roll_mons(interaction, variant=variant_val, amount=amount_val, claim_limit=claim_limit_val, rng=rng)
 
 
 class TestTaskCompletionModal(Modal, title="Test Task Completion Reward"):
@@ -182,4 +191,23 @@ class RollersTestingView(View):
                        custom_id="test_garden_completion", row=1)
     async def test_garden_completion(self, interaction: discord.Interaction, button: Button):
         modal = TestGardenModal()
-        await interaction.response.send_modal(modal)
\ No newline at end of file
+        await interaction.response.send_modal(modal)
+
+    @discord.ui.button(label="Reload Species Catalog", style=discord.ButtonStyle.danger,
+                       custom_id="reload_species_catalog", row=1)
+    async def reload_species_catalog(self, interaction: discord.Interaction, button: Button):
+        # Re-read the Pokemon/Digimon/YoKai tables after a species data import.
+        await interaction.response.defer(ephemeral=True)
+        try:
+            counts = await run_db(catalog.reload)
+            # Species may have moved between tables, so every stored origin is re-checked.
+            updated = await run_db(backfill_mon_origins, recompute=True)
+        except Exception as e:
+            await interaction.followup.send(f"Error reloading species catalog: {e}", ephemeral=True)
+            return
+        summary = ", ".join(f"{origin.title()}: {count}" for origin, count in counts.items())
+        if catalog.complete:
+            summary += f". Updated the origin of {updated} mons."
+        else:
+            summary += ". Some species tables failed to load; mon origins were left unchanged."
+        await interaction.followup.send(f"Species catalog reloaded (v{catalog.version}). {summary}", ephemeral=True)
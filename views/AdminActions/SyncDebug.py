@@ -1,6 +1,7 @@
 import discord
 from discord.ui import View, Button, Modal, TextInput
-from core.database import cursor, db
+from core.database import fetch_one, aiter_rows, run_db
+from core.sheet_sync import sheet_sync
 from core.google_sheets import (
     sync_sheets,
     get_mon_sheet_row,
@@ -40,9 +41,8 @@ class SyncSpecificSheetModal(Modal, title="Selective Sync"):
 
         if not mon_name_val:
             # Sync the entire trainer's sheet.
-            cursor.execute("SELECT id, user_id, name, level, img_link FROM trainers WHERE name = ?",
+            trainer_row = fetch_one("SELECT id, user_id, name, level, img_link FROM trainers WHERE name = ?",
                            (trainer_name_val,))
-            trainer_row = cursor.fetchone()
             if not trainer_row:
                 await interaction.response.send_message(f"No trainer found with name '{trainer_name_val}'.",
                                                         ephemeral=True)
@@ -51,12 +51,11 @@ class SyncSpecificSheetModal(Modal, title="Selective Sync"):
             trainer_data = {"B3": name, "B8": str(trainer_id), "B52": img_link}
             success_trainer = await update_trainer_sheet_data(trainer_name_val, trainer_data)
 
-            cursor.execute(
+            mon_rows = aiter_rows(
                 "SELECT mon_name, level, species1, species2, species3, type1, type2, type3, type4, type5, attribute, img_link FROM mons WHERE trainer_id = ?",
                 (trainer_id,))
-            mon_rows = cursor.fetchall()
             errors = []
-            for mon in mon_rows:
+            async for mon in mon_rows:
                 mon_name_db, mon_level, species1, species2, species3, type1, type2, type3, type4, type5, attribute, mon_img_link = mon
                 update_dict = {
                     2: mon_name_db,
@@ -83,20 +82,18 @@ class SyncSpecificSheetModal(Modal, title="Selective Sync"):
                                                         ephemeral=True)
         else:
             # Sync only a single mon.
-            cursor.execute(
+            mon_data = fetch_one(
                 "SELECT t.name, m.mon_name FROM mons m JOIN trainers t ON m.trainer_id = t.id WHERE t.name = ? AND m.mon_name = ?",
                 (trainer_name_val, mon_name_val))
-            mon_data = cursor.fetchone()
             if not mon_data:
                 await interaction.response.send_message(
                     f"Mon '{mon_name_val}' not found for trainer '{trainer_name_val}'.", ephemeral=True)
                 return
             trainer_name_db, mon_name_db = mon_data
             update_dict = {}
-            cursor.execute(
+            row = fetch_one(
                 "SELECT level, species1, species2, species3, type1, type2, type3, type4, type5, attribute, img_link FROM mons WHERE mon_name = ? AND trainer_id = (SELECT id FROM trainers WHERE name = ?)",
                 (mon_name_val, trainer_name_val))
-            row = cursor.fetchone()
             if row:
                 (mon_level, species1, species2, species3, type1, type2, type3, type4, type5, attribute,
                  mon_img_link) = row
@@ -145,3 +142,25 @@ class SheetsSyncDebugView(View):
     @discord.ui.button(label="Selective Sync", style=discord.ButtonStyle.primary, custom_id="selective_sync", row=1)
     async def selective_sync(self, interaction: discord.Interaction, button: Button):
         await interaction.response.send_modal(SyncSpecificSheetModal())
+
+    @discord.ui.button(label="Outbox Status", style=discord.ButtonStyle.secondary, custom_id="sync_outbox_status",
+                       row=1)
+    async def outbox_status(self, interaction: discord.Interaction, button: Button):
+        outbox = await run_db(sheet_sync.outbox_stats)
+        stats = sheet_sync.stats()
+        description = (
+            f"**Pending rows:** {outbox['depth']}\n"
+            f"**Oldest pending:** {outbox['lag_seconds']:.0f} s\n"
+            f"**Dead letters:** {outbox['dead']}\n"
+            f"**Queued / in flight:** {stats['queued']} / {stats['in_flight']}\n"
+            f"**Written:** {stats['writes']} | **Failed:** {stats['failures']} | "
+            f"**Coalesced:** {stats['coalesced']} | **Batches:** {stats['batches']}"
+        )
+        embed = discord.Embed(title="Sheet Update Outbox", description=description, color=discord.Color.blue())
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @discord.ui.button(label="Retry Dead Letters", style=discord.ButtonStyle.danger, custom_id="sync_retry_dead",
+                       row=1)
+    async def retry_dead_letters(self, interaction: discord.Interaction, button: Button):
+        count = await run_db(sheet_sync.retry_dead)
+        await interaction.response.send_message(f"Requeued {count} dead-lettered update(s).", ephemeral=True)
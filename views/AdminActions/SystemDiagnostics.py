@@ -0,0 +1,114 @@
+import discord
+from discord.ui import View, Button, Modal, TextInput
+from core.database import pool
+from core.query_profiler import profiler
+from core.identity_cache import trainer_ids, mon_ids
+from core.scheduler import scheduler
+
+EMBED_DESCRIPTION_LIMIT = 4000
+
+
+def _truncate(text: str, limit: int = EMBED_DESCRIPTION_LIMIT) -> str:
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+# Modal to change the slow-query threshold.
+class SlowQueryThresholdModal(Modal, title="Slow Query Threshold"):
+    threshold = TextInput(label="Threshold (ms)", placeholder="e.g. 250", required=True)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        try:
+            threshold_val = float(self.threshold.value.strip())
+        except ValueError:
+            await interaction.response.send_message("Invalid threshold.", ephemeral=True)
+            return
+        profiler.slow_threshold_ms = threshold_val
+        await interaction.response.send_message(f"Slow query threshold set to {threshold_val:.0f} ms.", ephemeral=True)
+
+
+# Main System Diagnostics admin view.
+class SystemDiagnosticsView(View):
+    def __init__(self):
+        super().__init__(timeout=None)
+
+    @discord.ui.button(label="Query Stats", style=discord.ButtonStyle.primary, custom_id="diag_query_stats", row=0)
+    async def query_stats(self, interaction: discord.Interaction, button: Button):
+        entries = profiler.summary(limit=10)
+        if not entries:
+            description = "No queries recorded yet."
+        else:
+            description = "\n\n".join(
+                [
+                    f"`{e['query'][:180]}`\n"
+                    f"Count: {e['count']} | Total: {e['total_ms']:.0f} ms | p50: {e['p50_ms']:.1f} | "
+                    f"p95: {e['p95_ms']:.1f} | p99: {e['p99_ms']:.1f} | Max: {e['max_ms']:.1f} ms\n"
+                    f"Avg pool wait: {e['avg_wait_ms']:.2f} ms | Avg rows: {e['avg_rows']:.1f}"
+                    for e in entries
+                ]
+            )
+        embed = discord.Embed(title="Top Queries by Total Time", description=_truncate(description),
+                              color=discord.Color.dark_teal())
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @discord.ui.button(label="Slow Queries", style=discord.ButtonStyle.primary, custom_id="diag_slow_queries", row=0)
+    async def slow_queries(self, interaction: discord.Interaction, button: Button):
+        entries = profiler.slow_queries()[:10]
+        if not entries:
+            description = f"No queries slower than {profiler.slow_threshold_ms:.0f} ms."
+        else:
+            description = "\n\n".join(
+                [
+                    f"`{e['query'][:180]}`\n"
+                    f"{e['elapsed_ms']:.1f} ms (wait {e['wait_ms']:.1f} ms, {e['rows']} rows)\n"
+                    f"Plan: {'; '.join(e['plan']) or 'n/a'}"
+                    for e in entries
+                ]
+            )
+        embed = discord.Embed(title=f"Slow Queries (>= {profiler.slow_threshold_ms:.0f} ms)",
+                              description=_truncate(description), color=discord.Color.orange())
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @discord.ui.button(label="Pool Stats", style=discord.ButtonStyle.secondary, custom_id="diag_pool_stats", row=0)
+    async def pool_stats(self, interaction: discord.Interaction, button: Button):
+        stats = pool.stats()
+        description = "\n".join(
+            [
+                f"**{role.title()}** — {s['available']}/{s['size']} free | Checkouts: {s['checkouts']} | "
+                f"Timeouts: {s['timeouts']} | Avg wait: {s['avg_wait_ms']:.2f} ms | Max wait: {s['max_wait_ms']:.1f} ms"
+                for role, s in stats.items()
+            ]
+        )
+        embed = discord.Embed(title="Connection Pool", description=description, color=discord.Color.dark_teal())
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @discord.ui.button(label="Cache Stats", style=discord.ButtonStyle.secondary, custom_id="diag_cache_stats", row=0)
+    async def cache_stats(self, interaction: discord.Interaction, button: Button):
+        description = "\n".join(
+            [
+                f"**{cache.name.title()} IDs** — {s['size']}/{s['maxsize']} cached | Hits: {s['hits']} | "
+                f"Misses: {s['misses']} | Hit rate: {s['hit_rate']:.0%} | Evictions: {s['evictions']}"
+                for cache, s in ((c, c.stats()) for c in (trainer_ids, mon_ids))
+            ]
+        )
+        embed = discord.Embed(title="Identity Cache", description=description, color=discord.Color.dark_teal())
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @discord.ui.button(label="Pending Timers", style=discord.ButtonStyle.secondary, custom_id="diag_pending_timers", row=1)
+    async def pending_timers(self, interaction: discord.Interaction, button: Button):
+        stats = scheduler.stats()
+        lines = [
+            f"Pending: {stats['pending']} | Heap: {stats['heap_size']} | Fired: {stats['fired']} | "
+            f"Rescheduled: {stats['rescheduled']} | Cancelled: {stats['cancelled']}"
+        ]
+        lines += [f"`{key!r}` — {remaining:.0f}s" for key, remaining in scheduler.pending(limit=20)]
+        embed = discord.Embed(title="Scheduler", description=_truncate("\n".join(lines)), color=discord.Color.dark_teal())
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @discord.ui.button(label="Set Slow Threshold", style=discord.ButtonStyle.secondary, custom_id="diag_slow_threshold", row=1)
+    async def set_slow_threshold(self, interaction: discord.Interaction, button: Button):
+        await interaction.response.send_modal(SlowQueryThresholdModal())
+
+    @discord.ui.button(label="Reset Stats", style=discord.ButtonStyle.danger, custom_id="diag_reset_stats", row=1)
+    async def reset_stats(self, interaction: discord.Interaction, button: Button):
+        profiler.reset()
+        await interaction.response.send_message("Query statistics cleared.", ephemeral=True)
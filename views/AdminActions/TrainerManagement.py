@@ -1,17 +1,31 @@
 import discord
 from discord.ui import View, Button, Modal, TextInput
-from core.database import cursor, db, add_trainer_to_db, update_trainer_data
-
-# Helper: Get all trainers from the database.
-def get_all_trainers():
-    cursor.execute("SELECT id, user_id, name, level, img_link FROM trainers")
-    rows = cursor.fetchall()
-    return [
-        {"id": row[0], "user_id": row[1], "name": row[2], "level": row[3], "img_link": row[4]}
-        for row in rows
-    ]
-
-# Modal to add a new trainer.
+from core.database import execute_query, fetch_trainer_page, add_trainer_to_db, update_trainer_data
+from core.database import invalidate_trainer_identity
+from views.AdminActions.Pagination import KeysetPaginationView
+
+TRAINERS_PER_PAGE = 15
+
+
+# Helper: Get one page of trainers from the database.
+def get_trainers_page(after=None, before=None, limit: int = TRAINERS_PER_PAGE):
+    return fetch_trainer_page(columns=("id", "user_id", "character_name", "level", "img_link"),
+                              after=after, before=before, limit=limit)
+
+
+def render_trainers_page(page, page_number: int) -> discord.Embed:
+    if not page.rows:
+        description = "No trainers found."
+    else:
+        description = "\n".join(
+            [
+                f"ID: {t['id']} | User: {t['user_id']} | Name: {t['name']} | Level: {t['level']} | Img: {t['img_link']}"
+                for t in page.rows
+            ]
+        )
+    return discord.Embed(title=f"All Trainers (Page {page_number})", description=description, color=discord.Color.green())
+
+
 class AddTrainerModal(Modal, title="Add Trainer"):
     user_id = TextInput(label="User ID", placeholder="Enter the user's ID", required=True)
     trainer_name = TextInput(label="Trainer Name", placeholder="Enter the trainer's name", required=True)
@@ -76,8 +90,8 @@ class DeleteTrainerModal(Modal, title="Delete Trainer"):
             await interaction.response.send_message("Invalid trainer ID.", ephemeral=True)
             return
         # Delete trainer by ID (admin override).
-        cursor.execute("DELETE FROM trainers WHERE id = ?", (t_id,))
-        db.commit()
+        execute_query("DELETE FROM trainers WHERE id = ?", (t_id,))
+        invalidate_trainer_identity(t_id)
         await interaction.response.send_message(f"Trainer ID {t_id} deleted.", ephemeral=True)
 
 # Main Trainer Management admin view.
@@ -87,18 +101,7 @@ class TrainerManagementView(View):
 
     # Helper to refresh and display the list of trainers.
     async def refresh_list(self, interaction: discord.Interaction):
-        trainers = get_all_trainers()
-        if not trainers:
-            description = "No trainers found."
-        else:
-            description = "\n".join(
-                [
-                    f"ID: {t['id']} | User: {t['user_id']} | Name: {t['name']} | Level: {t['level']} | Img: {t['img_link']}"
-                    for t in trainers
-                ]
-            )
-        embed = discord.Embed(title="All Trainers", description=description, color=discord.Color.green())
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await KeysetPaginationView(get_trainers_page, render_trainers_page).send(interaction)
 
     @discord.ui.button(label="List Trainers", style=discord.ButtonStyle.secondary, custom_id="list_trainers", row=0)
     async def list_trainers(self, interaction: discord.Interaction, button: Button):
@@ -1,6 +1,7 @@
 import discord
 from discord.ui import View, Button
 from logic.boss import get_active_boss, claim_boss_rewards
+from core.database import run_db
 
 TAUNT_MESSAGES = [
     "Is that all you've got?",
@@ -15,11 +16,11 @@ class BossUIView(View):
         super().__init__(timeout=None)  # Persistent view
         self.user_id = user_id
         # Preload the boss embed immediately
-        self.current_embed = self.get_embed()
-        self.refresh_view()
-
-    def get_embed(self) -> discord.Embed:
         boss = get_active_boss()
+        self.current_embed = self.get_embed(boss)
+        self.refresh_view(boss)
+
+    def get_embed(self, boss: dict = None) -> discord.Embed:
         if boss:
             embed = discord.Embed(
                 title=f"Boss Battle: {boss['name']}",
@@ -38,19 +39,20 @@ class BossUIView(View):
             )
         return embed
 
-    def refresh_view(self):
+    def refresh_view(self, boss: dict = None):
         # Clear any existing buttons and then add the Refresh button.
         self.clear_items()
         self.add_item(RefreshButton())
         # Add Claim Rewards button if there is no active boss or if the boss is defeated.
-        boss = get_active_boss()
         if boss is None or boss["current_health"] <= 0:
             self.add_item(ClaimRewardsButton())
 
     async def refresh(self, interaction: discord.Interaction):
         # Refresh the embed and the view, then update the message.
-        self.current_embed = self.get_embed()
-        self.refresh_view()
+        # The boss row is loaded once off the event loop and shared by both.
+        boss = await run_db(get_active_boss)
+        self.current_embed = self.get_embed(boss)
+        self.refresh_view(boss)
         await interaction.response.edit_message(embed=self.current_embed, view=self)
 
 class RefreshButton(Button):
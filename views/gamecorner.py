@@ -1,8 +1,11 @@
 import discord
+import logging
 import random
-import asyncio
+import time
 from discord.ext import commands
+from core.database import run_db, start_gamecorner_session, complete_gamecorner_session, fetch_running_gamecorner_sessions
 from core.items import process_reward  # Generalized reward logic
+from core.scheduler import scheduler
 
 # Define available durations (in minutes) and associated start messages.
 AVAILABLE_DURATIONS: dict[str, int] = {
@@ -76,15 +79,63 @@ class GameCornerDurationView(discord.ui.View):
         start_msgs = POMODORO_START_MESSAGES.get(duration_key, ["Focus time has started!"])
         start_msg = random.choice(start_msgs)
         await interaction.followup.send(f"Starting your {duration_key}-minute work session.\n{start_msg}", ephemeral=True)
-        asyncio.create_task(self.run_session(interaction, int(duration_key)))
+        # Persist the session so a restart before the deadline doesn't lose the reward prompt.
+        session = await run_db(start_gamecorner_session, str(interaction.user.id),
+                               interaction.channel_id, int(duration_key))
+        schedule_gamecorner_session(interaction.client, session)
 
-    async def run_session(self, interaction: discord.Interaction, duration_minutes: int) -> None:
-        """
-        Waits for the selected session duration (in minutes), then shows the feedback view.
-        """
-        await asyncio.sleep(duration_minutes * 60)
-        feedback_view = GameCornerFeedbackView(interaction.user, duration_minutes)
-        await interaction.followup.send("Your work session is over! How much of the time did you work?", view=feedback_view, ephemeral=True)
+
+def schedule_gamecorner_session(client: discord.Client, session: dict) -> None:
+    """Arms the completion timer for a stored session; overdue sessions fire right away."""
+    delay = max(session["deadline"] - time.time(), 0)
+    scheduler.schedule(("gamecorner", session["id"]), delay, finish_gamecorner_session, client, session)
+
+
+async def finish_gamecorner_session(client: discord.Client, session: dict) -> None:
+    """
+    Runs when a session's duration is up; posts the feedback view in the channel the
+    session was started from, or by DM if that channel is gone or the post fails.
+    The interaction that started the session has long expired by now, so it cannot
+    be used to reply.
+    """
+    # Claim the session before prompting: a session that fires twice (e.g. across a
+    # restart) prompts at most once, at the cost of no retry if delivery fails.
+    if not await run_db(complete_gamecorner_session, session["id"]):
+        return
+    user_id = int(session["user_id"])
+    try:
+        user = client.get_user(user_id) or await client.fetch_user(user_id)
+    except discord.HTTPException as e:
+        logging.error(f"Dropping game corner session {session['id']}: user {user_id} not found ({e})")
+        return
+    duration_minutes = session["duration_minutes"]
+    feedback_view = GameCornerFeedbackView(user, duration_minutes)
+    content = f"{user.mention} Your {duration_minutes}-minute work session is over! How much of the time did you work?"
+    channel = client.get_channel(session["channel_id"]) if session["channel_id"] else None
+    if channel is not None:
+        try:
+            await channel.send(content, view=feedback_view)
+            return
+        except discord.HTTPException as e:
+            logging.warning(f"Could not post game corner session {session['id']} in channel "
+                            f"{session['channel_id']}; trying DM: {e}")
+    try:
+        await user.send(content, view=feedback_view)
+    except discord.HTTPException as e:
+        logging.error(f"Could not deliver game corner session {session['id']} to user {user_id}: {e}")
+
+
+async def restore_gamecorner_sessions(client: discord.Client) -> int:
+    """
+    Re-arms every running session after a restart, including ones whose deadline
+    passed while the bot was down. Returns the number of sessions scheduled.
+    """
+    sessions = await run_db(fetch_running_gamecorner_sessions)
+    for session in sessions:
+        schedule_gamecorner_session(client, session)
+    if sessions:
+        logging.info(f"Restored {len(sessions)} game corner session(s).")
+    return len(sessions)
 
 class GameCornerFeedbackView(discord.ui.View):
     """